@@ -19,6 +19,8 @@ from typing import Any, Callable, Optional, Type
 
 from pydantic import BaseModel
 
+from cle.telemetry import get_metrics
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +34,7 @@ class AgentResult:
     execution_time_ms: float = 0.0
     model_used: str = ""
     tokens_used: int = 0
+    cost_usd: float = 0.0
     errors: list[str] = field(default_factory=list)
 
     @property
@@ -93,6 +96,8 @@ class CLEAgent:
         self._active = False
         self._execution_count = 0
         self._total_time_ms = 0.0
+        self._total_tokens = 0
+        self._total_cost_usd = 0.0
 
     def activate(self) -> None:
         """Activate agent for execution."""
@@ -120,7 +125,7 @@ class CLEAgent:
         Execute agent's primary function.
 
         This is the main entry point. Override in subclasses for custom behavior,
-        or the default implementation will use litellm with tools.
+        or the default implementation will call the agent's model.
 
         Args:
             context: Execution context including task, mode, and global rules
@@ -128,6 +133,8 @@ class CLEAgent:
         Returns:
             AgentResult with typed output
         """
+        from cle.agents.model_client import track_usage
+
         start = time.perf_counter()
 
         try:
@@ -149,12 +156,16 @@ class CLEAgent:
                     errors=[f"Agent {self.name} not allowed in {mode} mode"],
                 )
 
-            # Execute (subclasses override this)
-            output = await self._execute_impl(context)
+            # Execute (subclasses override this); every model call inside is accounted
+            with track_usage() as usage:
+                output = await self._execute_impl(context)
 
             duration = (time.perf_counter() - start) * 1000
             self._execution_count += 1
             self._total_time_ms += duration
+            self._total_tokens += usage.total_tokens
+            self._total_cost_usd += usage.cost_usd
+            get_metrics().observe("cle_agent_execution_ms", duration, agent=self.name)
 
             return AgentResult(
                 success=True,
@@ -162,10 +173,13 @@ class CLEAgent:
                 agent_name=self.name,
                 model_used=self.model,
                 execution_time_ms=round(duration, 2),
+                tokens_used=usage.total_tokens,
+                cost_usd=round(usage.cost_usd, 6),
             )
 
         except Exception as e:
             duration = (time.perf_counter() - start) * 1000
+            get_metrics().observe("cle_agent_execution_ms", duration, agent=self.name)
             logger.error(f"Agent {self.name} execution failed: {e}")
             return AgentResult(
                 success=False,
@@ -179,14 +193,23 @@ class CLEAgent:
         """
         Internal execution implementation.
 
-        Default: calls litellm with instruction + tools.
+        Default: calls the agent's model through the shared model client,
+        with the instruction as the system prompt.
         Override in subclasses for custom behavior.
         """
-        # Default implementation will be wired to litellm in Phase 2
+        from cle.agents.model_client import get_model_client
+
+        task = context.get("task", "")
+        response = await get_model_client().complete(
+            self.model,
+            task,
+            system=self.instruction,
+        )
         return {
             "agent": self.name,
             "status": "executed",
-            "task": context.get("task", ""),
+            "task": task,
+            "response": response.text,
         }
 
     def get_capabilities(self) -> dict[str, Any]:
@@ -202,6 +225,8 @@ class CLEAgent:
             "active": self._active,
             "executions": self._execution_count,
             "total_time_ms": round(self._total_time_ms, 2),
+            "total_tokens": self._total_tokens,
+            "total_cost_usd": round(self._total_cost_usd, 6),
         }
 
     def __repr__(self) -> str:
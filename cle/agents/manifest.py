@@ -0,0 +1,92 @@
+"""
+Creative Liberation Engine v5 — Agent Manifest
+
+Declarative index of every engine agent: name, hive, role, modes, and where
+its definition lives. The registry indexes this at boot WITHOUT importing any
+agent module; each agent (and its tool modules — httpx, git, npm…) is only
+imported the first time it is used.
+
+Keep entries in sync with the CLEAgent definitions they point at; the registry
+logs a warning when a materialized agent disagrees with its manifest entry.
+"""
+
+import importlib
+from dataclasses import dataclass
+from typing import Any
+
+from cle.agents.base import CLEAgent
+
+ALL_MODES: tuple[str, ...] = ("ideate", "plan", "ship", "validate")
+
+
+@dataclass(frozen=True)
+class AgentManifestEntry:
+    """Metadata for one agent, plus the import path of its definition."""
+    name: str
+    hive: str
+    role: str
+    import_path: str  # "package.module:attribute"
+    active_modes: tuple[str, ...] = ALL_MODES
+    model: str = "gemini-2.5-flash"
+    access_tier: str = "studio"
+
+    @property
+    def module(self) -> str:
+        return self.import_path.partition(":")[0]
+
+    @property
+    def attribute(self) -> str:
+        return self.import_path.partition(":")[2]
+
+    def can_execute_in_mode(self, mode: str) -> bool:
+        """Check if the agent is allowed to execute in a given mode."""
+        return mode in self.active_modes
+
+    def load(self) -> CLEAgent:
+        """Import the agent's module and return its CLEAgent instance."""
+        module = importlib.import_module(self.module)
+        return getattr(module, self.attribute)
+
+    def get_capabilities(self) -> dict[str, Any]:
+        """Registry/status metadata for an agent that hasn't been loaded yet."""
+        return {
+            "name": self.name,
+            "model": self.model,
+            "hive": self.hive,
+            "role": self.role,
+            "tools": [],
+            "active_modes": list(self.active_modes),
+            "access_tier": self.access_tier,
+            "active": False,
+            "loaded": False,
+            "executions": 0,
+            "total_time_ms": 0.0,
+        }
+
+
+AGENT_MANIFEST: list[AgentManifestEntry] = [
+    # kuid Hive
+    AgentManifestEntry("kbuildd", "kuid", "builder", "cle.agents.hives.aurora.bolt:kbuildd", ("ship", "validate")),
+    AgentManifestEntry("COMET", "kuid", "browser", "cle.agents.hives.aurora.comet:comet", ("ship", "validate")),
+    AgentManifestEntry("kuid", "kuid", "architect", "cle.agents.hives.aurora.aurora_agent:kuid"),
+    # kstated Hive
+    AgentManifestEntry("kstated", "kstated", "organizer", "cle.agents.hives.keeper.keeper:kstated", ("ship", "validate")),
+    AgentManifestEntry("ARCH", "kstated", "pattern_analyst", "cle.agents.hives.keeper.arch:arch", ("plan", "validate")),
+    AgentManifestEntry("CODEX", "kstated", "documentarian", "cle.agents.hives.keeper.codex:codex", ("ship", "validate")),
+    AgentManifestEntry("klogd", "kstated", "session_documentarian", "cle.agents.hives.keeper.scribe:klogd"),
+    AgentManifestEntry("ECHO", "kstated", "artist_intelligence", "cle.agents.hives.broadcast.echo:echo", ("ideate", "plan", "validate")),
+    # kdocsd Hive
+    AgentManifestEntry("kdocsd", "kdocsd", "compliance_officer", "cle.agents.hives.lex.lex_agent:kdocsd"),
+    AgentManifestEntry("COMPASS", "kdocsd", "constitutional_guard", "cle.agents.hives.lex.compass:compass", ("ideate", "plan", "validate")),
+    # Switchboard Hive
+    AgentManifestEntry("RELAY", "SWITCHBOARD", "task_router", "cle.agents.hives.switchboard.relay:relay"),
+    AgentManifestEntry("COSMOS", "SWITCHBOARD", "system_orchestrator", "cle.agents.hives.keeper.cosmos:cosmos"),
+    AgentManifestEntry("krecd", "SWITCHBOARD", "repository_auditor", "cle.agents.hives.broadcast.ram_crew:krecd", ("validate",)),
+    # Broadcast Hive
+    AgentManifestEntry("SIGNAL", "BROADCAST", "integrator", "cle.agents.hives.broadcast.signal_agent:signal", ("ship", "validate")),
+    AgentManifestEntry("PRODUCER", "BROADCAST", "coordinator", "cle.agents.hives.broadcast.broadcast_crew:broadcast_crew", ("plan", "ship", "validate")),
+    AgentManifestEntry("ATLAS", "BROADCAST", "production_director", "cle.agents.hives.broadcast.atlas:atlas", ("plan", "ship")),
+    # TTY Hive
+    AgentManifestEntry("vt100", "TTY", "strategist", "cle.agents.hives.vt100.tty_trinity:tty_trinity", ("ideate", "plan", "validate")),
+    AgentManifestEntry("LEONARDO", "TTY", "historian", "cle.agents.hives.vt100.oracle_council:oracle_council", ("ideate", "plan", "validate")),
+]
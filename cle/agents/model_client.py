@@ -0,0 +1,711 @@
+"""
+Creative Liberation Engine v5 — Model Client
+
+The shared async LLM client used by every CLEAgent.
+
+One pooled HTTP client per provider (keep-alive, bounded connections),
+per-call timeouts, retries with jittered exponential backoff, token
+streaming, and token/cost accounting that flows back into AgentResult.
+
+Providers:
+  - Google (Gemini)   — generateContent / streamGenerateContent
+  - Anthropic (Claude) — Messages API
+  - OpenAI            — Chat Completions
+  - Stub              — offline, deterministic, no network
+
+Lineage: v5 CLEAgent._execute_impl stub ("to be wired to litellm") → v5 model client
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Iterator, Optional
+
+from cle.config.models import ModelConfig, ModelProvider, get_model
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# Types
+# ============================================================
+
+@dataclass
+class TokenUsage:
+    """Token and cost accounting for one or more model calls."""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+    calls: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, other: "TokenUsage") -> None:
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.cost_usd += other.cost_usd
+        self.calls += other.calls
+
+
+@dataclass
+class ModelResponse:
+    """A completed model call."""
+    text: str
+    model: str
+    provider: str
+    usage: TokenUsage = field(default_factory=TokenUsage)
+    finish_reason: str = ""
+    latency_ms: float = 0.0
+
+
+@dataclass
+class StreamEvent:
+    """One event from a streaming call: a text delta and/or usage totals."""
+    delta: str = ""
+    usage: Optional[TokenUsage] = None
+    finish_reason: str = ""
+
+
+class ModelClientError(Exception):
+    """Raised when a model call fails. `retryable` marks transient failures."""
+
+    def __init__(self, message: str, retryable: bool = False, status_code: int = 0):
+        super().__init__(message)
+        self.retryable = retryable
+        self.status_code = status_code
+
+
+# Usage accumulator for the current agent execution (see track_usage)
+_usage_scope: ContextVar[Optional[TokenUsage]] = ContextVar("cle_usage_scope", default=None)
+
+
+@contextmanager
+def track_usage() -> Iterator[TokenUsage]:
+    """
+    Accumulate usage of every model call made inside this block.
+
+    Usage:
+        with track_usage() as usage:
+            output = await agent._execute_impl(context)
+        result.tokens_used = usage.total_tokens
+    """
+    usage = TokenUsage()
+    token = _usage_scope.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage_scope.reset(token)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 chars/token) for providers that don't report usage."""
+    return max(1, len(text) // 4) if text else 0
+
+
+def calculate_cost(model_config: Optional[ModelConfig], prompt_tokens: int, completion_tokens: int) -> float:
+    """Cost in USD from the model registry's per-1M-token prices."""
+    if model_config is None:
+        return 0.0
+    return (
+        prompt_tokens * model_config.cost_per_1m_input
+        + completion_tokens * model_config.cost_per_1m_output
+    ) / 1_000_000
+
+
+# ============================================================
+# Providers
+# ============================================================
+
+class ProviderClient:
+    """Interface that all model providers must implement."""
+
+    provider: ModelProvider
+
+    async def complete(
+        self,
+        model: str,
+        messages: list[dict[str, str]],
+        system: str = "",
+        max_tokens: int = 1024,
+        temperature: float = 0.2,
+    ) -> ModelResponse:
+        """Run a single, non-streaming completion."""
+        raise NotImplementedError
+
+    def stream(
+        self,
+        model: str,
+        messages: list[dict[str, str]],
+        system: str = "",
+        max_tokens: int = 1024,
+        temperature: float = 0.2,
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream a completion as text deltas, ending with a usage event."""
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """Release pooled connections."""
+        return None
+
+
+class StubProvider(ProviderClient):
+    """
+    Offline provider. Deterministic, instant, no network.
+
+    Opt-in only (offline_fallback=True, or CLE_LLM_OFFLINE=true): used for
+    demos and tests. Without it, a model with no configured provider is an error.
+    """
+
+    provider = ModelProvider.STUB
+
+    def _reply(self, model: str, messages: list[dict[str, str]]) -> str:
+        last = messages[-1]["content"] if messages else ""
+        return f"[{model} offline] {last}".strip()
+
+    def _usage(self, system: str, messages: list[dict[str, str]], reply: str) -> TokenUsage:
+        prompt = system + "".join(m["content"] for m in messages)
+        return TokenUsage(prompt_tokens=estimate_tokens(prompt), completion_tokens=estimate_tokens(reply))
+
+    async def complete(self, model, messages, system="", max_tokens=1024, temperature=0.2) -> ModelResponse:
+        reply = self._reply(model, messages)
+        return ModelResponse(
+            text=reply,
+            model=model,
+            provider=self.provider.value,
+            usage=self._usage(system, messages, reply),
+            finish_reason="stop",
+        )
+
+    async def stream(self, model, messages, system="", max_tokens=1024, temperature=0.2) -> AsyncIterator[StreamEvent]:
+        reply = self._reply(model, messages)
+        words = reply.split(" ")
+        for i, word in enumerate(words):
+            yield StreamEvent(delta=word if i == 0 else f" {word}")
+        yield StreamEvent(usage=self._usage(system, messages, reply), finish_reason="stop")
+
+
+class HTTPProviderClient(ProviderClient):
+    """
+    Base for HTTP providers. Owns ONE pooled httpx.AsyncClient for its lifetime.
+
+    Subclasses describe the wire format: endpoint paths, payloads, and how
+    to read text/usage from responses and SSE events.
+    """
+
+    base_url: str = ""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        max_connections: int = 20,
+        max_keepalive: int = 10,
+        keepalive_expiry: float = 30.0,
+    ):
+        import httpx
+
+        self.api_key = api_key
+        self._client = httpx.AsyncClient(
+            base_url=base_url or self.base_url,
+            headers=self._headers(),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            # Per-call deadlines are enforced by ModelClient; this only bounds connects
+            timeout=httpx.Timeout(None, connect=10.0),
+        )
+
+    def _headers(self) -> dict[str, str]:
+        return {"content-type": "application/json"}
+
+    def _path(self, model: str, stream: bool) -> str:
+        raise NotImplementedError
+
+    def _payload(self, model, messages, system, max_tokens, temperature, stream: bool) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def _parse_response(self, model: str, data: dict[str, Any]) -> ModelResponse:
+        raise NotImplementedError
+
+    def _parse_event(self, data: dict[str, Any], usage: TokenUsage) -> StreamEvent:
+        """Read one SSE event. Updates `usage` in place as totals arrive."""
+        raise NotImplementedError
+
+    def _raise_for_status(self, status_code: int, body: str) -> None:
+        if status_code < 400:
+            return
+        retryable = status_code == 429 or status_code >= 500
+        raise ModelClientError(
+            f"{self.provider.value} returned {status_code}: {body[:200]}",
+            retryable=retryable,
+            status_code=status_code,
+        )
+
+    async def complete(self, model, messages, system="", max_tokens=1024, temperature=0.2) -> ModelResponse:
+        import httpx
+
+        payload = self._payload(model, messages, system, max_tokens, temperature, stream=False)
+        try:
+            response = await self._client.post(self._path(model, stream=False), json=payload)
+        except httpx.TransportError as e:
+            raise ModelClientError(f"{self.provider.value} transport error: {e}", retryable=True) from e
+        self._raise_for_status(response.status_code, response.text)
+        return self._parse_response(model, response.json())
+
+    async def stream(self, model, messages, system="", max_tokens=1024, temperature=0.2) -> AsyncIterator[StreamEvent]:
+        import httpx
+
+        payload = self._payload(model, messages, system, max_tokens, temperature, stream=True)
+        usage = TokenUsage()
+        finish_reason = ""
+        try:
+            async with self._client.stream("POST", self._path(model, stream=True), json=payload) as response:
+                if response.status_code >= 400:
+                    body = (await response.aread()).decode("utf-8", errors="replace")
+                    self._raise_for_status(response.status_code, body)
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    raw = line[5:].strip()
+                    if not raw or raw == "[DONE]":
+                        continue
+                    event = self._parse_event(json.loads(raw), usage)
+                    finish_reason = event.finish_reason or finish_reason
+                    if event.delta:
+                        yield event
+        except httpx.TransportError as e:
+            raise ModelClientError(f"{self.provider.value} transport error: {e}", retryable=True) from e
+        yield StreamEvent(usage=usage, finish_reason=finish_reason)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class GoogleProvider(HTTPProviderClient):
+    """Gemini via the Generative Language API."""
+
+    provider = ModelProvider.GOOGLE
+    base_url = "https://generativelanguage.googleapis.com/v1beta"
+
+    def _headers(self) -> dict[str, str]:
+        return {"content-type": "application/json", "x-goog-api-key": self.api_key}
+
+    def _path(self, model: str, stream: bool) -> str:
+        if stream:
+            return f"/models/{model}:streamGenerateContent?alt=sse"
+        return f"/models/{model}:generateContent"
+
+    def _payload(self, model, messages, system, max_tokens, temperature, stream):
+        payload: dict[str, Any] = {
+            "contents": [
+                {
+                    "role": "model" if m["role"] == "assistant" else "user",
+                    "parts": [{"text": m["content"]}],
+                }
+                for m in messages
+            ],
+            "generationConfig": {"maxOutputTokens": max_tokens, "temperature": temperature},
+        }
+        if system:
+            payload["systemInstruction"] = {"parts": [{"text": system}]}
+        return payload
+
+    def _text(self, data: dict[str, Any]) -> tuple[str, str]:
+        candidates = data.get("candidates") or [{}]
+        parts = candidates[0].get("content", {}).get("parts", [])
+        return "".join(p.get("text", "") for p in parts), candidates[0].get("finishReason", "")
+
+    def _read_usage(self, data: dict[str, Any], usage: TokenUsage) -> None:
+        meta = data.get("usageMetadata")
+        if meta:
+            # Gemini reports cumulative totals on every chunk
+            usage.prompt_tokens = meta.get("promptTokenCount", usage.prompt_tokens)
+            usage.completion_tokens = meta.get("candidatesTokenCount", usage.completion_tokens)
+
+    def _parse_response(self, model, data):
+        text, finish_reason = self._text(data)
+        usage = TokenUsage()
+        self._read_usage(data, usage)
+        return ModelResponse(text=text, model=model, provider=self.provider.value, usage=usage, finish_reason=finish_reason)
+
+    def _parse_event(self, data, usage):
+        text, finish_reason = self._text(data)
+        self._read_usage(data, usage)
+        return StreamEvent(delta=text, finish_reason=finish_reason)
+
+
+class AnthropicProvider(HTTPProviderClient):
+    """Claude via the Messages API."""
+
+    provider = ModelProvider.ANTHROPIC
+    base_url = "https://api.anthropic.com"
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            "content-type": "application/json",
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01",
+        }
+
+    def _path(self, model: str, stream: bool) -> str:
+        return "/v1/messages"
+
+    def _payload(self, model, messages, system, max_tokens, temperature, stream):
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": stream,
+        }
+        if system:
+            payload["system"] = system
+        return payload
+
+    def _parse_response(self, model, data):
+        text = "".join(b.get("text", "") for b in data.get("content", []) if b.get("type") == "text")
+        raw_usage = data.get("usage", {})
+        return ModelResponse(
+            text=text,
+            model=model,
+            provider=self.provider.value,
+            usage=TokenUsage(
+                prompt_tokens=raw_usage.get("input_tokens", 0),
+                completion_tokens=raw_usage.get("output_tokens", 0),
+            ),
+            finish_reason=data.get("stop_reason") or "",
+        )
+
+    def _parse_event(self, data, usage):
+        kind = data.get("type")
+        if kind == "message_start":
+            usage.prompt_tokens = data.get("message", {}).get("usage", {}).get("input_tokens", 0)
+        elif kind == "content_block_delta":
+            return StreamEvent(delta=data.get("delta", {}).get("text", ""))
+        elif kind == "message_delta":
+            usage.completion_tokens = data.get("usage", {}).get("output_tokens", usage.completion_tokens)
+            return StreamEvent(finish_reason=data.get("delta", {}).get("stop_reason") or "")
+        return StreamEvent()
+
+
+class OpenAIProvider(HTTPProviderClient):
+    """OpenAI (and compatible servers) via Chat Completions."""
+
+    provider = ModelProvider.OPENAI
+    base_url = "https://api.openai.com"
+
+    def _headers(self) -> dict[str, str]:
+        return {"content-type": "application/json", "authorization": f"Bearer {self.api_key}"}
+
+    def _path(self, model: str, stream: bool) -> str:
+        return "/v1/chat/completions"
+
+    def _payload(self, model, messages, system, max_tokens, temperature, stream):
+        full = ([{"role": "system", "content": system}] if system else []) + messages
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": full,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": stream,
+        }
+        if stream:
+            payload["stream_options"] = {"include_usage": True}
+        return payload
+
+    def _parse_response(self, model, data):
+        choice = (data.get("choices") or [{}])[0]
+        raw_usage = data.get("usage") or {}
+        return ModelResponse(
+            text=choice.get("message", {}).get("content") or "",
+            model=model,
+            provider=self.provider.value,
+            usage=TokenUsage(
+                prompt_tokens=raw_usage.get("prompt_tokens", 0),
+                completion_tokens=raw_usage.get("completion_tokens", 0),
+            ),
+            finish_reason=choice.get("finish_reason") or "",
+        )
+
+    def _parse_event(self, data, usage):
+        if data.get("usage"):
+            usage.prompt_tokens = data["usage"].get("prompt_tokens", 0)
+            usage.completion_tokens = data["usage"].get("completion_tokens", 0)
+        choices = data.get("choices") or []
+        if not choices:
+            return StreamEvent()
+        return StreamEvent(
+            delta=choices[0].get("delta", {}).get("content") or "",
+            finish_reason=choices[0].get("finish_reason") or "",
+        )
+
+
+# ============================================================
+# Model Client — THE shared entry point
+# ============================================================
+
+class ModelClient:
+    """
+    Shared async model client. One instance per process.
+
+    Usage:
+        client = get_model_client()
+        response = await client.complete("gemini-2.5-flash", "Summarize this repo")
+
+        async for delta in client.stream("claude-3-haiku-20240307", "Write a haiku"):
+            print(delta, end="")
+    """
+
+    def __init__(
+        self,
+        providers: Optional[list[ProviderClient]] = None,
+        timeout: float = 60.0,
+        max_retries: int = 2,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        offline_fallback: bool = False,
+    ):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.offline_fallback = offline_fallback
+        self._providers: dict[ModelProvider, ProviderClient] = {}
+        self._stub = StubProvider()
+        self._usage = TokenUsage()
+        self._retry_count = 0
+        self._error_count = 0
+
+        for provider in providers or []:
+            self.register_provider(provider)
+
+    @classmethod
+    def from_config(cls, config) -> "ModelClient":
+        """Build a client with one pooled provider per configured API key."""
+        providers: list[ProviderClient] = []
+        pool = {
+            "max_connections": config.llm_max_connections,
+            "max_keepalive": max(1, config.llm_max_connections // 2),
+        }
+        if config.google_api_key:
+            providers.append(GoogleProvider(config.google_api_key, **pool))
+        if config.anthropic_api_key:
+            providers.append(AnthropicProvider(config.anthropic_api_key, **pool))
+        if config.openai_api_key:
+            providers.append(OpenAIProvider(config.openai_api_key, **pool))
+        return cls(
+            providers=providers,
+            timeout=config.llm_timeout_seconds,
+            max_retries=config.llm_max_retries,
+            offline_fallback=config.llm_offline,
+        )
+
+    def register_provider(self, provider: ProviderClient) -> None:
+        """Register (or replace) the client for a provider."""
+        self._providers[provider.provider] = provider
+        logger.info(f"Model provider registered: {provider.provider.value}")
+
+    def _infer_provider(self, model: str) -> ModelProvider:
+        if model.startswith("gemini"):
+            return ModelProvider.GOOGLE
+        if model.startswith("claude"):
+            return ModelProvider.ANTHROPIC
+        if model.startswith(("gpt", "o1", "o3", "o4")):
+            return ModelProvider.OPENAI
+        return ModelProvider.LOCAL
+
+    def _resolve(self, model: str) -> tuple[Optional[ModelConfig], ProviderClient]:
+        model_config = get_model(model)
+        provider_type = model_config.provider if model_config else self._infer_provider(model)
+        provider = self._providers.get(provider_type)
+        if provider is not None:
+            return model_config, provider
+        if self.offline_fallback:
+            return model_config, self._stub
+        raise ModelClientError(
+            f"No provider configured for model '{model}' ({provider_type.value}): "
+            f"set its API key, or CLE_LLM_OFFLINE=true for canned offline replies"
+        )
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _account(self, model_config: Optional[ModelConfig], provider: ProviderClient, usage: TokenUsage) -> None:
+        if provider is not self._stub:
+            usage.cost_usd = calculate_cost(model_config, usage.prompt_tokens, usage.completion_tokens)
+        usage.calls = 1
+        self._usage.add(usage)
+        scope = _usage_scope.get()
+        if scope is not None:
+            scope.add(usage)
+
+    @staticmethod
+    def _messages(prompt: str | list[dict[str, str]]) -> list[dict[str, str]]:
+        if isinstance(prompt, str):
+            return [{"role": "user", "content": prompt}]
+        return prompt
+
+    async def complete(
+        self,
+        model: str,
+        prompt: str | list[dict[str, str]],
+        system: str = "",
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.2,
+        timeout: Optional[float] = None,
+    ) -> ModelResponse:
+        """
+        Run a completion with per-call timeout and jittered retries.
+
+        Args:
+            model: Model ID (see cle.config.models.MODELS)
+            prompt: A user prompt, or a list of {"role", "content"} messages
+            system: System instruction
+            max_tokens: Output cap (defaults to the model's max_output_tokens, capped at 4096)
+            temperature: Sampling temperature
+            timeout: Per-attempt deadline in seconds (defaults to the client timeout)
+
+        Returns:
+            ModelResponse with text and accounted usage
+        """
+        model_config, provider = self._resolve(model)
+        messages = self._messages(prompt)
+        max_tokens = max_tokens or min(model_config.max_output_tokens if model_config else 1024, 4096)
+        deadline = timeout or self.timeout
+
+        for attempt in range(self.max_retries + 1):
+            start = time.perf_counter()
+            try:
+                response = await asyncio.wait_for(
+                    provider.complete(model, messages, system, max_tokens, temperature),
+                    timeout=deadline,
+                )
+                response.latency_ms = round((time.perf_counter() - start) * 1000, 2)
+                self._account(model_config, provider, response.usage)
+                return response
+            except (asyncio.TimeoutError, ModelClientError) as e:
+                retryable = isinstance(e, asyncio.TimeoutError) or e.retryable
+                if not retryable or attempt == self.max_retries:
+                    self._error_count += 1
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise ModelClientError(f"{model} timed out after {deadline}s", retryable=True) from e
+                    raise
+                delay = self._backoff(attempt)
+                self._retry_count += 1
+                logger.warning(f"Model call to {model} failed ({e}), retry {attempt + 1} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+        raise ModelClientError(f"{model} failed after {self.max_retries + 1} attempts")
+
+    async def stream(
+        self,
+        model: str,
+        prompt: str | list[dict[str, str]],
+        system: str = "",
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.2,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion as text deltas.
+
+        Retries only happen before the first token is delivered; `timeout`
+        bounds the wait for each next event, not the whole stream.
+        """
+        model_config, provider = self._resolve(model)
+        messages = self._messages(prompt)
+        max_tokens = max_tokens or min(model_config.max_output_tokens if model_config else 1024, 4096)
+        deadline = timeout or self.timeout
+
+        for attempt in range(self.max_retries + 1):
+            emitted = False
+            usage: Optional[TokenUsage] = None
+            events = provider.stream(model, messages, system, max_tokens, temperature).__aiter__()
+            try:
+                while True:
+                    try:
+                        event = await asyncio.wait_for(events.__anext__(), timeout=deadline)
+                    except StopAsyncIteration:
+                        break
+                    if event.usage is not None:
+                        usage = event.usage
+                    if event.delta:
+                        emitted = True
+                        yield event.delta
+                self._account(model_config, provider, usage or TokenUsage())
+                return
+            except (asyncio.TimeoutError, ModelClientError) as e:
+                retryable = isinstance(e, asyncio.TimeoutError) or e.retryable
+                if emitted or not retryable or attempt == self.max_retries:
+                    self._error_count += 1
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise ModelClientError(f"{model} stream stalled for {deadline}s", retryable=True) from e
+                    raise
+                delay = self._backoff(attempt)
+                self._retry_count += 1
+                logger.warning(f"Stream from {model} failed ({e}), retry {attempt + 1} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+            finally:
+                await events.aclose()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get client statistics."""
+        return {
+            "providers": [p.value for p in self._providers],
+            "calls": self._usage.calls,
+            "prompt_tokens": self._usage.prompt_tokens,
+            "completion_tokens": self._usage.completion_tokens,
+            "cost_usd": round(self._usage.cost_usd, 6),
+            "retries": self._retry_count,
+            "errors": self._error_count,
+        }
+
+    async def aclose(self) -> None:
+        """Close all pooled provider connections."""
+        for provider in self._providers.values():
+            await provider.aclose()
+
+
+# ============================================================
+# Process-wide client
+# ============================================================
+
+_client: Optional[ModelClient] = None
+
+
+def get_model_client() -> ModelClient:
+    """Get the shared model client, creating it from the engine config on first use."""
+    global _client
+    if _client is None:
+        from cle.config.env import get_config
+        try:
+            _client = ModelClient.from_config(get_config())
+        except RuntimeError:
+            # Config not loaded (scripts, tests) — no providers; calls fail
+            # unless a client with offline_fallback is installed via set_model_client()
+            _client = ModelClient()
+    return _client
+
+
+def set_model_client(client: Optional[ModelClient]) -> None:
+    """Replace the shared client (tests, custom providers)."""
+    global _client
+    _client = client
+
+
+async def close_model_client() -> None:
+    """Close the shared client. Called on engine shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
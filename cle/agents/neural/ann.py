@@ -0,0 +1,185 @@
+"""
+Creative Liberation Engine v5 — Approximate Nearest-Neighbour Index
+
+Inverted-file (IVF) cosine index over float32 vectors:
+1. Exact search below a training threshold — no approximation for small sets
+2. k-means coarse quantizer once the set grows — vectors bucketed by centroid
+3. Queries probe the nprobe closest buckets only
+4. Automatic retraining as the set doubles in size
+
+Used by the attractor memory (retrieve_similar_attractors) and the local
+vector memory backend. numpy only; no external ANN library.
+"""
+
+import logging
+import numpy as np
+from typing import Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class IVFIndex:
+    """
+    Cosine-similarity IVF index keyed by arbitrary hashable IDs.
+
+    Usage:
+        index = IVFIndex(dim=2048)
+        index.add("plan-1", vector)
+        index.search(query, k=5)  # → [("plan-1", 0.93), ...]
+        index.remove("plan-1")
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        nlist: Optional[int] = None,
+        nprobe: int = 8,
+        train_threshold: int = 1024,
+        kmeans_iterations: int = 10,
+        seed: int = 0,
+    ):
+        self.dim = dim
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.kmeans_iterations = kmeans_iterations
+        self._rng = np.random.default_rng(seed)
+
+        self._vectors = np.zeros((16, dim), dtype=np.float32)
+        self._assign = np.full(16, -1, dtype=np.int32)
+        self._ids: list[Hashable] = []
+        self._rows: dict[Hashable, int] = {}
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self._vectors)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        vectors = np.zeros((capacity, self.dim), dtype=np.float32)
+        vectors[: len(self._ids)] = self._vectors[: len(self._ids)]
+        assign = np.full(capacity, -1, dtype=np.int32)
+        assign[: len(self._ids)] = self._assign[: len(self._ids)]
+        self._vectors, self._assign = vectors, assign
+
+    def add(self, key: Hashable, vector: np.ndarray) -> None:
+        """Insert or replace one vector."""
+        self.add_many([key], np.asarray(vector)[None, :])
+
+    def add_many(self, keys: list[Hashable], vectors: np.ndarray) -> None:
+        """Insert or replace a batch of vectors."""
+        vectors = self._normalize(vectors)
+        for key, vector in zip(keys, vectors):
+            row = self._rows.get(key)
+            if row is None:
+                row = len(self._ids)
+                self._grow(row + 1)
+                self._ids.append(key)
+                self._rows[key] = row
+            self._vectors[row] = vector
+            self._assign[row] = self._nearest_centroid(vector) if self.is_trained else -1
+
+        size = len(self._ids)
+        if size >= self.train_threshold and size >= 2 * self._trained_size:
+            self.train()
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove a vector (swap-with-last, O(1))."""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return False
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+            self._vectors[row] = self._vectors[last]
+            self._assign[row] = self._assign[last]
+        self._ids.pop()
+        self._assign[last] = -1
+        return True
+
+    def _nearest_centroid(self, vector: np.ndarray) -> int:
+        return int(np.argmax(self._centroids @ vector))
+
+    def train(self) -> None:
+        """(Re)build the coarse quantizer with spherical k-means."""
+        size = len(self._ids)
+        if size == 0:
+            return
+        data = self._vectors[:size]
+        nlist = self.nlist or max(1, int(np.sqrt(size)))
+        nlist = min(nlist, size)
+
+        centroids = data[self._rng.choice(size, nlist, replace=False)].copy()
+        for _ in range(self.kmeans_iterations):
+            assign = np.argmax(data @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, data)
+            counts = np.bincount(assign, minlength=nlist)
+            empty = counts == 0
+            sums[empty] = data[self._rng.choice(size, int(empty.sum()))]
+            centroids = self._normalize(sums)
+
+        self._centroids = centroids
+        self._assign[:size] = np.argmax(data @ centroids.T, axis=1)
+        self._trained_size = size
+        logger.debug(f"IVF index trained: {size} vectors, {nlist} lists")
+
+    def search(self, query: np.ndarray, k: int = 5, mask: Optional[np.ndarray] = None) -> list[tuple[Hashable, float]]:
+        """
+        Top-k (id, cosine similarity) pairs, best first.
+
+        mask, if given, is a boolean array over insertion rows (see row_of)
+        restricting which vectors may be returned.
+        """
+        size = len(self._ids)
+        if size == 0 or k <= 0:
+            return []
+        query = self._normalize(query)
+
+        if self.is_trained:
+            nprobe = min(self.nprobe, len(self._centroids))
+            probes = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+            candidates = np.flatnonzero(np.isin(self._assign[:size], probes))
+        else:
+            candidates = np.arange(size)
+        if mask is not None:
+            candidates = candidates[mask[candidates]]
+        if candidates.size == 0:
+            return []
+
+        scores = self._vectors[candidates] @ query
+        k = min(k, candidates.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self._ids[candidates[i]], float(scores[i])) for i in top]
+
+    def row_of(self, key: Hashable) -> Optional[int]:
+        return self._rows.get(key)
+
+    def get_stats(self) -> dict:
+        return {
+            "vectors": len(self._ids),
+            "trained": self.is_trained,
+            "lists": 0 if self._centroids is None else len(self._centroids),
+            "nprobe": self.nprobe,
+        }
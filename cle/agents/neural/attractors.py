@@ -14,12 +14,25 @@ Research Foundation:
 - BioRxiv: Mechanistic theory of planning in prefrontal CORE (2025)
 
 Performance Target: +7% on ambiguous problems, +12% solution diversity
+
+Memory: the dense (n·d × n·d) weight matrix is never materialized. Every block
+is rank-1 (a coupling coefficient times an outer product of agent vectors), so
+BlockLowRankWeights stores the n × n couplings plus the agent vectors and does
+all Hopfield algebra in O(n·d + n²).
+
+Learning: each stored attractor is a rank-1 coupling term with an
+incrementally maintained norm. Attractor memory is capacity-bounded (least
+used / shallowest evicted, and its Hebbian term forgotten) and indexed with
+an IVF index for similarity retrieval.
 """
 
 import logging
+import time
 import numpy as np
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
+
+from cle.agents.neural.ann import IVFIndex
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +68,207 @@ class Solution:
     energy: float
 
 
+class BlockLowRankWeights:
+    """
+    Structured Hopfield weight matrix for n agents with d-dimensional vectors.
+
+    Every (i, j) block of the dense (n·d × n·d) matrix is rank-1:
+        W[i, j] = C[i, j] · v_i v_jᵀ / ν
+    where C is an n × n coupling matrix (cosine similarity off the diagonal,
+    plus accumulated Hebbian terms) and ν is the Frobenius norm of the
+    unnormalized matrix:
+        ν² = Σ_ij C_ij² |v_i|² |v_j|²
+
+    With p_i = v_i · s_i (each agent's projection of its state block):
+        W @ s       → block i = (C p)_i / ν · v_i
+        sᵀ W s      = pᵀ C p / ν
+
+    Usage:
+        weights = BlockLowRankWeights.from_vectors(agent_vectors)  # (n, d)
+        field = weights.matvec(state)                              # (n·d,)
+        energy = weights.energy(state)
+    """
+
+    def __init__(self, vectors: np.ndarray, coupling: np.ndarray, dtype: type = np.float64):
+        self.vectors = np.asarray(vectors, dtype=dtype)
+        self.n, self.dim = self.vectors.shape
+        self.coupling = np.array(coupling, dtype=dtype)
+        self._sq_norms = np.einsum("id,id->i", self.vectors, self.vectors)
+        # Cached Gram of factor norms: G_ij = |v_i|² |v_j|², so ν² = Σ C² ∘ G
+        self._gram = np.outer(self._sq_norms, self._sq_norms)
+        self._norm_sq = 0.0
+        self._norm = 0.0
+        self._updates_since_exact = 0
+        self._recompute_norm()
+
+    def astype(self, dtype: type) -> "BlockLowRankWeights":
+        """Copy of these weights in another precision (e.g. float32 for batched search)."""
+        if self.vectors.dtype == dtype:
+            return self
+        return BlockLowRankWeights(self.vectors, self.coupling, dtype=dtype)
+
+    @classmethod
+    def from_vectors(cls, vectors: np.ndarray) -> "BlockLowRankWeights":
+        """Couple every pair of distinct agents by the cosine similarity of their vectors."""
+        vectors = np.asarray(vectors, dtype=np.float64)
+        norms = np.linalg.norm(vectors, axis=1)
+        similarity = (vectors @ vectors.T) / (np.outer(norms, norms) + 1e-8)
+        np.fill_diagonal(similarity, 0.0)
+        return cls(vectors, similarity)
+
+    # Re-derive ν exactly every so often to bound floating-point drift
+    EXACT_NORM_EVERY = 1000
+
+    def _recompute_norm(self) -> None:
+        self._norm_sq = float(np.sum(self.coupling ** 2 * self._gram))
+        self._norm = float(np.sqrt(self._norm_sq))
+        self._updates_since_exact = 0
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        size = self.n * self.dim
+        return size, size
+
+    def frobenius_norm(self) -> float:
+        """Norm of the (normalized) weight matrix: 1.0, or 0.0 if there are no couplings."""
+        return 1.0 if self._norm > 0 else 0.0
+
+    def project(self, state: np.ndarray) -> np.ndarray:
+        """Per-agent projections p_i = v_i · s_i. Accepts (n·d,) or (..., n·d)."""
+        blocks = state.reshape(*state.shape[:-1], self.n, self.dim)
+        return np.einsum("...id,id->...i", blocks, self.vectors)
+
+    def matvec(self, state: np.ndarray) -> np.ndarray:
+        """W @ state for a single state (n·d,) or a batch of states (..., n·d)."""
+        if self._norm == 0:
+            return np.zeros_like(state)
+        q = self.project(state) @ (self.coupling.T / self._norm)
+        out = q[..., :, None] * self.vectors
+        return out.reshape(state.shape)
+
+    def energy(self, state: np.ndarray) -> float:
+        """Hopfield energy −½ sᵀ W s."""
+        if self._norm == 0:
+            return 0.0
+        p = self.project(state)
+        return float(-0.5 * p @ self.coupling @ p / self._norm)
+
+    def _add_rank1(self, t: np.ndarray, delta: float) -> None:
+        """C ← C + δ t tᵀ, updating ν² from the touched entries only: O(k²) for k non-zeros in t."""
+        idx = np.flatnonzero(t)
+        if idx.size == 0 or delta == 0:
+            return
+        tt = np.outer(t[idx], t[idx])
+        block = np.ix_(idx, idx)
+        gram = self._gram[block]
+        # Σ (C + δT)² G = Σ C² G + 2δ Σ C T G + δ² Σ T² G
+        self._norm_sq += 2 * delta * float(np.sum(self.coupling[block] * tt * gram))
+        self._norm_sq += delta ** 2 * float(np.sum(tt ** 2 * gram))
+        self.coupling[block] += delta * tt
+
+        self._updates_since_exact += 1
+        if self._updates_since_exact >= self.EXACT_NORM_EVERY:
+            self._recompute_norm()
+        else:
+            self._norm = float(np.sqrt(max(self._norm_sq, 0.0)))
+
+    def hebbian_update(self, team_weights: np.ndarray, learning_rate: float) -> float:
+        """
+        Equivalent of W ← (W + η h hᵀ) / ‖W + η h hᵀ‖ for h with blocks
+        h_i = t_i · v_i — a rank-1 update of the coupling matrix.
+
+        Returns the coefficient δ added to C, so the term can be forgotten later.
+        """
+        t = np.asarray(team_weights, dtype=self.coupling.dtype)
+        # W = C/ν, so adding η h hᵀ to W adds η·ν t tᵀ to C
+        scale = self._norm if self._norm > 0 else 1.0
+        delta = learning_rate * scale
+        self._add_rank1(t, delta)
+        return delta
+
+    def forget(self, team_weights: np.ndarray, delta: float) -> None:
+        """Remove a Hebbian term previously added with coefficient δ."""
+        self._add_rank1(np.asarray(team_weights, dtype=self.coupling.dtype), -delta)
+
+    def to_dense(self) -> np.ndarray:
+        """Materialize the full matrix. Only for verification on tiny networks."""
+        if self._norm == 0:
+            return np.zeros(self.shape)
+        blocks = self.coupling[:, None, :, None] * self.vectors[:, :, None, None] * self.vectors[None, None, :, :]
+        return blocks.reshape(self.shape) / self._norm
+
+
+@dataclass
+class AttractorRecord:
+    """A learned attractor: the team, its solution vector, and its Hebbian term."""
+    attractor_id: int
+    team_names: list[str]
+    solution_vector: np.ndarray
+    activation_pattern: np.ndarray
+    energy: float
+    team_weights: np.ndarray
+    hebbian_weight: float
+    uses: int = 0
+    created_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict:
+        return {
+            "team_names": self.team_names,
+            "solution_vector": self.solution_vector,
+            "activation_pattern": self.activation_pattern,
+            "energy": self.energy,
+            "uses": self.uses,
+        }
+
+
+class AttractorMemory:
+    """
+    Capacity-bounded attractor store with IVF similarity search.
+
+    When full, the least-used attractor is evicted (ties broken by highest,
+    i.e. shallowest, energy). The caller is handed the evicted record so its
+    Hebbian term can be forgotten.
+    """
+
+    def __init__(self, dim: int, capacity: int = 1024):
+        self.capacity = capacity
+        self.index = IVFIndex(dim)
+        self._records: dict[int, AttractorRecord] = {}
+        self._next_id = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[AttractorRecord]:
+        return iter(self._records.values())
+
+    def next_id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    def add(self, record: AttractorRecord) -> Optional[AttractorRecord]:
+        """Store a record; returns the evicted record if capacity was exceeded."""
+        victim = None
+        # The incoming record has no uses yet, so it is never a candidate
+        candidates = [r for r in self._records.values() if r.attractor_id != record.attractor_id]
+        if candidates and len(candidates) >= self.capacity:
+            victim = min(candidates, key=lambda r: (r.uses, -r.energy))
+            del self._records[victim.attractor_id]
+            self.index.remove(victim.attractor_id)
+            self.evictions += 1
+        self._records[record.attractor_id] = record
+        self.index.add(record.attractor_id, record.solution_vector)
+        return victim
+
+    def search(self, vector: np.ndarray, top_k: int = 5) -> list[AttractorRecord]:
+        """Most similar attractors by solution vector; counts as a use for each."""
+        hits = [self._records[i] for i, _ in self.index.search(vector, top_k)]
+        for record in hits:
+            record.uses += 1
+        return hits
+
+
 class AttractorNetwork:
     """
     Neural attractor dynamics for stable agent team formation.
@@ -64,43 +278,28 @@ class AttractorNetwork:
     - Energy: E = -0.5 * s^T * W * s
     - Learning: ΔW = η * s * s^T (Hebbian)
 
+    W is held as BlockLowRankWeights, so memory is O(n·d) rather than O((n·d)²).
+
     Usage:
         agents = [AttractorAgent(name="kbuildd", concept_vector=bolt_vec)]
         network = AttractorNetwork(agents)
         solution = network.pattern_completion(problem)
     """
 
-    def __init__(self, agents: list[AttractorAgent]):
+    def __init__(self, agents: list[AttractorAgent], attractor_capacity: int = 1024):
         self.agents = {a.name: a for a in agents}
         self.vector_dim = VECTOR_DIM
         self.state_vector = self._initialize_state()
-        self.weight_matrix = self._build_connection_weights()
-        self.attractors: list[dict] = []
+        self.weights = self._build_connection_weights()
+        self.attractors = AttractorMemory(self.vector_dim, capacity=attractor_capacity)
 
     def _initialize_state(self) -> np.ndarray:
         n = len(self.agents)
         return np.random.randn(n * self.vector_dim) * 0.01
 
-    def _build_connection_weights(self) -> np.ndarray:
-        n = len(self.agents)
-        total_dim = n * self.vector_dim
-        W = np.zeros((total_dim, total_dim))
-        agent_list = list(self.agents.values())
-
-        for i, agent1 in enumerate(agent_list):
-            for j, agent2 in enumerate(agent_list):
-                if i == j:
-                    continue
-                similarity = self._cosine_similarity(agent1.concept_vector, agent2.concept_vector)
-                v1, v2 = agent1.concept_vector, agent2.concept_vector
-                i_start, i_end = i * self.vector_dim, (i + 1) * self.vector_dim
-                j_start, j_end = j * self.vector_dim, (j + 1) * self.vector_dim
-                W[i_start:i_end, j_start:j_end] = similarity * np.outer(v1, v2)
-
-        norm = np.linalg.norm(W)
-        if norm > 0:
-            W = W / norm
-        return W
+    def _build_connection_weights(self) -> BlockLowRankWeights:
+        vectors = np.stack([a.concept_vector for a in self.agents.values()]) if self.agents else np.zeros((0, self.vector_dim))
+        return BlockLowRankWeights.from_vectors(vectors)
 
     def _cosine_similarity(self, v1: np.ndarray, v2: np.ndarray) -> float:
         return float(np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2) + 1e-8))
@@ -108,18 +307,47 @@ class AttractorNetwork:
     def pattern_completion(self, problem: Problem, max_iterations: int = 100, convergence_threshold: float = 1e-4) -> Solution:
         """Complete partial problem specification via attractor dynamics."""
         initial_state = self._encode_partial_problem(problem)
-        state = initial_state.copy()
         problem_input = self._problem_to_input(problem)
+        states, iterations = self._evolve(
+            initial_state[None, :], problem_input, max_iterations, convergence_threshold,
+        )
+        return self._state_to_solution(states[0], int(iterations[0]))
+
+    def _evolve(
+        self,
+        states: np.ndarray,
+        problem_input: np.ndarray,
+        max_iterations: int = 100,
+        convergence_threshold: float = 1e-4,
+        dtype: type = np.float64,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Evolve a batch of states (trials, n·d) under s ← tanh(W s + ½·input).
+
+        Each trial stops at its own convergence; converged rows are dropped
+        from the working set, so later iterations only pay for trials still
+        moving. Returns final states and per-trial iteration counts.
+        """
+        weights = self.weights.astype(dtype)
+        states = np.array(states, dtype=dtype)
+        drive = (0.5 * problem_input).astype(dtype)
+        iterations = np.full(len(states), max_iterations)
+        active = np.arange(len(states))
 
         for iteration in range(max_iterations):
-            state_new = np.tanh(self.weight_matrix @ state + 0.5 * problem_input)
-            delta = np.linalg.norm(state_new - state)
-            if delta < convergence_threshold:
-                state = state_new
-                break
-            state = state_new
+            current = states[active]
+            updated = np.tanh(weights.matvec(current) + drive)
+            delta = np.linalg.norm(updated - current, axis=1)
+            states[active] = updated
+
+            converged = delta < convergence_threshold
+            if converged.any():
+                iterations[active[converged]] = iteration + 1
+                active = active[~converged]
+                if active.size == 0:
+                    break
 
-        return self._state_to_solution(state, iteration + 1)
+        return states, iterations
 
     def _encode_partial_problem(self, problem: Problem) -> np.ndarray:
         state = np.zeros(len(self.agents) * self.vector_dim)
@@ -131,12 +359,9 @@ class AttractorNetwork:
         return state
 
     def _problem_to_input(self, problem: Problem) -> np.ndarray:
-        input_vec = np.zeros(len(self.agents) * self.vector_dim)
-        if problem.problem_vector is not None:
-            for i in range(len(self.agents)):
-                i_start, i_end = i * self.vector_dim, (i + 1) * self.vector_dim
-                input_vec[i_start:i_end] = problem.problem_vector
-        return input_vec
+        if problem.problem_vector is None:
+            return np.zeros(len(self.agents) * self.vector_dim)
+        return np.tile(np.asarray(problem.problem_vector, dtype=np.float64), len(self.agents))
 
     def _decode_state_to_agents(self, state: np.ndarray) -> list[tuple[AttractorAgent, float]]:
         activations = []
@@ -147,6 +372,14 @@ class AttractorNetwork:
             activations.append((agent, activation))
         return activations
 
+    def _batch_activations(self, states: np.ndarray) -> np.ndarray:
+        """Agent activations for a batch of states: (trials, n·d) → (trials, n)."""
+        blocks = states.reshape(len(states), len(self.agents), self.vector_dim)
+        block_norms = np.linalg.norm(blocks, axis=2)
+        vector_norms = np.linalg.norm(self.weights.vectors, axis=1)
+        cosine = self.weights.astype(states.dtype).project(states) / (block_norms * vector_norms + 1e-8)
+        return np.maximum(cosine, 0.0)
+
     def _compute_solution_vector(self, team: list[AttractorAgent]) -> np.ndarray:
         if not team:
             return np.zeros(self.vector_dim)
@@ -159,13 +392,13 @@ class AttractorNetwork:
         max_activation = max(a for _, a in activations) if activations else 0
         high_count = sum(1 for _, a in activations if a > 0.7)
         concentration = 1.0 / (1.0 + high_count * 0.1)
-        gradient = np.linalg.norm(self.weight_matrix @ state)
+        gradient = np.linalg.norm(self.weights.matvec(state))
         stability = 1.0 / (1.0 + gradient)
         confidence = (max_activation + concentration + stability) / 3.0
         return min(confidence, 1.0)
 
     def _calculate_energy(self, state: np.ndarray) -> float:
-        return float(-0.5 * state @ self.weight_matrix @ state)
+        return float(-0.5 * state @ self.weights.matvec(state))
 
     def _state_to_solution(self, state: np.ndarray, iterations: int) -> Solution:
         agent_activations = self._decode_state_to_agents(state)
@@ -182,19 +415,40 @@ class AttractorNetwork:
             energy=energy,
         )
 
-    def multi_stable_search(self, problem: Problem, num_trials: int = 10) -> list[Solution]:
-        solutions = []
-        for _ in range(num_trials):
-            initial_state = np.random.randn(len(self.agents) * self.vector_dim) * 0.1
-            problem_input = self._problem_to_input(problem)
-            state = initial_state
-            for iteration in range(100):
-                state_new = np.tanh(self.weight_matrix @ state + 0.5 * problem_input)
-                if np.linalg.norm(state_new - state) < 1e-4:
-                    state = state_new
-                    break
-                state = state_new
-            solution = self._state_to_solution(state, iteration + 1)
+    def multi_stable_search(
+        self,
+        problem: Problem,
+        num_trials: int = 10,
+        max_iterations: int = 100,
+        convergence_threshold: float = 1e-4,
+        use_float32: bool = False,
+    ) -> list[Solution]:
+        """
+        Find multiple stable team configurations from random starting states.
+
+        All trials evolve together as one (trials, n·d) batch. Trials that land
+        on a team already seen are dropped before a Solution is built for them.
+        use_float32 halves memory traffic at a small cost in precision.
+        """
+        if not self.agents:
+            return []
+        dtype = np.float32 if use_float32 else np.float64
+        initial_states = np.random.randn(num_trials, len(self.agents) * self.vector_dim) * 0.1
+        problem_input = self._problem_to_input(problem)
+        states, iterations = self._evolve(
+            initial_states, problem_input, max_iterations, convergence_threshold, dtype=dtype,
+        )
+
+        # Early dedup: identical teams are decided from activations alone
+        teams = self._batch_activations(states) > 0.7
+        seen: set[bytes] = set()
+        solutions: list[Solution] = []
+        for trial in range(num_trials):
+            team_key = teams[trial].tobytes()
+            if team_key in seen:
+                continue
+            seen.add(team_key)
+            solution = self._state_to_solution(states[trial].astype(np.float64), int(iterations[trial]))
             if not self._is_duplicate(solution, solutions):
                 solutions.append(solution)
         solutions.sort(key=lambda s: s.confidence, reverse=True)
@@ -211,44 +465,39 @@ class AttractorNetwork:
         return False
 
     def store_attractor(self, solution: Solution) -> None:
-        self.attractors.append({
-            "team_names": [a.name for a in solution.team],
-            "solution_vector": solution.solution_vector,
-            "activation_pattern": solution.team_activation_pattern,
-            "energy": solution.energy,
-        })
-        self._strengthen_attractor(solution)
-
-    def _strengthen_attractor(self, solution: Solution) -> None:
+        team_names = [a.name for a in solution.team]
+        team_weights = self._team_weights(team_names)
+        hebbian_weight = self._strengthen_attractor(team_weights)
+        evicted = self.attractors.add(AttractorRecord(
+            attractor_id=self.attractors.next_id(),
+            team_names=team_names,
+            solution_vector=solution.solution_vector,
+            activation_pattern=solution.team_activation_pattern,
+            energy=solution.energy,
+            team_weights=team_weights,
+            hebbian_weight=hebbian_weight,
+        ))
+        if evicted is not None:
+            self.weights.forget(evicted.team_weights, evicted.hebbian_weight)
+
+    def _team_weights(self, team_names: list[str]) -> np.ndarray:
+        members = set(team_names)
+        return np.array([1.0 if name in members else 0.0 for name in self.agents])
+
+    def _strengthen_attractor(self, team_weights: np.ndarray) -> float:
         learning_rate = 0.01
-        state = self._solution_to_state(solution)
-        delta_W = learning_rate * np.outer(state, state)
-        self.weight_matrix += delta_W
-        norm = np.linalg.norm(self.weight_matrix)
-        if norm > 0:
-            self.weight_matrix = self.weight_matrix / norm
-
-    def _solution_to_state(self, solution: Solution) -> np.ndarray:
-        state = np.zeros(len(self.agents) * self.vector_dim)
-        agent_list = list(self.agents.values())
-        for i, agent in enumerate(agent_list):
-            if agent in solution.team:
-                i_start, i_end = i * self.vector_dim, (i + 1) * self.vector_dim
-                state[i_start:i_end] = agent.concept_vector
-        return state
+        return self.weights.hebbian_update(team_weights, learning_rate)
 
     def retrieve_similar_attractors(self, problem: Problem, top_k: int = 5) -> list[dict]:
-        similarities = []
-        for attractor in self.attractors:
-            sim = self._cosine_similarity(problem.problem_vector, attractor["solution_vector"])
-            similarities.append((sim, attractor))
-        similarities.sort(reverse=True, key=lambda x: x[0])
-        return [att for _, att in similarities[:top_k]]
+        return [record.to_dict() for record in self.attractors.search(problem.problem_vector, top_k)]
 
     def get_status(self) -> dict:
         return {
             "agents": len(self.agents),
             "vector_dim": self.vector_dim,
             "stored_attractors": len(self.attractors),
-            "weight_matrix_norm": float(np.linalg.norm(self.weight_matrix)),
+            "attractor_capacity": self.attractors.capacity,
+            "attractor_evictions": self.attractors.evictions,
+            "weight_matrix_norm": self.weights.frobenius_norm(),
+            "weight_params": int(self.weights.coupling.size + self.weights.vectors.size),
         }
@@ -10,16 +10,23 @@ Lineage: v3 concept-vectors/vector_engine.py (313 lines) → v5 (adapted)
 Research Foundation:
 - CATS Net Framework (Nature Computational Science, Feb 2026)
 - 2048-dim decomposition: 8 feature ranges × 256 dims each
+
+Queries run against a contiguous, row-normalized (n_agents, 2048) float32
+matrix with cached per-feature-range slice norms, so a lookup is one GEMV
+and all-pairs similarity is one GEMM. The matrix is rebuilt lazily after
+vectors change.
 """
 
 import hashlib
 import json
 import logging
 import numpy as np
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
 from typing import Optional
 
+from cle.agents.neural.vector_store import VectorStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +61,53 @@ OUTPUT_MAP: dict[str, int] = {
     "schema": 192, "narrative": 224,
 }
 
+TEMPORAL_DEFAULTS: dict[str, float] = {
+    "response_urgency": 0.5, "timezone_score": 0.5, "context_depth": 0.5, "freshness_need": 0.5,
+}
+COMPLEXITY_DEFAULTS: dict[str, float] = {
+    "max_complexity": 0.7, "preferred_complexity": 0.5, "multi_step_ability": 0.6, "abstraction_level": 0.5,
+}
+RESOURCE_DEFAULTS: dict[str, float] = {
+    "compute_need": 0.5, "memory_need": 0.5, "external_api": 0.3, "collaboration_need": 0.6,
+}
+ETHICS_DEFAULTS: dict[str, float] = {
+    "constitutional_compliance": 1.0, "privacy_sensitivity": 0.9, "transparency_level": 0.8, "human_oversight": 0.9,
+}
+
+
+def stable_seed(token: str) -> int:
+    """Process-independent 32-bit seed for a token (Python's hash() is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+@lru_cache(maxsize=1024)
+def _token_subvector(token: str, width: int = 32) -> np.ndarray:
+    """Deterministic sub-vector for a token, identical across workers and restarts."""
+    rng = np.random.RandomState(stable_seed(token))
+    subvector = (rng.randn(width) * 0.1 + 1.0).astype(np.float32)
+    subvector.setflags(write=False)
+    return subvector
+
+
+def _one_hot_blocks(values: list[list[str]], mapping: dict[str, int]) -> np.ndarray:
+    """(n, len(mapping)) membership mask, columns in mapping order."""
+    columns = {key: j for j, key in enumerate(mapping)}
+    mask = np.zeros((len(values), len(mapping)), dtype=np.float32)
+    for i, tokens in enumerate(values):
+        for token in tokens:
+            if token in columns:
+                mask[i, columns[token]] = 1.0
+    return mask
+
+
+def _scalar_blocks(values: list[dict], defaults: dict[str, float]) -> np.ndarray:
+    """(n, 256) feature range: each of 4 scalars repeated over 64 dims."""
+    scalars = np.array(
+        [[v.get(key, default) for key, default in defaults.items()] for v in values],
+        dtype=np.float32,
+    ).reshape(len(values), len(defaults))
+    return np.repeat(scalars, 64, axis=1)
+
 
 class ConceptVectorEngine:
     """
@@ -71,96 +125,80 @@ class ConceptVectorEngine:
 
     def __init__(self, storage_path: Optional[str] = None):
         self.storage_path = Path(storage_path) if storage_path else None
+        self.store: Optional[VectorStore] = None
         if self.storage_path:
             self.storage_path.mkdir(parents=True, exist_ok=True)
+            self.store = VectorStore(self.storage_path, dim=VECTOR_DIM)
         self.agents: dict[str, np.ndarray] = {}
         self.metadata: dict[str, dict] = {}
+        # Query matrix, rebuilt from self.agents when dirty
+        self._names: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._matrix = np.zeros((0, VECTOR_DIM), dtype=np.float32)
+        self._slice_norms = np.zeros((0, len(FEATURE_RANGES)), dtype=np.float32)
+        self._dirty = False
 
     def generate_agent_vector(self, agent_name: str, metadata: dict) -> np.ndarray:
         """Generate 2048-dimension concept vector for an agent."""
-        vector = np.zeros(VECTOR_DIM, dtype=np.float32)
-        vector[0:256] = self._encode_domain_expertise(metadata.get("expertise", []))
-        vector[256:512] = self._encode_collaboration_history(metadata.get("collaboration_history", []))
-        vector[512:768] = self._encode_problem_types(metadata.get("capabilities", []))
-        vector[768:1024] = self._encode_output_formats(metadata.get("output_types", []))
-        vector[1024:1280] = self._encode_temporal_context(metadata.get("temporal", {}))
-        vector[1280:1536] = self._encode_complexity_profile(metadata.get("complexity", {}))
-        vector[1536:1792] = self._encode_resource_needs(metadata.get("resources", {}))
-        vector[1792:2048] = self._encode_ethical_constraints(metadata.get("ethics", {}))
-
-        norm = np.linalg.norm(vector)
-        if norm > 0:
-            vector = vector / norm
-
-        self.agents[agent_name] = vector
-        self.metadata[agent_name] = metadata
-        logger.info(f"Generated concept vector for {agent_name} (dim={VECTOR_DIM})")
-        return vector
-
-    def _encode_domain_expertise(self, expertise: list[str]) -> np.ndarray:
-        vector = np.zeros(256, dtype=np.float32)
-        for exp in expertise:
-            if exp in DOMAIN_MAP:
-                idx = DOMAIN_MAP[exp]
-                rng = np.random.RandomState(hash(exp) % 2**31)
-                vector[idx:idx + 32] = rng.randn(32) * 0.1 + 1.0
-        return vector
-
-    def _encode_collaboration_history(self, history: list[dict]) -> np.ndarray:
-        vector = np.zeros(256, dtype=np.float32)
-        for i, collab in enumerate(history[:32]):
-            success_rate = collab.get("success_rate", 0.5)
-            frequency = collab.get("frequency", 0)
-            vector[i * 8:(i + 1) * 8] = [success_rate] * 4 + [frequency] * 4
-        return vector
-
-    def _encode_problem_types(self, capabilities: list[str]) -> np.ndarray:
-        vector = np.zeros(256, dtype=np.float32)
-        for cap in capabilities:
-            if cap in PROBLEM_MAP:
-                idx = PROBLEM_MAP[cap]
-                vector[idx:idx + 32] = 1.0
-        return vector
-
-    def _encode_output_formats(self, outputs: list[str]) -> np.ndarray:
-        vector = np.zeros(256, dtype=np.float32)
-        for output in outputs:
-            if output in OUTPUT_MAP:
-                idx = OUTPUT_MAP[output]
-                vector[idx:idx + 32] = 1.0
-        return vector
-
-    def _encode_temporal_context(self, temporal: dict) -> np.ndarray:
-        vector = np.zeros(256, dtype=np.float32)
-        vector[0:64] = temporal.get("response_urgency", 0.5)
-        vector[64:128] = temporal.get("timezone_score", 0.5)
-        vector[128:192] = temporal.get("context_depth", 0.5)
-        vector[192:256] = temporal.get("freshness_need", 0.5)
-        return vector
-
-    def _encode_complexity_profile(self, complexity: dict) -> np.ndarray:
-        vector = np.zeros(256, dtype=np.float32)
-        vector[0:64] = complexity.get("max_complexity", 0.7)
-        vector[64:128] = complexity.get("preferred_complexity", 0.5)
-        vector[128:192] = complexity.get("multi_step_ability", 0.6)
-        vector[192:256] = complexity.get("abstraction_level", 0.5)
-        return vector
-
-    def _encode_resource_needs(self, resources: dict) -> np.ndarray:
-        vector = np.zeros(256, dtype=np.float32)
-        vector[0:64] = resources.get("compute_need", 0.5)
-        vector[64:128] = resources.get("memory_need", 0.5)
-        vector[128:192] = resources.get("external_api", 0.3)
-        vector[192:256] = resources.get("collaboration_need", 0.6)
-        return vector
-
-    def _encode_ethical_constraints(self, ethics: dict) -> np.ndarray:
-        vector = np.zeros(256, dtype=np.float32)
-        vector[0:64] = ethics.get("constitutional_compliance", 1.0)
-        vector[64:128] = ethics.get("privacy_sensitivity", 0.9)
-        vector[128:192] = ethics.get("transparency_level", 0.8)
-        vector[192:256] = ethics.get("human_oversight", 0.9)
-        return vector
+        return self.generate_agent_vectors({agent_name: metadata})[agent_name]
+
+    def generate_agent_vectors(self, agent_metadata: dict[str, dict]) -> dict[str, np.ndarray]:
+        """
+        Generate concept vectors for many agents in one vectorized pass.
+
+        Args:
+            agent_metadata: agent name → metadata (same keys as generate_agent_vector)
+
+        Returns:
+            agent name → normalized 2048-dim float32 vector
+        """
+        names = list(agent_metadata)
+        metas = [agent_metadata[name] for name in names]
+        vectors = self._encode_batch(metas)
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = np.divide(vectors, norms, out=vectors, where=norms > 0)
+
+        result = {name: vectors[i] for i, name in enumerate(names)}
+        self.agents.update(result)
+        self.metadata.update(agent_metadata)
+        self._dirty = True
+        if len(names) == 1:
+            logger.info(f"Generated concept vector for {names[0]} (dim={VECTOR_DIM})")
+        else:
+            logger.info(f"Generated concept vectors for {len(names)} agents (dim={VECTOR_DIM})")
+        return result
+
+    def _encode_batch(self, metas: list[dict]) -> np.ndarray:
+        """Unnormalized (n, 2048) vectors, one feature range at a time across all agents."""
+        n = len(metas)
+        vectors = np.zeros((n, VECTOR_DIM), dtype=np.float32)
+
+        # Domain expertise: 32-dim seeded sub-vector per known domain
+        domain_table = np.stack([_token_subvector(domain) for domain in DOMAIN_MAP])
+        domain_mask = _one_hot_blocks([m.get("expertise", []) for m in metas], DOMAIN_MAP)
+        vectors[:, 0:256] = (domain_mask[:, :, None] * domain_table[None, :, :]).reshape(n, 256)
+
+        # Collaboration history: 8 dims per collaborator (4× success rate, 4× frequency)
+        collab = np.zeros((n, 32, 2), dtype=np.float32)
+        for i, meta in enumerate(metas):
+            for j, entry in enumerate(meta.get("collaboration_history", [])[:32]):
+                collab[i, j] = (entry.get("success_rate", 0.5), entry.get("frequency", 0))
+        vectors[:, 256:512] = np.repeat(collab, 4, axis=2).reshape(n, 256)
+
+        # Problem types and output formats: 32-dim indicator blocks
+        vectors[:, 512:768] = np.repeat(
+            _one_hot_blocks([m.get("capabilities", []) for m in metas], PROBLEM_MAP), 32, axis=1,
+        )
+        vectors[:, 768:1024] = np.repeat(
+            _one_hot_blocks([m.get("output_types", []) for m in metas], OUTPUT_MAP), 32, axis=1,
+        )
+
+        vectors[:, 1024:1280] = _scalar_blocks([m.get("temporal", {}) for m in metas], TEMPORAL_DEFAULTS)
+        vectors[:, 1280:1536] = _scalar_blocks([m.get("complexity", {}) for m in metas], COMPLEXITY_DEFAULTS)
+        vectors[:, 1536:1792] = _scalar_blocks([m.get("resources", {}) for m in metas], RESOURCE_DEFAULTS)
+        vectors[:, 1792:2048] = _scalar_blocks([m.get("ethics", {}) for m in metas], ETHICS_DEFAULTS)
+        return vectors
 
     def calculate_similarity(self, agent1: str, agent2: str, relationship_type: str = "all") -> float:
         if agent1 not in self.agents or agent2 not in self.agents:
@@ -176,46 +214,126 @@ class ConceptVectorEngine:
                 return float(np.dot(v1_slice, v2_slice) / (norm1 * norm2))
         return 0.0
 
+    # ========================================================
+    # Matrix queries
+    # ========================================================
+
+    def invalidate(self) -> None:
+        """Mark the query matrix stale. Call after writing to self.agents directly."""
+        self._dirty = True
+
+    def _ensure_matrix(self) -> None:
+        if not self._dirty and len(self._names) == len(self.agents):
+            return
+        self._names = list(self.agents)
+        self._rows = {name: i for i, name in enumerate(self._names)}
+        if self._names:
+            matrix = np.ascontiguousarray(np.stack([self.agents[n] for n in self._names]), dtype=np.float32)
+        else:
+            matrix = np.zeros((0, VECTOR_DIM), dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self._matrix = matrix / np.maximum(norms, 1e-8)
+        self._slice_norms = np.stack(
+            [np.linalg.norm(self._matrix[:, start:end], axis=1) for start, end in FEATURE_RANGES.values()],
+            axis=1,
+        ) if self._names else np.zeros((0, len(FEATURE_RANGES)), dtype=np.float32)
+        self._dirty = False
+
+    def _scores(self, queries: np.ndarray, relationship_type: str = "all") -> np.ndarray:
+        """Cosine similarity of query rows (m, 2048) against every agent → (m, n_agents)."""
+        self._ensure_matrix()
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        if relationship_type == "all":
+            query_norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            return (queries / np.maximum(query_norms, 1e-8)) @ self._matrix.T
+        if relationship_type not in FEATURE_RANGES:
+            return np.zeros((len(queries), len(self._names)), dtype=np.float32)
+        r = list(FEATURE_RANGES).index(relationship_type)
+        start, end = FEATURE_RANGES[relationship_type]
+        query_norms = np.linalg.norm(queries[:, start:end], axis=1)
+        denom = np.outer(query_norms, self._slice_norms[:, r])
+        dots = queries[:, start:end] @ self._matrix[:, start:end].T
+        return np.divide(dots, denom, out=np.zeros_like(dots), where=denom > 0)
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, top_k: int) -> np.ndarray:
+        """Indices of the top_k scores, best first (argpartition + sort of k)."""
+        k = min(top_k, scores.size)
+        if k <= 0:
+            return np.array([], dtype=np.int64)
+        top = np.argpartition(-scores, k - 1)[:k]
+        return top[np.argsort(-scores[top])]
+
     def find_similar_agents(self, agent_name: str, top_k: int = 5, relationship_type: str = "all") -> list[tuple[str, float]]:
         if agent_name not in self.agents:
             return []
-        similarities = [
-            (other, self.calculate_similarity(agent_name, other, relationship_type))
-            for other in self.agents if other != agent_name
-        ]
-        return sorted(similarities, key=lambda x: x[1], reverse=True)[:top_k]
+        self._ensure_matrix()
+        row = self._rows[agent_name]
+        scores = self._scores(self._matrix[row], relationship_type)[0]
+        scores[row] = -np.inf
+        top = self._top_k(scores, min(top_k, len(self._names) - 1))
+        return [(self._names[i], float(scores[i])) for i in top]
 
     def find_agents_for_problem_vector(self, problem_vector: np.ndarray, top_k: int = 3) -> list[dict]:
-        results = []
-        for name, agent_vec in self.agents.items():
-            sim = float(np.dot(agent_vec, problem_vector) / (
-                np.linalg.norm(agent_vec) * np.linalg.norm(problem_vector) + 1e-8
-            ))
-            results.append({"agent": name, "similarity": sim})
-        results.sort(key=lambda x: x["similarity"], reverse=True)
-        return results[:top_k]
+        return self.find_agents_for_problem_vectors(np.asarray(problem_vector)[None, :], top_k)[0]
+
+    def find_agents_for_problem_vectors(self, problem_vectors: np.ndarray, top_k: int = 3) -> list[list[dict]]:
+        """Best agents for many problem vectors at once — one GEMM for the whole batch."""
+        scores = self._scores(problem_vectors)
+        return [
+            [{"agent": self._names[i], "similarity": float(row[i])} for i in self._top_k(row, top_k)]
+            for row in scores
+        ]
+
+    def similarity_matrix(self, relationship_type: str = "all") -> tuple[list[str], np.ndarray]:
+        """All-pairs similarity: (agent names, (n, n) matrix) in one GEMM."""
+        self._ensure_matrix()
+        return list(self._names), self._scores(self._matrix, relationship_type)
 
     def save_vector(self, agent_name: str) -> str:
-        if agent_name not in self.agents:
-            raise ValueError(f"Agent {agent_name} not found")
-        if self.storage_path is None:
+        return self.save_vectors([agent_name])[agent_name]
+
+    def save_vectors(self, agent_names: Optional[list[str]] = None) -> dict[str, str]:
+        """Append vectors to the store and publish them in one atomic commit. Returns name → sha256."""
+        if self.store is None:
             raise ValueError("No storage path configured")
-        vector = self.agents[agent_name]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{agent_name}_v{timestamp}.npy"
-        filepath = self.storage_path / filename
-        np.save(filepath, vector)
-        sha256 = hashlib.sha256(vector.tobytes()).hexdigest()
-        meta_file = filepath.with_suffix(".json")
-        with open(meta_file, "w") as f:
-            json.dump({"agent_name": agent_name, "timestamp": timestamp, "sha256": sha256,
-                       "vector_dim": VECTOR_DIM, "metadata": self.metadata.get(agent_name, {})}, f, indent=2)
-        logger.info(f"Saved vector for {agent_name}: {sha256[:12]}...")
-        return sha256
+        names = agent_names if agent_names is not None else list(self.agents)
+        missing = [name for name in names if name not in self.agents]
+        if missing:
+            raise ValueError(f"Agent {missing[0]} not found")
+        shas = {
+            name: self.store.append(name, self.agents[name], metadata=self.metadata.get(name, {}))
+            for name in names
+        }
+        self.store.commit()
+        for name, sha256 in shas.items():
+            logger.info(f"Saved vector for {name}: {sha256[:12]}...")
+        return shas
 
     def load_vector(self, agent_name: str, version: Optional[str] = None) -> np.ndarray:
-        if self.storage_path is None:
+        if self.store is None:
+            raise ValueError("No storage path configured")
+        try:
+            vector = self.store.get(agent_name, version)
+            self.metadata[agent_name] = self.store.entry(agent_name, version).get("metadata", {})
+        except KeyError:
+            vector = self._load_legacy_vector(agent_name, version)
+        self.agents[agent_name] = vector
+        self._dirty = True
+        return vector
+
+    def load_all(self) -> int:
+        """Load the latest vector of every stored agent — one memory map, rows paged in on use."""
+        if self.store is None:
             raise ValueError("No storage path configured")
+        for name in self.store.agents():
+            self.agents[name] = self.store.get(name)
+            self.metadata[name] = self.store.entry(name).get("metadata", {})
+        self._dirty = True
+        return len(self.store.agents())
+
+    def _load_legacy_vector(self, agent_name: str, version: Optional[str] = None) -> np.ndarray:
+        """Read a vector saved by the old one-.npy-per-save layout."""
         if version:
             filename = f"{agent_name}_v{version}.npy"
         else:
@@ -226,7 +344,6 @@ class ConceptVectorEngine:
             filename = files[-1].name
         filepath = self.storage_path / filename
         vector = np.load(filepath)
-        self.agents[agent_name] = vector
         meta_file = filepath.with_suffix(".json")
         if meta_file.exists():
             with open(meta_file) as f:
@@ -240,4 +357,5 @@ class ConceptVectorEngine:
             "vector_dim": VECTOR_DIM,
             "feature_ranges": list(FEATURE_RANGES.keys()),
             "storage_path": str(self.storage_path) if self.storage_path else None,
+            "store": self.store.get_stats() if self.store else None,
         }
@@ -15,16 +15,21 @@ Research Foundation:
 - Soft Coded Logic: System i — The Default Mode Network of AGI (2026)
 
 Performance Target: +8% through proactive optimization
+
+Scheduling: the loop sleeps on an activity event rather than polling, each
+cycle phase runs as its own task that mark_activity() cancels, and resource
+metrics come from a sampler thread so psutil never blocks the event loop.
 """
 
 import asyncio
 import logging
 import random
+import threading
 import time
 import uuid
 from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
@@ -78,6 +83,7 @@ class CrossSessionPattern:
     success_rate: float
     average_duration: float
     discovered_at: datetime
+    cluster_key: str = ""
 
 
 @dataclass
@@ -104,6 +110,94 @@ class ProactiveTask:
     created_at: datetime
 
 
+class ResourceSampler:
+    """
+    Samples CPU/memory/disk on a daemon thread and caches the latest reading.
+
+    psutil.cpu_percent(interval=...) sleeps for the measuring interval; doing
+    that here keeps the sleep off the event loop. Readers get the cached
+    snapshot without blocking.
+
+    Usage:
+        sampler = ResourceSampler(interval=2.0)
+        sampler.start()
+        sampler.latest()  # → {"cpu": 0.12, "memory": 0.48, "disk": 0.61} or None
+        sampler.stop()
+    """
+
+    def __init__(self, interval: float = 2.0, cpu_window: float = 0.1):
+        self.interval = interval
+        self.cpu_window = cpu_window
+        self._latest: Optional[dict[str, float]] = None
+        self._sampled_at: Optional[float] = None
+        self._samples = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        # Each thread gets its own stop event, so a thread still finishing a
+        # sample after stop() keeps its event set and exits
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(self._stop,), name="dmn-resource-sampler", daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Signal the thread to exit; it finishes its current sample and stops."""
+        self._stop.set()
+        self._thread = None
+
+    def _run(self, stop: threading.Event) -> None:
+        while not stop.is_set():
+            try:
+                self.sample()
+            except Exception as e:
+                logger.debug(f"Resource sample failed: {e}")
+            stop.wait(self.interval)
+
+    def sample(self) -> dict[str, float]:
+        """Take one reading (blocks for cpu_window seconds) and cache it."""
+        try:
+            import psutil
+            metrics = {
+                "cpu": psutil.cpu_percent(interval=self.cpu_window) / 100.0,
+                "memory": psutil.virtual_memory().percent / 100.0,
+                "disk": psutil.disk_usage("/").percent / 100.0,
+            }
+        except ImportError:
+            metrics = {
+                "cpu": random.uniform(0.3, 0.7),
+                "memory": random.uniform(0.4, 0.6),
+                "disk": random.uniform(0.5, 0.7),
+            }
+        with self._lock:
+            self._latest = metrics
+            self._sampled_at = time.monotonic()
+            self._samples += 1
+        return metrics
+
+    def latest(self) -> Optional[dict[str, float]]:
+        with self._lock:
+            return dict(self._latest) if self._latest is not None else None
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            age = time.monotonic() - self._sampled_at if self._sampled_at is not None else None
+        return {
+            "running": self.running,
+            "samples": self._samples,
+            "sample_age_seconds": round(age, 2) if age is not None else None,
+        }
+
+
 class DefaultModeNetwork:
     """
     Background intelligence processing during system idle states.
@@ -114,12 +208,18 @@ class DefaultModeNetwork:
     3. extract_cross_session_patterns() — Semantic consolidation
     4. discover_novel_connections() — Creative insight discovery
 
+    The loop is event-driven: it sleeps until the idle threshold elapses and
+    is woken early by mark_activity(). Each phase runs as a separate task, and
+    mark_activity() cancels the running phase so foreground work never waits
+    on background processing.
+
     Usage:
         dmn = DefaultModeNetwork(memory_service, agent_registry)
         asyncio.create_task(dmn.background_processing_loop())
+        dmn.mark_activity()  # on every foreground request
     """
 
-    def __init__(self, memory_service=None, agent_registry=None):
+    def __init__(self, memory_service=None, agent_registry=None, cycle_interval: float = 5.0, sampler: Optional[ResourceSampler] = None):
         self.memory = memory_service
         self.registry = agent_registry
         self.idle_threshold = 30
@@ -130,29 +230,110 @@ class DefaultModeNetwork:
         self.is_running = False
         self.last_activity_time = datetime.now()
         self._cycle_count = 0
+        self.cycle_interval = cycle_interval
+        self.sampler = sampler or ResourceSampler()
+        self._activity = asyncio.Event()
+        self._phase_task: Optional[asyncio.Task] = None
+        self._preemptions = 0
+        # Cross-session pattern scan: clusters accumulate across cycles; each
+        # cycle reads at most pattern_scan_limit episodic memories past the mark
+        self.pattern_scan_limit = 2000
+        self._pattern_clusters: dict[str, dict[str, Any]] = {}
+        self._pattern_mark: Optional[datetime] = None
+        self._pattern_boundary: set[str] = set()
+        # Clusters changed since their pattern memory was last stored (ordered, oldest first);
+        # survives a preempted cycle so the mark can move on without losing updates
+        self._pattern_pending: dict[str, None] = {}
+
+    # --------------------------------------------------------
+    # Scheduling
+    # --------------------------------------------------------
 
     async def background_processing_loop(self) -> None:
         self.is_running = True
+        self.sampler.start()
         logger.info("DMN background processing started")
-        while self.is_running:
-            try:
-                if self.is_system_idle():
+        try:
+            while self.is_running:
+                remaining = self.idle_threshold - self._idle_seconds()
+                if remaining > 0:
+                    # Sleep until idle — or until activity restarts the countdown
+                    await self._wait_for_activity(remaining)
+                    continue
+                try:
                     await self.run_dmn_cycle()
-                await asyncio.sleep(5)
-            except Exception as e:
-                logger.error(f"DMN processing error: {e}")
-                await asyncio.sleep(10)
+                except Exception as e:
+                    logger.error(f"DMN processing error: {e}")
+                await self._wait_for_activity(self.cycle_interval)
+        finally:
+            self.sampler.stop()
+
+    async def _wait_for_activity(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for mark_activity(). Returns True if woken by activity."""
+        try:
+            await asyncio.wait_for(self._activity.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._activity.clear()
+        return True
+
+    def _idle_seconds(self) -> float:
+        return (datetime.now() - self.last_activity_time).total_seconds()
 
     def is_system_idle(self) -> bool:
-        elapsed = (datetime.now() - self.last_activity_time).total_seconds()
-        return elapsed >= self.idle_threshold
+        return self._idle_seconds() >= self.idle_threshold
 
     def mark_activity(self) -> None:
+        """Record foreground activity: restart the idle countdown and preempt any running phase."""
         self.last_activity_time = datetime.now()
-
-    async def run_dmn_cycle(self) -> None:
+        self._activity.set()
+        if self._phase_task is not None and not self._phase_task.done():
+            self._phase_task.cancel()
+            self._preemptions += 1
+
+    async def _run_phase(self, name: str, coro) -> bool:
+        """Run one cycle phase as a cancellable task. Returns False if it was preempted."""
+        task = asyncio.create_task(coro, name=f"dmn-{name}")
+        self._phase_task = task
+        try:
+            await asyncio.wait({task})
+        except asyncio.CancelledError:
+            # The loop itself is being cancelled — take the phase with it
+            task.cancel()
+            raise
+        finally:
+            self._phase_task = None
+        if task.cancelled():
+            logger.debug(f"DMN phase {name} preempted by foreground activity")
+            return False
+        task.result()
+        return True
+
+    async def run_dmn_cycle(self) -> bool:
+        """Run the four phases in turn. Returns False if activity preempted the cycle."""
         cycle_start = time.perf_counter()
+        phases = (
+            ("health", self._health_phase),
+            ("foresight", self._foresight_phase),
+            ("consolidation", self._consolidation_phase),
+            ("insight", self._insight_phase),
+        )
+        for name, phase in phases:
+            if not await self._run_phase(name, phase()):
+                return False
+            # Give waiting foreground work the loop between phases
+            await asyncio.sleep(0)
 
+        self._cycle_count += 1
+        duration = (time.perf_counter() - cycle_start) * 1000
+        logger.debug(f"DMN cycle #{self._cycle_count} complete: {duration:.0f}ms")
+        return True
+
+    # --------------------------------------------------------
+    # Cycle phases
+    # --------------------------------------------------------
+
+    async def _health_phase(self) -> None:
         system_state = await self.reflect_on_system_health()
         if system_state.needs_attention:
             for reason in system_state.attention_reasons:
@@ -165,11 +346,13 @@ class DefaultModeNetwork:
                     created_at=datetime.now(),
                 ))
 
+    async def _foresight_phase(self) -> None:
         scenarios = await self.simulate_future_scenarios()
         for scenario in scenarios:
             solution = await self.precompute_solution(scenario)
             self.cache_solution(scenario.scenario_id, solution)
 
+    async def _consolidation_phase(self) -> None:
         patterns = await self.extract_cross_session_patterns()
         for pattern in patterns:
             if self.memory:
@@ -182,7 +365,9 @@ class DefaultModeNetwork:
                     importance=min(pattern.frequency / 10.0, 1.0),
                     metadata={"pattern_id": pattern.pattern_id, "agent_combinations": pattern.agent_combinations, "problem_categories": pattern.problem_categories},
                 ))
+                self._pattern_pending.pop(pattern.cluster_key, None)
 
+    async def _insight_phase(self) -> None:
         insights = await self.discover_novel_connections()
         self.insight_buffer.extend(insights)
 
@@ -190,10 +375,6 @@ class DefaultModeNetwork:
             self.insight_buffer.sort(key=lambda x: x.relevance_score, reverse=True)
             self.insight_buffer = self.insight_buffer[:self.insight_capacity]
 
-        self._cycle_count += 1
-        duration = (time.perf_counter() - cycle_start) * 1000
-        logger.debug(f"DMN cycle #{self._cycle_count} complete: {duration:.0f}ms")
-
     async def reflect_on_system_health(self) -> SystemState:
         resources = await self._gather_resource_metrics()
         errors = await self._get_recent_errors(hours=1)
@@ -238,19 +419,11 @@ class DefaultModeNetwork:
         )
 
     async def _gather_resource_metrics(self) -> dict[str, float]:
-        try:
-            import psutil
-            return {
-                "cpu": psutil.cpu_percent(interval=0.1) / 100.0,
-                "memory": psutil.virtual_memory().percent / 100.0,
-                "disk": psutil.disk_usage("/").percent / 100.0,
-            }
-        except ImportError:
-            return {
-                "cpu": random.uniform(0.3, 0.7),
-                "memory": random.uniform(0.4, 0.6),
-                "disk": random.uniform(0.5, 0.7),
-            }
+        metrics = self.sampler.latest()
+        if metrics is None:
+            # No cached reading yet (sampler not started) — sample off-loop once
+            metrics = await asyncio.to_thread(self.sampler.sample)
+        return metrics
 
     async def _get_recent_errors(self, hours: int = 1) -> list[str]:
         return []
@@ -310,29 +483,66 @@ class DefaultModeNetwork:
         return self.solution_cache.get(scenario_id)
 
     async def extract_cross_session_patterns(self) -> list[CrossSessionPattern]:
+        """
+        Fold episodic memories seen since the last cycle into the tag clusters.
+
+        Streams index metadata only (tags, source, importance; no file bodies),
+        oldest first from a created_at high-water mark, and stops after
+        pattern_scan_limit memories — the next cycle resumes there. Returns
+        the clusters (with at least two members) whose pattern memory is
+        stale: leftovers from preempted cycles first, then this cycle's.
+        """
         if not self.memory:
             return []
-        from cle.memory.types import MemoryQuery, MemoryType
-        result = await self.memory.query(MemoryQuery(text="*", memory_type=MemoryType.EPISODIC, limit=100))
-        if not result.memories:
-            return []
-        clusters: dict[str, list] = {}
-        for mem in result.memories:
+        from cle.memory.types import MemoryQuery, MemoryType, local_naive
+        # Step back 1µs and skip IDs already seen at the mark, so ties are neither lost nor recounted
+        created_after = self._pattern_mark - timedelta(microseconds=1) if self._pattern_mark else None
+        query = MemoryQuery(
+            text="*",
+            memory_type=MemoryType.EPISODIC,
+            created_after=created_after,
+            fields=["tags", "source", "importance", "created_at"],
+            limit=500,
+        )
+        scanned = 0
+        async for mem in self.memory.iter_query(query):
+            if mem.id in self._pattern_boundary:
+                continue
             key = ",".join(sorted(mem.tags[:3])) if mem.tags else "uncategorized"
-            clusters.setdefault(key, []).append(mem)
+            cluster = self._pattern_clusters.setdefault(
+                key, {"count": 0, "sources": {}, "tags": {}, "importance": 0.0},
+            )
+            cluster["count"] += 1
+            cluster["sources"][mem.source] = None
+            cluster["tags"].update(dict.fromkeys(mem.tags))
+            cluster["importance"] += mem.importance
+            self._pattern_pending.setdefault(key)
+
+            if mem.created_at is not None:
+                created = local_naive(mem.created_at)
+                if created != self._pattern_mark:
+                    self._pattern_mark, self._pattern_boundary = created, set()
+                self._pattern_boundary.add(mem.id)
+            scanned += 1
+            if scanned >= self.pattern_scan_limit:
+                break
+
         patterns = []
-        for cluster_key, memories in clusters.items():
-            if len(memories) < 2:
+        for cluster_key in list(self._pattern_pending):
+            cluster = self._pattern_clusters[cluster_key]
+            if cluster["count"] < 2:
+                del self._pattern_pending[cluster_key]  # a new member brings it back
                 continue
             patterns.append(CrossSessionPattern(
                 pattern_id=f"pattern_{uuid.uuid4().hex[:8]}",
                 pattern_type="cross_session",
-                frequency=len(memories),
-                agent_combinations=[[m.source for m in memories]],
-                problem_categories=list({t for m in memories for t in m.tags}),
-                success_rate=sum(m.importance for m in memories) / len(memories),
+                frequency=cluster["count"],
+                agent_combinations=[list(cluster["sources"])],
+                problem_categories=list(cluster["tags"]),
+                success_rate=cluster["importance"] / cluster["count"],
                 average_duration=0.0,
                 discovered_at=datetime.now(),
+                cluster_key=cluster_key,
             ))
         return patterns
 
@@ -384,6 +594,11 @@ class DefaultModeNetwork:
 
     def stop(self) -> None:
         self.is_running = False
+        self.sampler.stop()
+        # Wake the loop so it notices is_running and exits
+        self._activity.set()
+        if self._phase_task is not None and not self._phase_task.done():
+            self._phase_task.cancel()
         logger.info("DMN background processing stopped")
 
     def get_status(self) -> dict[str, Any]:
@@ -393,5 +608,11 @@ class DefaultModeNetwork:
             "insights_buffered": len(self.insight_buffer),
             "solutions_cached": len(self.solution_cache),
             "proactive_tasks_pending": len(self.processing_queue),
+            "pattern_clusters": len(self._pattern_clusters),
+            "pattern_mark": self._pattern_mark.isoformat() if self._pattern_mark else None,
+            "patterns_pending": len(self._pattern_pending),
             "idle_threshold_seconds": self.idle_threshold,
+            "phase_running": self._phase_task.get_name() if self._phase_task is not None and not self._phase_task.done() else None,
+            "preemptions": self._preemptions,
+            "resource_sampler": self.sampler.get_stats(),
         }
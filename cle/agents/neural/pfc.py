@@ -15,14 +15,60 @@ The PFC is the "conductor" that orchestrates all other neural systems.
 
 import asyncio
 import logging
+import re
 import time
 import uuid
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
+from cle.telemetry import get_metrics
+
 logger = logging.getLogger(__name__)
 
+# Which step types a step of each type waits for. A missing prerequisite type
+# is resolved through its own prerequisites, so "review" after "implement"
+# still waits for the implementation when a plan has no tests or docs.
+STEP_PREREQUISITES: dict[str, tuple[str, ...]] = {
+    "analyze": (),
+    "design": ("analyze",),
+    "implement": ("design",),
+    "test": ("implement",),
+    "document": ("implement",),
+    "review": ("test", "document"),
+    "compliance": ("review",),
+    "general": (),
+}
+
+# Mode each step type runs in. Analysis, review and compliance agents
+# (ARCH, COMPASS) don't run in ship mode, so only build steps inherit it.
+STEP_MODES: dict[str, str] = {
+    "analyze": "plan",
+    "design": "plan",
+    "implement": "ship",
+    "test": "ship",
+    "document": "ship",
+    "review": "validate",
+    "compliance": "validate",
+}
+
+# Priors used until an (agent, step type) pair has been observed
+STEP_DURATION_PRIORS_MS: dict[str, float] = {
+    "analyze": 2000.0,
+    "design": 5000.0,
+    "implement": 10000.0,
+    "test": 5000.0,
+    "document": 3000.0,
+    "review": 2000.0,
+    "compliance": 1000.0,
+    "general": 5000.0,
+}
+
+def goal_signature(goal: str, mode: str) -> str:
+    """Plan cache key: mode plus the goal's lowercase words, in order."""
+    return f"{mode}:{' '.join(re.findall(r'[a-z0-9]+', goal.lower()))}"
+
 
 @dataclass
 class Plan:
@@ -35,6 +81,10 @@ class Plan:
     completed_at: Optional[datetime] = None
     total_estimated_ms: float = 0.0
     actual_ms: float = 0.0
+    mode: str = "ship"
+    signature: str = ""
+    critical_path_ms: float = 0.0
+    from_cache: bool = False
 
     @property
     def progress(self) -> float:
@@ -43,6 +93,20 @@ class Plan:
         completed = sum(1 for s in self.steps if s.status == "completed")
         return completed / len(self.steps)
 
+    def timings(self) -> list[dict[str, Any]]:
+        """Estimated vs actual duration per step."""
+        return [
+            {
+                "step": s.id,
+                "step_type": s.step_type,
+                "agent": s.agent_name,
+                "status": s.status,
+                "estimated_ms": s.estimated_ms,
+                "actual_ms": round(s.actual_ms, 2),
+            }
+            for s in self.steps
+        ]
+
 
 @dataclass
 class PlanStep:
@@ -50,14 +114,141 @@ class PlanStep:
     id: str
     description: str
     agent_name: str
+    step_type: str = "general"  # key of STEP_PREREQUISITES
     dependencies: list[str] = field(default_factory=list)  # Step IDs
-    status: str = "pending"
+    status: str = "pending"  # pending, executing, completed, failed, blocked
     result: Any = None
     error: Optional[str] = None
     estimated_ms: float = 1000.0
     actual_ms: float = 0.0
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    template: str = "{goal}"  # description with the goal as a placeholder; reused by the plan cache
+
+
+@dataclass(frozen=True)
+class PlanTemplate:
+    """A reusable decomposition: typed steps, agents, and dependency indices."""
+    steps: tuple[tuple[str, str, str], ...]  # (step_type, description template, agent_name)
+    dependencies: tuple[tuple[int, ...], ...]
+
+    @classmethod
+    def from_steps(cls, steps: list[PlanStep]) -> "PlanTemplate":
+        index = {s.id: i for i, s in enumerate(steps)}
+        return cls(
+            steps=tuple((s.step_type, s.template, s.agent_name) for s in steps),
+            dependencies=tuple(tuple(index[d] for d in s.dependencies) for s in steps),
+        )
+
+    def instantiate(self, goal: str) -> list[PlanStep]:
+        steps = [
+            PlanStep(
+                id=f"step_{uuid.uuid4().hex[:6]}",
+                description=template.replace("{goal}", goal),
+                agent_name=agent_name,
+                step_type=step_type,
+                template=template,
+            )
+            for step_type, template, agent_name in self.steps
+        ]
+        for step, dependencies in zip(steps, self.dependencies):
+            step.dependencies = [steps[i].id for i in dependencies]
+        return steps
+
+
+class DurationEstimator:
+    """
+    Online per-(agent, step type) duration model.
+
+    Keeps an EWMA of observed durations plus a bounded window of recent
+    samples for quantiles. Unobserved pairs fall back to step-type priors.
+
+    Usage:
+        estimator = DurationEstimator()
+        estimator.observe("kbuildd", "implement", 8200.0)
+        estimator.estimate("kbuildd", "implement")        # EWMA
+        estimator.estimate("kbuildd", "implement", 0.9)   # p90 of recent samples
+    """
+
+    def __init__(self, alpha: float = 0.2, window: int = 64):
+        self.alpha = alpha
+        self.window = window
+        self._ewma: dict[tuple[str, str], float] = {}
+        self._samples: dict[tuple[str, str], deque[float]] = {}
+
+    def observe(self, agent: str, step_type: str, duration_ms: float) -> None:
+        key = (agent, step_type)
+        previous = self._ewma.get(key)
+        self._ewma[key] = duration_ms if previous is None else previous + self.alpha * (duration_ms - previous)
+        self._samples.setdefault(key, deque(maxlen=self.window)).append(duration_ms)
+
+    def estimate(self, agent: str, step_type: str, quantile: Optional[float] = None) -> float:
+        key = (agent, step_type)
+        if key not in self._ewma:
+            return STEP_DURATION_PRIORS_MS.get(step_type, STEP_DURATION_PRIORS_MS["general"])
+        if quantile is None:
+            return self._ewma[key]
+        ordered = sorted(self._samples[key])
+        return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+    def samples(self, agent: str, step_type: str) -> int:
+        return len(self._samples.get((agent, step_type), ()))
+
+    def get_stats(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "agent": agent,
+                "step_type": step_type,
+                "samples": len(self._samples[(agent, step_type)]),
+                "ewma_ms": round(ewma, 2),
+                "p50_ms": round(self.estimate(agent, step_type, 0.5), 2),
+                "p90_ms": round(self.estimate(agent, step_type, 0.9), 2),
+            }
+            for (agent, step_type), ewma in self._ewma.items()
+        ]
+
+
+def critical_path(steps: list[PlanStep]) -> tuple[float, dict[str, float]]:
+    """
+    Longest estimated path through a plan DAG.
+
+    Returns (critical path ms, rank per step id), where a step's rank is the
+    estimated time from its start to the end of the plan. Scheduling the
+    highest-rank ready step first keeps the critical path moving.
+    """
+    by_id = {s.id: s for s in steps}
+    dependents: dict[str, list[str]] = {s.id: [] for s in steps}
+    for step in steps:
+        for dep in step.dependencies:
+            if dep in dependents:
+                dependents[dep].append(step.id)
+
+    rank: dict[str, float] = {}
+    for step_id in reversed(_topological_order(steps)):
+        tail = max((rank[d] for d in dependents[step_id]), default=0.0)
+        rank[step_id] = by_id[step_id].estimated_ms + tail
+    return max(rank.values(), default=0.0), rank
+
+
+def _topological_order(steps: list[PlanStep]) -> list[str]:
+    """Kahn order over step IDs; steps on a cycle are left out."""
+    ids = {s.id for s in steps}
+    waiting = {s.id: sum(1 for d in s.dependencies if d in ids) for s in steps}
+    dependents: dict[str, list[str]] = {s.id: [] for s in steps}
+    for step in steps:
+        for dep in step.dependencies:
+            if dep in ids:
+                dependents[dep].append(step.id)
+    ready = [step_id for step_id, n in waiting.items() if n == 0]
+    order = []
+    while ready:
+        step_id = ready.pop()
+        order.append(step_id)
+        for dependent in dependents[step_id]:
+            waiting[dependent] -= 1
+            if waiting[dependent] == 0:
+                ready.append(dependent)
+    return order
 
 
 @dataclass
@@ -81,7 +272,11 @@ class PrefrontalCortex:
     2. Assigns agents to steps based on neural analysis
     3. Manages dependencies between steps
     4. Monitors execution and adapts on failure
-    5. Learns from completed plans
+    5. Learns from completed plans — reusable decompositions keyed by goal
+       signature, and per-(agent, step type) durations from actual timings
+
+    Plans are DAGs: execute_plan runs every step whose dependencies have
+    completed, up to max_concurrency at a time, on the registry's agents.
 
     Usage:
         pfc = PrefrontalCortex(concept_engine, dmn, agent_registry)
@@ -95,41 +290,74 @@ class PrefrontalCortex:
         dmn=None,
         agent_registry=None,
         memory_service=None,
+        max_concurrency: int = 4,
+        plan_cache_size: int = 256,
+        history_size: int = 100,
     ):
         self.concept_engine = concept_engine
         self.dmn = dmn
         self.registry = agent_registry
         self.memory = memory_service
+        self.max_concurrency = max_concurrency
 
         self._active_plans: dict[str, Plan] = {}
-        self._completed_plans: list[Plan] = []
+        self._completed_plans: deque[Plan] = deque(maxlen=history_size)
         self._plan_count = 0
 
+        self.durations = DurationEstimator()
+        self.plan_cache_size = plan_cache_size
+        self._plan_cache: OrderedDict[str, PlanTemplate] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
     async def create_plan(self, goal: str, context: Optional[PlanningContext] = None) -> Plan:
         """
         Create a multi-step execution plan for a complex goal.
+
+        Goals with a previously seen signature reuse that decomposition and
+        agent assignment; durations are always re-estimated from current data.
         """
+        self._mark_activity()
         plan_id = f"plan_{uuid.uuid4().hex[:8]}"
 
         if context is None:
             context = await self._gather_planning_context(goal)
 
-        steps = await self._decompose_goal(goal, context)
-        steps = await self._assign_agents(steps, context)
-        steps = self._determine_dependencies(steps)
+        signature = goal_signature(goal, context.current_mode)
+        template = self._plan_cache.get(signature)
+        if template is not None:
+            self._plan_cache.move_to_end(signature)
+            self._cache_hits += 1
+            steps = template.instantiate(goal)
+        else:
+            self._cache_misses += 1
+            steps = await self._decompose_goal(goal, context)
+            steps = await self._assign_agents(steps, context)
+            steps = self._determine_dependencies(steps)
+            self._plan_cache[signature] = PlanTemplate.from_steps(steps)
+            if len(self._plan_cache) > self.plan_cache_size:
+                self._plan_cache.popitem(last=False)
         steps = self._estimate_durations(steps, context)
+        critical_ms, _ = critical_path(steps)
 
         plan = Plan(
             id=plan_id,
             goal=goal,
             steps=steps,
             total_estimated_ms=sum(s.estimated_ms for s in steps),
+            mode=context.current_mode,
+            signature=signature,
+            critical_path_ms=critical_ms,
+            from_cache=template is not None,
         )
 
         self._active_plans[plan_id] = plan
         self._plan_count += 1
 
-        logger.info(f"Plan created: {plan_id} — {len(steps)} steps, est. {plan.total_estimated_ms:.0f}ms")
+        logger.info(
+            f"Plan created: {plan_id} — {len(steps)} steps, est. {plan.critical_path_ms:.0f}ms critical path"
+            f"{' (cached)' if plan.from_cache else ''}"
+        )
         return plan
 
     async def _gather_planning_context(self, goal: str) -> PlanningContext:
@@ -155,30 +383,39 @@ class PrefrontalCortex:
         )
 
     async def _decompose_goal(self, goal: str, context: PlanningContext) -> list[PlanStep]:
-        """Decompose a complex goal into sequential steps."""
+        """Decompose a complex goal into typed steps."""
         steps: list[PlanStep] = []
         goal_lower = goal.lower()
 
+        def add(step_type: str, template: str) -> None:
+            steps.append(PlanStep(
+                id=f"step_{uuid.uuid4().hex[:6]}",
+                description=template.replace("{goal}", goal),
+                agent_name="",
+                step_type=step_type,
+                template=template,
+            ))
+
         if any(word in goal_lower for word in ["build", "create", "implement", "design"]):
-            steps.append(PlanStep(id=f"step_{uuid.uuid4().hex[:6]}", description=f"Analyze requirements for: {goal}", agent_name=""))
+            add("analyze", "Analyze requirements for: {goal}")
 
         if any(word in goal_lower for word in ["build", "create", "system", "architecture"]):
-            steps.append(PlanStep(id=f"step_{uuid.uuid4().hex[:6]}", description=f"Design architecture for: {goal}", agent_name=""))
+            add("design", "Design architecture for: {goal}")
 
         if any(word in goal_lower for word in ["build", "create", "implement", "write", "code"]):
-            steps.append(PlanStep(id=f"step_{uuid.uuid4().hex[:6]}", description=f"Implement: {goal}", agent_name=""))
+            add("implement", "Implement: {goal}")
 
         if any(word in goal_lower for word in ["build", "create", "implement"]):
-            steps.append(PlanStep(id=f"step_{uuid.uuid4().hex[:6]}", description=f"Write tests for: {goal}", agent_name=""))
+            add("test", "Write tests for: {goal}")
 
         if any(word in goal_lower for word in ["build", "create", "document"]):
-            steps.append(PlanStep(id=f"step_{uuid.uuid4().hex[:6]}", description=f"Document: {goal}", agent_name=""))
+            add("document", "Document: {goal}")
 
-        steps.append(PlanStep(id=f"step_{uuid.uuid4().hex[:6]}", description=f"Review and validate: {goal}", agent_name=""))
-        steps.append(PlanStep(id=f"step_{uuid.uuid4().hex[:6]}", description=f"Constitutional compliance check for: {goal}", agent_name=""))
+        add("review", "Review and validate: {goal}")
+        add("compliance", "Constitutional compliance check for: {goal}")
 
         if not steps:
-            steps.append(PlanStep(id=f"step_{uuid.uuid4().hex[:6]}", description=goal, agent_name=""))
+            add("general", "{goal}")
 
         return steps
 
@@ -192,6 +429,10 @@ class PrefrontalCortex:
         }
 
         for step in steps:
+            if not step.agent_name:
+                # Typed steps map directly; keyword matching on the description
+                # would pick up words from the embedded goal ("Build …")
+                step.agent_name = role_mapping.get(step.step_type, "")
             if not step.agent_name:
                 desc_lower = step.description.lower()
                 for keyword, agent in role_mapping.items():
@@ -204,69 +445,120 @@ class PrefrontalCortex:
         return steps
 
     def _determine_dependencies(self, steps: list[PlanStep]) -> list[PlanStep]:
-        """Determine sequential dependencies."""
-        for i in range(1, len(steps)):
-            steps[i].dependencies = [steps[i - 1].id]
+        """
+        Derive DAG dependencies from step types.
+
+        Each step waits only for the steps of its prerequisite types (see
+        STEP_PREREQUISITES), so e.g. tests and docs both follow the
+        implementation and run side by side.
+        """
+        by_type: dict[str, list[str]] = {}
+        for step in steps:
+            by_type.setdefault(step.step_type, []).append(step.id)
+
+        def resolve(step_type: str, seen: frozenset = frozenset()) -> list[str]:
+            if step_type in by_type:
+                return by_type[step_type]
+            if step_type in seen:
+                return []
+            ids: list[str] = []
+            for prerequisite in STEP_PREREQUISITES.get(step_type, ()):
+                ids.extend(resolve(prerequisite, seen | {step_type}))
+            return ids
+
+        for step in steps:
+            dependencies: list[str] = []
+            for prerequisite in STEP_PREREQUISITES.get(step.step_type, ()):
+                dependencies.extend(resolve(prerequisite, frozenset({step.step_type})))
+            step.dependencies = list(dict.fromkeys(d for d in dependencies if d != step.id))
         return steps
 
     def _estimate_durations(self, steps: list[PlanStep], context: PlanningContext) -> list[PlanStep]:
-        """Estimate execution duration for each step."""
+        """Estimate each step from observed (agent, step type) durations."""
         for step in steps:
-            desc_lower = step.description.lower()
-            if "analyze" in desc_lower or "review" in desc_lower:
-                step.estimated_ms = 2000.0
-            elif "design" in desc_lower or "architect" in desc_lower:
-                step.estimated_ms = 5000.0
-            elif "implement" in desc_lower or "build" in desc_lower:
-                step.estimated_ms = 10000.0
-            elif "test" in desc_lower:
-                step.estimated_ms = 5000.0
-            elif "document" in desc_lower:
-                step.estimated_ms = 3000.0
-            elif "compliance" in desc_lower:
-                step.estimated_ms = 1000.0
-            else:
-                step.estimated_ms = 5000.0
+            step.estimated_ms = self.durations.estimate(step.agent_name, step.step_type)
         return steps
 
-    async def execute_plan(self, plan: Plan) -> Plan:
-        """Execute a plan step by step, respecting dependencies."""
+    async def execute_plan(self, plan: Plan, max_concurrency: Optional[int] = None) -> Plan:
+        """
+        Execute a plan as a DAG.
+
+        Steps start as soon as all their dependencies have completed, with at
+        most max_concurrency steps in flight. A failed step blocks only the
+        steps that (transitively) depend on it; independent branches finish.
+        """
+        self._mark_activity()
         plan.status = "executing"
         start = time.perf_counter()
 
+        steps = {s.id: s for s in plan.steps}
+        dependents: dict[str, list[str]] = {step_id: [] for step_id in steps}
+        waiting: dict[str, int] = {}
         for step in plan.steps:
-            unmet = [
-                dep for dep in step.dependencies
-                if not any(s.id == dep and s.status == "completed" for s in plan.steps)
-            ]
-            if unmet:
+            unknown = [d for d in step.dependencies if d not in steps]
+            if unknown:
                 step.status = "blocked"
-                step.error = f"Unmet dependencies: {unmet}"
-                plan.status = "failed"
-                break
-
-            step.status = "executing"
-            step.started_at = datetime.now()
-            step_start = time.perf_counter()
-
-            try:
-                step.result = {"status": "completed", "agent": step.agent_name}
-                step.status = "completed"
-            except Exception as e:
-                step.status = "failed"
-                step.error = str(e)
-                plan.status = "failed"
-                logger.error(f"Step {step.id} failed: {e}")
-                break
+                step.error = f"Unknown dependencies: {unknown}"
+                continue
+            waiting[step.id] = len(step.dependencies)
+            for dep in step.dependencies:
+                dependents[dep].append(step.id)
+
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        running: dict[asyncio.Task, PlanStep] = {}
+        _, rank = critical_path(plan.steps)
+
+        def launch(ready: list[PlanStep]) -> None:
+            # Longest remaining path first: the semaphore admits waiters in order
+            for step in sorted(ready, key=lambda s: -rank.get(s.id, 0.0)):
+                task = asyncio.create_task(self._run_step(plan, step, steps, semaphore))
+                running[task] = step
+
+        def block_dependents(failed: PlanStep) -> None:
+            stack = list(dependents[failed.id])
+            while stack:
+                step = steps[stack.pop()]
+                if step.status != "pending":
+                    continue
+                step.status = "blocked"
+                step.error = f"Dependency {failed.id} {failed.status}"
+                stack.extend(dependents[step.id])
 
-            step.actual_ms = (time.perf_counter() - step_start) * 1000
-            step.completed_at = datetime.now()
+        for step in plan.steps:
+            if step.status == "blocked":
+                block_dependents(step)
+        launch([s for s in plan.steps if s.status == "pending" and waiting[s.id] == 0])
+
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            ready: list[PlanStep] = []
+            for task in done:
+                step = running.pop(task)
+                if step.status != "completed":
+                    block_dependents(step)
+                    continue
+                self.durations.observe(step.agent_name, step.step_type, step.actual_ms)
+                for dependent_id in dependents[step.id]:
+                    waiting[dependent_id] -= 1
+                    dependent = steps[dependent_id]
+                    if waiting[dependent_id] == 0 and dependent.status == "pending":
+                        ready.append(dependent)
+            launch(ready)
+
+        # Anything still pending sits on a dependency cycle
+        for step in plan.steps:
+            if step.status == "pending":
+                step.status = "blocked"
+                step.error = "Dependency cycle"
 
+        plan.actual_ms = (time.perf_counter() - start) * 1000
         if all(s.status == "completed" for s in plan.steps):
             plan.status = "completed"
             plan.completed_at = datetime.now()
-
-        plan.actual_ms = (time.perf_counter() - start) * 1000
+        else:
+            plan.status = "failed"
+            # Don't hand a decomposition that just failed to the next identical goal
+            self._plan_cache.pop(plan.signature, None)
 
         if plan.status == "completed":
             self._completed_plans.append(plan)
@@ -283,9 +575,88 @@ class PrefrontalCortex:
                     metadata={"plan_id": plan.id, "steps": len(plan.steps), "duration_ms": plan.actual_ms},
                 ))
 
-        logger.info(f"Plan {plan.id} {plan.status}: {plan.progress:.0%} complete, {plan.actual_ms:.0f}ms")
+        logger.info(
+            f"Plan {plan.id} {plan.status}: {plan.progress:.0%} complete, "
+            f"{plan.actual_ms:.0f}ms (est. {plan.total_estimated_ms:.0f}ms serial)"
+        )
         return plan
 
+    async def _run_step(
+        self,
+        plan: Plan,
+        step: PlanStep,
+        steps: dict[str, PlanStep],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Run one step on its assigned agent, recording status and timing."""
+        async with semaphore:
+            step.status = "executing"
+            step.started_at = datetime.now()
+            step_start = time.perf_counter()
+
+            try:
+                step.result = await self._dispatch(plan, step, steps)
+                step.status = "completed"
+            except asyncio.CancelledError:
+                step.status = "failed"
+                step.error = "Cancelled"
+                raise
+            except Exception as e:
+                step.status = "failed"
+                step.error = str(e)
+                logger.error(f"Step {step.id} failed: {e}")
+            finally:
+                step.actual_ms = (time.perf_counter() - step_start) * 1000
+                step.completed_at = datetime.now()
+                get_metrics().observe(
+                    "cle_plan_step_ms", step.actual_ms, agent=step.agent_name, step_type=step.step_type,
+                )
+
+        logger.debug(
+            f"Step {step.id} ({step.step_type}/{step.agent_name}) {step.status}: "
+            f"{step.actual_ms:.0f}ms actual vs {step.estimated_ms:.0f}ms estimated"
+        )
+
+    async def _dispatch(self, plan: Plan, step: PlanStep, steps: dict[str, PlanStep]) -> Any:
+        """Execute a step on its registry agent. Raises on agent failure."""
+        self._mark_activity()
+        if self.registry is None:
+            return {"status": "completed", "agent": step.agent_name}
+
+        agent = self.registry.get(step.agent_name)
+        if agent is None:
+            raise LookupError(f"Agent {step.agent_name} not available")
+
+        result = await agent.execute({
+            "task": step.description,
+            "mode": self._step_mode(plan, step, agent),
+            "plan_id": plan.id,
+            "step_id": step.id,
+            "step_type": step.step_type,
+            "goal": plan.goal,
+            "dependencies": {dep: steps[dep].result for dep in step.dependencies},
+        })
+        if not result.success:
+            raise RuntimeError("; ".join(result.errors) or f"Agent {step.agent_name} failed")
+        return result.output
+
+    def _mark_activity(self) -> None:
+        """Planning and step execution are foreground work; keep the DMN out of the way."""
+        if self.dmn is not None:
+            self.dmn.mark_activity()
+
+    @staticmethod
+    def _step_mode(plan: Plan, step: PlanStep, agent) -> str:
+        """The step type's mode, else the plan's. Raises if the agent supports neither."""
+        candidates = [STEP_MODES.get(step.step_type, plan.mode), plan.mode]
+        for mode in candidates:
+            if agent.can_execute_in_mode(mode):
+                return mode
+        raise RuntimeError(
+            f"Agent {step.agent_name} cannot run {step.step_type} step in "
+            f"{' or '.join(dict.fromkeys(candidates))} mode (active modes: {', '.join(agent.active_modes)})"
+        )
+
     def get_active_plans(self) -> list[dict]:
         """Get all active plans."""
         return [
@@ -299,4 +670,24 @@ class PrefrontalCortex:
             "active_plans": len(self._active_plans),
             "completed_plans": len(self._completed_plans),
             "total_plans_created": self._plan_count,
+            "plan_cache": {
+                "size": len(self._plan_cache),
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+            },
+            "duration_models": len(self.durations.get_stats()),
         }
+
+    def get_plan_history(self, limit: int = 20) -> list[dict[str, Any]]:
+        """Recently completed plans, newest first, with estimated vs actual time."""
+        return [
+            {
+                "id": p.id,
+                "goal": p.goal,
+                "steps": len(p.steps),
+                "critical_path_ms": round(p.critical_path_ms, 2),
+                "actual_ms": round(p.actual_ms, 2),
+                "from_cache": p.from_cache,
+            }
+            for p in list(self._completed_plans)[::-1][:limit]
+        ]
@@ -14,17 +14,77 @@ Research Foundation:
 - Human brain connectome exhibits small-world properties
 
 Performance Target: +10% routing efficiency, +25% failure resilience
+
+Graph storage is an adjacency list of precomputed edge costs (2 − cosine
+similarity), so Dijkstra never recomputes a similarity. Shortest paths use a
+binary heap; all-pairs path length uses scipy.sparse.csgraph when available,
+otherwise one heap Dijkstra per source.
 """
 
+import heapq
 import logging
 import random
 import numpy as np
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional
 
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+    from scipy.sparse.csgraph import dijkstra as csgraph_dijkstra
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+INF = float("inf")
+
+
+def _connectivity(n_nodes: int, src: np.ndarray, dst: np.ndarray, failed: np.ndarray) -> float:
+    """
+    Fraction of surviving agent pairs that are still connected, from
+    connected-component sizes: Σ c(c−1)/2 over components / m(m−1)/2.
+    """
+    alive = np.ones(n_nodes, dtype=bool)
+    alive[failed] = False
+    m = int(alive.sum())
+    if m < 2:
+        return 0.0
+    keep = alive[src] & alive[dst]
+    src, dst = src[keep], dst[keep]
+
+    if SCIPY_AVAILABLE:
+        graph = csr_matrix((np.ones(len(src), dtype=np.int8), (src, dst)), shape=(n_nodes, n_nodes))
+        _, labels = connected_components(graph, directed=False)
+    else:
+        # Union-find with path halving
+        labels = np.arange(n_nodes)
+        parent = list(range(n_nodes))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for a, b in zip(src.tolist(), dst.tolist()):
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                parent[ra] = rb
+        labels = np.array([find(x) for x in range(n_nodes)])
+
+    sizes = np.bincount(labels[alive])
+    reachable = float(np.sum(sizes * (sizes - 1)) / 2)
+    return reachable / (m * (m - 1) / 2)
+
+
+def _simulate_failures(n_nodes: int, src: np.ndarray, dst: np.ndarray, failure_sets: list[np.ndarray]) -> list[float]:
+    """Connectivity for each failure set (module-level so it can run in a process pool)."""
+    return [_connectivity(n_nodes, src, dst, failed) for failed in failure_sets]
+
 
 @dataclass
 class NetworkAgent:
@@ -53,37 +113,69 @@ class SmallWorldNetwork:
 
     Usage:
         agents = [NetworkAgent(id=0, name="kbuildd", hive="kuid", concept_vector=vec)]
-        network = SmallWorldNetwork(agents, shortcut_probability=0.1)
+        network = SmallWorldNetwork(agents, shortcut_probability=0.1, seed=42)
         path = network.find_shortest_path(0, 5)
+        network.add_agent(NetworkAgent(id=9, name="ECHO", hive="kstated", concept_vector=vec2))
     """
 
-    def __init__(self, agents: list[NetworkAgent], shortcut_probability: float = 0.1):
+    SHORTCUT_CANDIDATES = 10
+    SHORTCUT_MIN_SIMILARITY = 0.8
+
+    def __init__(self, agents: list[NetworkAgent], shortcut_probability: float = 0.1, seed: Optional[int] = None):
         self.agents = {a.id: a for a in agents}
         self.shortcut_prob = shortcut_probability
-        self.adjacency_matrix = self._build_adjacency_matrix()
+        self._rng = random.Random(seed)
+        self._unit_vectors = {a.id: self._unit(a.concept_vector) for a in agents}
+        # Each agent's top-k remote candidates, best first: (agent id, similarity).
+        # Kept current on join/leave so incremental changes match a rebuild.
+        self._candidates: dict[int, list[tuple[int, float]]] = {}
+        # (lister, candidate) pairs whose shortcut roll succeeded; a shortcut
+        # lives while either side that listed the pair still holds its roll
+        self._shortcut_sides: set[tuple[int, int]] = set()
+        # adjacency[a][b] = edge cost (2 − similarity); symmetric
+        self.adjacency: dict[int, dict[int, float]] = self._build_adjacency()
         self.shortcuts = self._add_small_world_shortcuts()
-        self.clustering_coefficient = self._calculate_clustering()
-        self.characteristic_path_length = self._calculate_path_length()
-
-    def _build_adjacency_matrix(self) -> np.ndarray:
+        self._stats: dict[str, float] = {}
+
+    @property
+    def clustering_coefficient(self) -> float:
+        if "clustering" not in self._stats:
+            self._stats["clustering"] = self._calculate_clustering()
+        return self._stats["clustering"]
+
+    @property
+    def characteristic_path_length(self) -> float:
+        if "path_length" not in self._stats:
+            self._stats["path_length"] = self._calculate_path_length()
+        return self._stats["path_length"]
+
+    @staticmethod
+    def _unit(vector: np.ndarray) -> np.ndarray:
+        return vector / (np.linalg.norm(vector) + 1e-8)
+
+    def _add_edge(self, id1: int, id2: int) -> None:
+        if id2 in self.adjacency[id1]:
+            return
+        cost = 2.0 - self._calculate_edge_weight(id1, id2)
+        self.adjacency[id1][id2] = cost
+        self.adjacency[id2][id1] = cost
+
+    def _build_adjacency(self) -> dict[int, dict[int, float]]:
         """Build connectivity from hive hierarchy + within-hive full connectivity."""
-        n = max(self.agents.keys()) + 1 if self.agents else 0
-        matrix = np.zeros((n, n))
+        self.adjacency = {aid: {} for aid in self.agents}
 
         for agent in self.agents.values():
             for sub_id in agent.subordinates:
-                if sub_id in self.agents:
-                    matrix[agent.id][sub_id] = 1.0
-                    matrix[sub_id][agent.id] = 1.0
+                if sub_id in self.agents and sub_id != agent.id:
+                    self._add_edge(agent.id, sub_id)
 
         hives = self._group_by_hive()
         for hive_name, members in hives.items():
             for i, a1 in enumerate(members):
                 for a2 in members[i + 1:]:
-                    matrix[a1.id][a2.id] = 1.0
-                    matrix[a2.id][a1.id] = 1.0
+                    self._add_edge(a1.id, a2.id)
 
-        return matrix
+        return self.adjacency
 
     def _group_by_hive(self) -> dict[str, list[NetworkAgent]]:
         hives: dict[str, list[NetworkAgent]] = defaultdict(list)
@@ -91,92 +183,283 @@ class SmallWorldNetwork:
             hives[agent.hive].append(agent)
         return dict(hives)
 
+    def _remote_candidates(self, ids: list[int]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Similarity of every agent in ids to every agent, with same-hive pairs
+        (and self) masked out, plus each row's top-k column indices, best first.
+        """
+        all_ids = list(self.agents)
+        position = {aid: i for i, aid in enumerate(all_ids)}
+        unit = np.stack([self._unit_vectors[aid] for aid in all_ids])
+        rows = unit[[position[aid] for aid in ids]]
+        similarity = rows @ unit.T
+
+        hives = np.array([self.agents[aid].hive for aid in all_ids])
+        row_hives = np.array([self.agents[aid].hive for aid in ids])
+        similarity[row_hives[:, None] == hives[None, :]] = -np.inf
+
+        k = self._candidate_count()
+        if k == 0:
+            return similarity, np.zeros((len(ids), 0), dtype=np.int64)
+        top = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+        order = np.argsort(-np.take_along_axis(similarity, top, axis=1), axis=1, kind="stable")
+        return similarity, np.take_along_axis(top, order, axis=1)
+
+    def _candidate_count(self) -> int:
+        return min(self.SHORTCUT_CANDIDATES, max(len(self.agents) - 1, 0))
+
+    def _try_shortcut(self, id1: int, id2: int, similarity: float, shortcuts: dict[tuple[int, int], float]) -> None:
+        """Roll for a shortcut on behalf of id1, which lists id2 among its candidates."""
+        if self._are_connected(id1, id2) and (id1, id2) not in shortcuts:
+            return  # hive or hierarchy edge
+        if similarity > self.SHORTCUT_MIN_SIMILARITY and self._rng.random() < self.shortcut_prob:
+            self._shortcut_sides.add((id1, id2))
+            shortcuts[(id1, id2)] = similarity
+            shortcuts[(id2, id1)] = similarity
+            self._add_edge(id1, id2)
+
     def _add_small_world_shortcuts(self) -> dict[tuple[int, int], float]:
-        shortcuts = {}
-        for a1 in self.agents.values():
-            similar = self._find_similar_remote_agents(a1, top_k=10)
-            for a2, similarity in similar:
-                if not self._are_connected(a1.id, a2.id):
-                    if similarity > 0.8 and random.random() < self.shortcut_prob:
-                        shortcuts[(a1.id, a2.id)] = similarity
-                        shortcuts[(a2.id, a1.id)] = similarity
-                        self.adjacency_matrix[a1.id][a2.id] = 1.0
-                        self.adjacency_matrix[a2.id][a1.id] = 1.0
+        """Long-range shortcuts from one masked similarity matrix and argpartition top-k."""
+        shortcuts: dict[tuple[int, int], float] = {}
+        ids = list(self.agents)
+        if len(ids) < 2:
+            return shortcuts
+        similarity, top = self._remote_candidates(ids)
+        for row, a1 in enumerate(ids):
+            candidates = [(ids[col], float(similarity[row, col])) for col in top[row]]
+            candidates = [(a2, sim) for a2, sim in candidates if sim > -np.inf]
+            self._candidates[a1] = candidates
+            for a2, sim in candidates:
+                self._try_shortcut(a1, a2, sim, shortcuts)
         logger.info(f"Added {len(shortcuts) // 2} small-world shortcuts")
         return shortcuts
 
-    def _find_similar_remote_agents(self, agent: NetworkAgent, top_k: int = 10) -> list[tuple[NetworkAgent, float]]:
-        similarities = []
+    # ========================================================
+    # Incremental membership
+    # ========================================================
+
+    def add_agent(self, agent: NetworkAgent) -> None:
+        """
+        Join an agent without rebuilding: hive/hierarchy edges, then shortcut
+        candidates from one similarity row — its own top-k remote agents plus
+        every agent whose top-k it now enters. Candidates it pushes out of
+        another agent's top-k lose their shortcut unless still a candidate
+        from the other side, so the result matches a rebuild.
+        """
+        if agent.id in self.agents:
+            self.remove_agent(agent.id)
+        self.agents[agent.id] = agent
+        self._unit_vectors[agent.id] = self._unit(agent.concept_vector)
+        self.adjacency[agent.id] = {}
+
         for other in self.agents.values():
-            if other.id == agent.id or other.hive == agent.hive:
+            if other.id == agent.id:
                 continue
-            sim = self._cosine_similarity(agent.concept_vector, other.concept_vector)
-            similarities.append((other, sim))
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
-
-    def _cosine_similarity(self, v1: np.ndarray, v2: np.ndarray) -> float:
-        return float(np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2) + 1e-8))
+            if other.hive == agent.hive or other.id in agent.subordinates or agent.id in other.subordinates:
+                self._add_edge(agent.id, other.id)
+
+        ids = list(self.agents)
+        similarity, top = self._remote_candidates([agent.id])
+        row = similarity[0]
+        own = [(ids[col], float(row[col])) for col in top[0] if row[col] > -np.inf]
+        self._candidates[agent.id] = own
+
+        k = self._candidate_count()
+        entered: list[tuple[int, float]] = []
+        for col, other_id in enumerate(ids):
+            sim = float(row[col])
+            if sim == -np.inf:
+                continue
+            candidates = self._candidates.setdefault(other_id, [])
+            if len(candidates) >= k and sim <= candidates[-1][1]:
+                continue
+            candidates.append((agent.id, sim))
+            candidates.sort(key=lambda c: -c[1])
+            if len(candidates) > k:
+                displaced, _ = candidates.pop()
+                self._drop_stale_shortcut(other_id, displaced)
+            entered.append((other_id, sim))
+
+        # A rebuild rolls each pair once per side that lists it
+        for other_id, sim in own:
+            self._try_shortcut(agent.id, other_id, sim, self.shortcuts)
+        for other_id, sim in entered:
+            self._try_shortcut(other_id, agent.id, sim, self.shortcuts)
+
+        self._stats.clear()
+
+    def remove_agent(self, agent_id: int) -> None:
+        """
+        Leave without rebuilding: drop the agent's edges and shortcuts, then
+        refill the top-k of every agent that listed it (one similarity block)
+        and try the candidates that move up.
+        """
+        if agent_id not in self.agents:
+            return
+        affected = [
+            aid for aid, candidates in self._candidates.items()
+            if aid != agent_id and any(c == agent_id for c, _ in candidates)
+        ]
+        for neighbor_id in self.adjacency.pop(agent_id, {}):
+            self.adjacency[neighbor_id].pop(agent_id, None)
+            self.shortcuts.pop((agent_id, neighbor_id), None)
+            self.shortcuts.pop((neighbor_id, agent_id), None)
+        del self.agents[agent_id]
+        self._unit_vectors.pop(agent_id, None)
+        self._candidates.pop(agent_id, None)
+        self._shortcut_sides = {side for side in self._shortcut_sides if agent_id not in side}
+
+        if affected:
+            ids = list(self.agents)
+            similarity, top = self._remote_candidates(affected)
+            for row, aid in enumerate(affected):
+                previous = {c for c, _ in self._candidates.get(aid, [])}
+                candidates = [(ids[col], float(similarity[row, col])) for col in top[row] if similarity[row, col] > -np.inf]
+                self._candidates[aid] = candidates
+                for other_id, sim in candidates:
+                    if other_id not in previous:
+                        self._try_shortcut(aid, other_id, sim, self.shortcuts)
+        self._stats.clear()
+
+    def _drop_stale_shortcut(self, id1: int, id2: int) -> None:
+        """id1 no longer lists id2: withdraw its roll; drop the shortcut if id2's side holds none."""
+        self._shortcut_sides.discard((id1, id2))
+        if (id1, id2) not in self.shortcuts or (id2, id1) in self._shortcut_sides:
+            return
+        del self.shortcuts[(id1, id2)]
+        del self.shortcuts[(id2, id1)]
+        self.adjacency[id1].pop(id2, None)
+        self.adjacency[id2].pop(id1, None)
 
     def _are_connected(self, id1: int, id2: int) -> bool:
-        return self.adjacency_matrix[id1][id2] > 0
-
-    def find_shortest_path(self, source_id: int, target_id: int) -> NetworkPath:
-        """Use Dijkstra's algorithm with concept-vector-weighted edges."""
-        if source_id not in self.agents or target_id not in self.agents:
-            return NetworkPath([], float("inf"), 0, False, 0.0)
-
-        distances: dict[int, float] = {aid: float("inf") for aid in self.agents}
-        distances[source_id] = 0.0
+        return id2 in self.adjacency.get(id1, {})
+
+    def _dijkstra(
+        self,
+        source_id: int,
+        target_id: Optional[int] = None,
+        exclude: frozenset[int] = frozenset(),
+    ) -> tuple[dict[int, float], dict[int, int], dict[int, int]]:
+        """
+        Binary-heap Dijkstra from source. Stops early once target is settled.
+        Nodes in exclude are treated as removed from the graph.
+
+        Returns (distances, previous, hops) for every settled/reached node.
+        """
+        distances = {source_id: 0.0}
         previous: dict[int, int] = {}
-        unvisited = set(self.agents.keys())
+        hops = {source_id: 0}
+        settled: set[int] = set()
+        heap = [(0.0, source_id)]
 
-        while unvisited:
-            current = min(unvisited, key=lambda x: distances[x])
+        while heap:
+            dist, current = heapq.heappop(heap)
+            if current in settled:
+                continue
+            settled.add(current)
             if current == target_id:
                 break
-            if distances[current] == float("inf"):
-                break
-            unvisited.remove(current)
-
-            for neighbor_id in self._get_neighbors(current):
-                if neighbor_id in unvisited:
-                    similarity = self._calculate_edge_weight(current, neighbor_id)
-                    distance = distances[current] + (2.0 - similarity)
-                    if distance < distances[neighbor_id]:
-                        distances[neighbor_id] = distance
-                        previous[neighbor_id] = current
-
-        if distances[target_id] == float("inf"):
-            return NetworkPath([], float("inf"), 0, False, 0.0)
-
-        path_agents = []
-        current = target_id
-        while current in previous:
-            path_agents.append(self.agents[current])
-            current = previous[current]
-        path_agents.append(self.agents[source_id])
-        path_agents.reverse()
-
+            for neighbor_id, cost in self.adjacency[current].items():
+                if neighbor_id in settled or neighbor_id in exclude:
+                    continue
+                distance = dist + cost
+                if distance < distances.get(neighbor_id, INF):
+                    distances[neighbor_id] = distance
+                    previous[neighbor_id] = current
+                    hops[neighbor_id] = hops[current] + 1
+                    heapq.heappush(heap, (distance, neighbor_id))
+
+        return distances, previous, hops
+
+    def _build_path(self, node_ids: list[int], total_distance: float) -> NetworkPath:
+        path_agents = [self.agents[aid] for aid in node_ids]
         uses_shortcuts = any(
             (path_agents[i].id, path_agents[i + 1].id) in self.shortcuts
             for i in range(len(path_agents) - 1)
         )
-        reliability = self._calculate_path_reliability(path_agents)
-
         return NetworkPath(
             agents=path_agents,
-            total_distance=distances[target_id],
+            total_distance=total_distance,
             hop_count=len(path_agents) - 1,
             uses_shortcuts=uses_shortcuts,
-            reliability=reliability,
+            reliability=self._calculate_path_reliability(path_agents),
         )
 
+    def find_shortest_path(
+        self, source_id: int, target_id: int, exclude: Optional[set[int]] = None,
+    ) -> NetworkPath:
+        """Use Dijkstra's algorithm with concept-vector-weighted edges."""
+        if source_id not in self.agents or target_id not in self.agents:
+            return NetworkPath([], INF, 0, False, 0.0)
+
+        distances, previous, _ = self._dijkstra(source_id, target_id, frozenset(exclude or ()))
+        if target_id not in distances:
+            return NetworkPath([], INF, 0, False, 0.0)
+
+        node_ids = [target_id]
+        while node_ids[-1] in previous:
+            node_ids.append(previous[node_ids[-1]])
+        node_ids.reverse()
+        return self._build_path(node_ids, distances[target_id])
+
+    def find_shortest_path_bidirectional(
+        self, source_id: int, target_id: int, exclude: Optional[set[int]] = None,
+    ) -> NetworkPath:
+        """
+        Bidirectional Dijkstra: search from both ends and stop when the two
+        frontiers can no longer improve the best meeting point. Settles far
+        fewer nodes than one-sided search on large rosters.
+        """
+        if source_id not in self.agents or target_id not in self.agents:
+            return NetworkPath([], INF, 0, False, 0.0)
+        if source_id == target_id:
+            return self._build_path([source_id], 0.0)
+
+        excluded = frozenset(exclude or ())
+        dist = ({source_id: 0.0}, {target_id: 0.0})
+        prev: tuple[dict[int, int], dict[int, int]] = ({}, {})
+        settled: tuple[set[int], set[int]] = (set(), set())
+        heaps = ([(0.0, source_id)], [(0.0, target_id)])
+        best, meeting = INF, None
+
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            d, current = heapq.heappop(heaps[side])
+            if current in settled[side]:
+                continue
+            settled[side].add(current)
+            for neighbor_id, cost in self.adjacency[current].items():
+                if neighbor_id in excluded or neighbor_id in settled[side]:
+                    continue
+                distance = d + cost
+                if distance < dist[side].get(neighbor_id, INF):
+                    dist[side][neighbor_id] = distance
+                    prev[side][neighbor_id] = current
+                    heapq.heappush(heaps[side], (distance, neighbor_id))
+                other = dist[1 - side].get(neighbor_id)
+                if other is not None and distance + other < best:
+                    best, meeting = distance + other, neighbor_id
+
+        if meeting is None:
+            return NetworkPath([], INF, 0, False, 0.0)
+
+        forward = [meeting]
+        while forward[-1] in prev[0]:
+            forward.append(prev[0][forward[-1]])
+        forward.reverse()
+        node = meeting
+        while node in prev[1]:
+            node = prev[1][node]
+            forward.append(node)
+        return self._build_path(forward, best)
+
     def _get_neighbors(self, agent_id: int) -> list[int]:
-        return [oid for oid in self.agents if self.adjacency_matrix[agent_id][oid] > 0]
+        return list(self.adjacency.get(agent_id, {}))
 
     def _calculate_edge_weight(self, id1: int, id2: int) -> float:
-        return self._cosine_similarity(self.agents[id1].concept_vector, self.agents[id2].concept_vector)
+        return float(np.dot(self._unit_vectors[id1], self._unit_vectors[id2]))
 
     def _calculate_path_reliability(self, path: list[NetworkAgent]) -> float:
         agent_reliability = 0.99
@@ -186,86 +469,114 @@ class SmallWorldNetwork:
     def find_redundant_paths(self, source_id: int, target_id: int, k: int = 3) -> list[NetworkPath]:
         """Find k node-disjoint paths for fault tolerance."""
         paths = []
-        original_matrix = self.adjacency_matrix.copy()
+        excluded: set[int] = set()
 
         for _ in range(k):
-            path = self.find_shortest_path(source_id, target_id)
-            if not path.agents or path.total_distance == float("inf"):
+            path = self.find_shortest_path(source_id, target_id, exclude=excluded)
+            if not path.agents or path.total_distance == INF:
                 break
             paths.append(path)
-            for agent in path.agents[1:-1]:
-                self.adjacency_matrix[agent.id, :] = 0
-                self.adjacency_matrix[:, agent.id] = 0
+            excluded.update(agent.id for agent in path.agents[1:-1])
+            if path.hop_count == 1:
+                break  # direct edge; every further "disjoint" path would repeat it
 
-        self.adjacency_matrix = original_matrix
         return paths
 
-    def calculate_network_resilience(self, n_simulations: int = 100, failure_rate: float = 0.2) -> float:
-        connectivity_scores = []
-        agent_ids = list(self.agents.keys())
-        n_to_fail = max(1, int(len(agent_ids) * failure_rate))
-
-        for _ in range(n_simulations):
-            failed = random.sample(agent_ids, min(n_to_fail, len(agent_ids)))
-            connectivity = self._calculate_connectivity(exclude=failed)
-            connectivity_scores.append(connectivity)
+    def _edge_arrays(self) -> tuple[list[int], np.ndarray, np.ndarray]:
+        """Agent IDs plus (src, dst) index arrays, each undirected edge once."""
+        ids = list(self.agents)
+        index = {aid: i for i, aid in enumerate(ids)}
+        pairs = [(index[a], index[b]) for a, neighbors in self.adjacency.items() for b in neighbors if a < b]
+        edges = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+        return ids, edges[:, 0], edges[:, 1]
+
+    def calculate_network_resilience(
+        self,
+        n_simulations: int = 100,
+        failure_rate: float = 0.2,
+        seed: Optional[int] = None,
+        processes: Optional[int] = None,
+    ) -> float:
+        """
+        Mean connectivity after randomly failing failure_rate of the agents.
+
+        Failure sets are drawn up front from a seeded RNG, so results are
+        reproducible regardless of how simulations are split. processes > 1
+        spreads simulations across a process pool.
+        """
+        ids, src, dst = self._edge_arrays()
+        n = len(ids)
+        if n == 0:
+            return 0.0
+        n_to_fail = min(max(1, int(n * failure_rate)), n)
+        rng = np.random.default_rng(seed)
+        failure_sets = [rng.choice(n, n_to_fail, replace=False) for _ in range(n_simulations)]
+
+        if processes and processes > 1 and n_simulations > processes:
+            chunks = [failure_sets[i::processes] for i in range(processes)]
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                futures = [pool.submit(_simulate_failures, n, src, dst, chunk) for chunk in chunks]
+                connectivity_scores = [score for f in futures for score in f.result()]
+        else:
+            connectivity_scores = _simulate_failures(n, src, dst, failure_sets)
 
         return float(np.mean(connectivity_scores))
 
     def _calculate_connectivity(self, exclude: Optional[list[int]] = None) -> float:
-        if exclude is None:
-            exclude = []
-        active = [aid for aid in self.agents if aid not in exclude]
-        if len(active) < 2:
-            return 0.0
-
-        reachable = 0
-        total = 0
-        for i, a1 in enumerate(active):
-            for a2 in active[i + 1:]:
-                total += 1
-                if self._path_exists_avoiding(a1, a2, exclude):
-                    reachable += 1
-
-        return reachable / total if total > 0 else 0.0
-
-    def _path_exists_avoiding(self, source: int, target: int, avoid: list[int]) -> bool:
-        visited = set(avoid)
-        queue = [source]
-        visited.add(source)
-        while queue:
-            current = queue.pop(0)
-            if current == target:
-                return True
-            for neighbor in self._get_neighbors(current):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
-        return False
+        ids, src, dst = self._edge_arrays()
+        index = {aid: i for i, aid in enumerate(ids)}
+        failed = np.array([index[aid] for aid in (exclude or []) if aid in index], dtype=np.int64)
+        return _connectivity(len(ids), src, dst, failed)
 
     def _calculate_clustering(self) -> float:
         coefficients = []
-        for agent_id in self.agents:
-            neighbors = self._get_neighbors(agent_id)
+        for agent_id, neighbors in self.adjacency.items():
             if len(neighbors) < 2:
                 continue
-            edges = 0
-            for i, n1 in enumerate(neighbors):
-                for n2 in neighbors[i + 1:]:
-                    if self._are_connected(n1, n2):
-                        edges += 1
+            # Each edge among neighbours is seen from both ends
+            edges = sum(len(neighbors.keys() & self.adjacency[n].keys()) for n in neighbors) / 2
             max_edges = len(neighbors) * (len(neighbors) - 1) / 2
             coefficients.append(edges / max_edges if max_edges > 0 else 0)
         return float(np.mean(coefficients)) if coefficients else 0.0
 
+    def all_pairs_hop_counts(self) -> dict[int, dict[int, int]]:
+        """Hop count of the weighted shortest path between every reachable pair."""
+        if SCIPY_AVAILABLE and len(self.agents) > 1:
+            return self._all_pairs_hops_scipy()
+        return {source: self._dijkstra(source)[2] for source in self.agents}
+
+    def _all_pairs_hops_scipy(self) -> dict[int, dict[int, int]]:
+        ids = list(self.agents)
+        index = {aid: i for i, aid in enumerate(ids)}
+        rows, cols, costs = [], [], []
+        for a, neighbors in self.adjacency.items():
+            for b, cost in neighbors.items():
+                rows.append(index[a])
+                cols.append(index[b])
+                costs.append(cost)
+        graph = csr_matrix((costs, (rows, cols)), shape=(len(ids), len(ids)))
+        distances, predecessors = csgraph_dijkstra(graph, directed=False, return_predecessors=True)
+
+        result: dict[int, dict[int, int]] = {}
+        for i, source in enumerate(ids):
+            hops = np.full(len(ids), -1)
+            hops[i] = 0
+            # Settle in distance order so each predecessor's hop count is known
+            for j in np.argsort(distances[i]):
+                if hops[j] < 0 and np.isfinite(distances[i, j]):
+                    hops[j] = hops[predecessors[i, j]] + 1
+            result[source] = {ids[j]: int(h) for j, h in enumerate(hops) if h >= 0}
+        return result
+
     def _calculate_path_length(self) -> float:
-        path_lengths = []
-        agent_ids = list(self.agents.keys())
-        for i, source in enumerate(agent_ids):
-            for target in agent_ids[i + 1:]:
-                path = self.find_shortest_path(source, target)
-                if path.total_distance < float("inf"):
-                    path_lengths.append(path.hop_count)
+        hop_counts = self.all_pairs_hop_counts()
+        # Unordered pairs: count each (source, target) once
+        path_lengths = [
+            hops
+            for source, targets in hop_counts.items()
+            for target, hops in targets.items()
+            if target > source
+        ]
         return float(np.mean(path_lengths)) if path_lengths else 0.0
 
     def is_small_world(self) -> bool:
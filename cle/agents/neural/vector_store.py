@@ -0,0 +1,194 @@
+"""
+Creative Liberation Engine v5 — Concept Vector Store
+
+Single append-only, memory-mapped store for versioned agent vectors:
+  vectors.f32          raw float32 rows, appended, never rewritten
+  vectors.index.json   (agent, version) → row, sha256, timestamp, metadata
+
+Writes append rows to the data file and become visible only when commit()
+atomically replaces the index (write temp file + os.replace). Rows past the
+committed count are uncommitted and are truncated away on the next append.
+Reads memory-map the data file once; a row is only paged in when accessed.
+
+Replaces one .npy + .json pair per agent per save (and a directory glob per
+load) in ConceptVectorEngine.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import numpy as np
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DATA_FILE = "vectors.f32"
+INDEX_FILE = "vectors.index.json"
+
+
+class VectorStore:
+    """
+    Append-only memory-mapped vector store with an atomic index.
+
+    Usage:
+        store = VectorStore("data/vectors", dim=2048)
+        sha = store.append("kbuildd", vector, metadata={...})
+        store.commit()
+        vector = store.get("kbuildd")               # latest version, lazy row view
+        vector = store.get("kbuildd", "20260301_120000")
+    """
+
+    def __init__(self, root: str | Path, dim: int):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.dim = dim
+        self.data_path = self.root / DATA_FILE
+        self.index_path = self.root / INDEX_FILE
+
+        self._entries: dict[tuple[str, str], dict[str, Any]] = {}
+        self._latest: dict[str, str] = {}
+        self._staged: list[dict[str, Any]] = []
+        self._committed_rows = 0
+        self._rows = 0
+        self._mmap: Optional[np.memmap] = None
+        self._mmap_rows = 0
+        self._load_index()
+
+    # --------------------------------------------------------
+    # Index
+    # --------------------------------------------------------
+
+    def _load_index(self) -> None:
+        if not self.index_path.exists():
+            return
+        with open(self.index_path) as f:
+            index = json.load(f)
+        if index.get("dim", self.dim) != self.dim:
+            raise ValueError(f"Vector store at {self.root} has dim {index['dim']}, expected {self.dim}")
+        for entry in index.get("entries", []):
+            self._entries[(entry["agent"], entry["version"])] = entry
+        self._latest = dict(index.get("latest", {}))
+        self._committed_rows = self._rows = int(index.get("rows", 0))
+
+    def commit(self) -> None:
+        """Make appended rows visible: fsync data, then atomically replace the index."""
+        if not self._staged and self.index_path.exists():
+            return
+        if self.data_path.exists():
+            with open(self.data_path, "rb+") as f:
+                os.fsync(f.fileno())
+        entries = dict(self._entries)
+        latest = dict(self._latest)
+        for entry in self._staged:
+            entries[(entry["agent"], entry["version"])] = entry
+            latest[entry["agent"]] = entry["version"]
+        index = {
+            "dim": self.dim,
+            "rows": self._rows,
+            "latest": latest,
+            "entries": list(entries.values()),
+        }
+        tmp = self.index_path.with_suffix(".json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(index, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.index_path)
+        self._entries, self._latest = entries, latest
+        self._staged = []
+        self._committed_rows = self._rows
+
+    # --------------------------------------------------------
+    # Writes
+    # --------------------------------------------------------
+
+    def _version_for(self, agent: str) -> str:
+        version = datetime.now().strftime("%Y%m%d_%H%M%S")
+        taken = set(self._entries) | {(e["agent"], e["version"]) for e in self._staged}
+        candidate, n = version, 1
+        while (agent, candidate) in taken:
+            n += 1
+            candidate = f"{version}_{n}"
+        return candidate
+
+    def append(
+        self,
+        agent: str,
+        vector: np.ndarray,
+        metadata: Optional[dict] = None,
+        version: Optional[str] = None,
+    ) -> str:
+        """Stage a new version of an agent's vector. Returns its sha256. Call commit() to publish."""
+        row_data = np.ascontiguousarray(vector, dtype=np.float32).reshape(-1)
+        if row_data.shape[0] != self.dim:
+            raise ValueError(f"Vector for {agent} has dim {row_data.shape[0]}, expected {self.dim}")
+
+        row_bytes = self.dim * 4
+        with open(self.data_path, "ab") as f:
+            # Drop anything written after the last commit (crash or abandoned batch)
+            if not self._staged and f.tell() != self._committed_rows * row_bytes:
+                f.truncate(self._committed_rows * row_bytes)
+            f.write(row_data.tobytes())
+
+        sha256 = hashlib.sha256(row_data.tobytes()).hexdigest()
+        version = version or self._version_for(agent)
+        self._staged.append({
+            "agent": agent,
+            "version": version,
+            "row": self._rows,
+            "sha256": sha256,
+            "timestamp": datetime.now().isoformat(),
+            "metadata": metadata or {},
+        })
+        self._rows += 1
+        return sha256
+
+    # --------------------------------------------------------
+    # Reads
+    # --------------------------------------------------------
+
+    def _matrix(self) -> np.ndarray:
+        """Memory-map of all committed rows (remapped only when the store grows)."""
+        if self._mmap is None or self._mmap_rows != self._committed_rows:
+            if self._committed_rows == 0:
+                return np.zeros((0, self.dim), dtype=np.float32)
+            self._mmap = np.memmap(
+                self.data_path, dtype=np.float32, mode="r", shape=(self._committed_rows, self.dim),
+            )
+            self._mmap_rows = self._committed_rows
+        return self._mmap
+
+    def entry(self, agent: str, version: Optional[str] = None) -> dict[str, Any]:
+        """Index entry for an agent version (latest by default). Raises KeyError."""
+        version = version or self._latest[agent]
+        return self._entries[(agent, version)]
+
+    def get(self, agent: str, version: Optional[str] = None, verify: bool = False) -> np.ndarray:
+        """Row view for an agent version (latest by default). Raises KeyError if absent."""
+        entry = self.entry(agent, version)
+        row = self._matrix()[entry["row"]]
+        if verify and hashlib.sha256(row.tobytes()).hexdigest() != entry["sha256"]:
+            raise ValueError(f"SHA mismatch for {agent}@{entry['version']}")
+        return row
+
+    def agents(self) -> list[str]:
+        """Agents with at least one committed version."""
+        return list(self._latest)
+
+    def versions(self, agent: str) -> list[str]:
+        return sorted(v for a, v in self._entries if a == agent)
+
+    def __contains__(self, agent: str) -> bool:
+        return agent in self._latest
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "path": str(self.root),
+            "rows": self._committed_rows,
+            "pending": len(self._staged),
+            "agents": len(self._latest),
+            "size_bytes": self.data_path.stat().st_size if self.data_path.exists() else 0,
+        }
@@ -4,14 +4,23 @@ Creative Liberation Engine v5 — Agent Registry
 Dynamic agent discovery, loading, and management.
 Agents register themselves; the registry provides lookup by name, hive, or role.
 
-Lineage: v4 orchestrator/skills_registry.py → v5 (simplified, tier-aware)
+Agents can also be indexed from a declarative manifest (see cle.agents.manifest)
+without importing their modules. A manifest agent is materialized — imported,
+activated, and registered — the first time it is looked up, or ahead of time
+by an optional background warm-up.
+
+Lineage: v4 orchestrator/skills_registry.py → v5 (simplified, tier-aware, lazy)
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
 from cle.agents.base import CLEAgent
 
+if TYPE_CHECKING:
+    from cle.agents.manifest import AgentManifestEntry
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,14 +31,16 @@ class AgentRegistry:
     Usage:
         registry = AgentRegistry()
         registry.register(kbuildd)
-        registry.register(kuid)
+        registry.register_manifest(AGENT_MANIFEST)  # indexed, not imported
 
-        agent = registry.get("kbuildd")
+        agent = registry.get("kbuildd")             # imported on first use
         aurora_agents = registry.by_hive("kuid")
+        await registry.warm_up()                    # optional: import the rest
     """
 
     def __init__(self):
         self._agents: dict[str, CLEAgent] = {}
+        self._manifest: dict[str, "AgentManifestEntry"] = {}
 
     def register(self, agent: CLEAgent) -> None:
         """Register an agent."""
@@ -39,44 +50,123 @@ class AgentRegistry:
         agent.activate()
         logger.info(f"Registered agent: {agent}")
 
+    def register_manifest(self, entries: Iterable["AgentManifestEntry"]) -> None:
+        """Index manifest entries without importing their modules."""
+        for entry in entries:
+            if entry.name in self._agents:
+                continue
+            self._manifest[entry.name] = entry
+        logger.info(f"Indexed {len(self._manifest)} agents from manifest")
+
     def unregister(self, name: str) -> None:
         """Remove an agent from the registry."""
+        self._manifest.pop(name, None)
         if name in self._agents:
             self._agents[name].deactivate()
             del self._agents[name]
 
+    def _materialize(self, name: str) -> Optional[CLEAgent]:
+        """Import a manifest agent and register it. Unimportable agents are dropped."""
+        entry = self._manifest.get(name)
+        if entry is None:
+            return None
+        try:
+            agent = entry.load()
+        except (ImportError, AttributeError) as e:
+            logger.debug(f"Agent {name} not available ({entry.import_path}): {e}")
+            del self._manifest[name]
+            return None
+
+        mismatches = [
+            f"{field}={getattr(agent, field)!r} (manifest {getattr(entry, field)!r})"
+            for field in ("name", "hive", "role")
+            if getattr(agent, field) != getattr(entry, field)
+        ]
+        if set(agent.active_modes) != set(entry.active_modes):
+            mismatches.append(f"active_modes={agent.active_modes!r} (manifest {list(entry.active_modes)!r})")
+        if mismatches:
+            logger.warning(f"Manifest entry for {name} is out of date: {', '.join(mismatches)}")
+
+        del self._manifest[name]
+        self.register(agent)
+        return agent
+
     def get(self, name: str) -> Optional[CLEAgent]:
-        """Get agent by name."""
-        return self._agents.get(name)
+        """Get agent by name, importing it from the manifest on first use."""
+        agent = self._agents.get(name)
+        if agent is None and name in self._manifest:
+            agent = self._materialize(name)
+        return agent
+
+    def peek(self, name: str) -> Optional[Union[CLEAgent, "AgentManifestEntry"]]:
+        """
+        Get an agent's metadata without importing it: the loaded agent if there
+        is one, otherwise its manifest entry. Both expose name, hive, role,
+        active_modes and can_execute_in_mode().
+        """
+        return self._agents.get(name) or self._manifest.get(name)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._agents
+
+    def _select(self, predicate) -> list[CLEAgent]:
+        """Filter on metadata first, then materialize only the matches."""
+        names = [name for name in self.list_all() if predicate(self.peek(name))]
+        return [a for a in (self.get(name) for name in names) if a is not None]
 
     def by_hive(self, hive: str) -> list[CLEAgent]:
         """Get all agents in a hive."""
-        return [a for a in self._agents.values() if a.hive == hive]
+        return self._select(lambda a: a.hive == hive)
 
     def by_role(self, role: str) -> list[CLEAgent]:
         """Get all agents with a specific role."""
-        return [a for a in self._agents.values() if a.role == role]
+        return self._select(lambda a: a.role == role)
 
     def by_mode(self, mode: str) -> list[CLEAgent]:
         """Get all agents active in a specific mode."""
-        return [a for a in self._agents.values() if a.can_execute_in_mode(mode)]
+        return self._select(lambda a: a.can_execute_in_mode(mode))
 
     def by_tier(self, tier: str) -> list[CLEAgent]:
         """Get agents accessible to a specific tier."""
         from cle.config.tiers import AccessTier, check_agent_access
         access_tier = AccessTier(tier)
-        return [
-            a for a in self._agents.values()
-            if check_agent_access(access_tier, a.hive)
-        ]
+        return self._select(lambda a: check_agent_access(access_tier, a.hive))
 
     def list_all(self) -> list[str]:
-        """List all registered agent names."""
-        return list(self._agents.keys())
+        """List all registered agent names, loaded or not."""
+        return list(self._agents.keys()) + [n for n in self._manifest if n not in self._agents]
 
     def count(self) -> int:
+        return len(self._agents) + len(self._manifest)
+
+    def loaded_count(self) -> int:
         return len(self._agents)
 
+    async def warm_up(self, names: Optional[Iterable[str]] = None) -> int:
+        """
+        Import manifest agents in a worker thread so first requests don't pay
+        for it. Registration itself happens on the event loop. Returns the
+        number of agents materialized.
+        """
+        import importlib
+
+        pending = [n for n in (names or list(self._manifest)) if n in self._manifest]
+        loaded = 0
+        for name in pending:
+            entry = self._manifest.get(name)
+            if entry is None:
+                continue
+            try:
+                await asyncio.to_thread(importlib.import_module, entry.module)
+            except Exception as e:
+                logger.debug(f"Warm-up import of {entry.module} failed: {e}")
+            if self._materialize(name) is not None:
+                loaded += 1
+        logger.info(f"Agent warm-up complete: {loaded} materialized")
+        return loaded
+
     def get_status(self) -> list[dict]:
         """Get capabilities for all registered agents."""
-        return [a.get_capabilities() for a in self._agents.values()]
+        return [
+            {**a.get_capabilities(), "loaded": True} for a in self._agents.values()
+        ] + [e.get_capabilities() for e in self._manifest.values()]
@@ -11,19 +11,38 @@ Lineage:
 
 Backends:
   - Vector (ChromaDB) — semantic search, local-first
+  - Local vector — in-process semantic search, memory-mapped
   - Git (GitHub) — archival, versioned persistence
   - Firestore — cloud sync (optional)
+
+Queries fan out to every backend concurrently (per-backend timeout) and are
+merged with reciprocal-rank fusion; writes go to their targets concurrently,
+and writes a backend rejects are parked in a durable retry queue. Reads by ID
+and recent query results are served from bounded read-through caches that
+every write through the service invalidates.
 """
 
+import asyncio
+import json
 import logging
+import os
 import time
 import uuid
-from typing import Any, Optional
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
 
-from cle.memory.types import Memory, MemoryQuery, MemoryResult, MemoryType, MemoryBackend
+from cle.memory.types import (
+    Memory, MemoryQuery, MemoryRecord, MemoryResult, MemoryType, MemoryBackend, local_naive,
+)
 
 logger = logging.getLogger(__name__)
 
+# Consolidated memories get uuid5(namespace, source ID): re-consolidating a
+# source upserts the same semantic memory instead of adding a duplicate.
+CONSOLIDATION_NAMESPACE = uuid.UUID("5f0c3a1e-7c1b-4f6e-9b1a-c1e000000000")
+
 
 class MemoryBackendInterface:
     """Interface that all memory backends must implement."""
@@ -48,11 +67,151 @@ class MemoryBackendInterface:
         """Count total memories in this backend."""
         raise NotImplementedError
 
+    async def iter_query(self, query: MemoryQuery) -> AsyncIterator[MemoryRecord]:
+        """
+        Page through every match (query.limit is the page size).
+
+        Default: follows query() cursors. Backends override this to yield
+        records without loading content.
+        """
+        while True:
+            result = await self.query(query)
+            for memory in result.memories:
+                yield MemoryRecord.from_memory(memory, query.fields)
+            if not result.next_cursor:
+                return
+            query = query.model_copy(update={"cursor": result.next_cursor})
+
+    async def close(self) -> None:
+        """Flush pending writes and release resources. Default: nothing to do."""
+
     @property
     def backend_type(self) -> MemoryBackend:
         raise NotImplementedError
 
 
+class RetryQueue:
+    """
+    Durable queue of backend writes that failed.
+
+    Entries are JSON lines ({"backend", "op", "memory" | "memory_id"}); the
+    file is rewritten atomically after each drain. With no path the queue
+    lives in memory only.
+    """
+
+    def __init__(self, path: Optional[str | Path] = None):
+        self.path = Path(path) if path else None
+        self._entries: list[dict[str, Any]] = []
+        if self.path is not None and self.path.exists():
+            for line in self.path.read_text(encoding="utf-8").splitlines():
+                try:
+                    self._entries.append(json.loads(line))
+                except ValueError:
+                    break  # torn tail
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def push(self, entry: dict[str, Any]) -> None:
+        self._entries.append(entry)
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def take(self) -> list[dict[str, Any]]:
+        """Remove and return all entries (persisted by the following replace())."""
+        entries, self._entries = self._entries, []
+        return entries
+
+    def replace(self, entries: list[dict[str, Any]]) -> None:
+        """Put back entries that still failed, plus any pushed meanwhile, and persist."""
+        self._entries = entries + self._entries
+        if self.path is None:
+            return
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for entry in self._entries:
+                f.write(json.dumps(entry, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+
+class LRUCache:
+    """Bounded LRU map with optional TTL and hit/miss counters."""
+
+    def __init__(self, capacity: int, ttl_seconds: Optional[float] = None):
+        self.capacity = capacity
+        self.ttl_seconds = ttl_seconds
+        self._items: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: Any) -> Optional[Any]:
+        item = self._items.get(key)
+        if item is None or (self.ttl_seconds is not None and time.monotonic() - item[0] > self.ttl_seconds):
+            if item is not None:
+                del self._items[key]
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def put(self, key: Any, value: Any) -> None:
+        if self.capacity <= 0:
+            return
+        self._items[key] = (time.monotonic(), value)
+        self._items.move_to_end(key)
+        if len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def reciprocal_rank_fusion(
+    rankings: list[list[Memory]],
+    k: int = 60,
+    limit: Optional[int] = None,
+) -> list[Memory]:
+    """
+    Merge ranked lists: score(m) = sum of 1 / (k + rank) over lists containing m.
+
+    A memory returned by several backends keeps the copy from the first list
+    it appears in (callers pass the primary backend's ranking first).
+    """
+    scores: dict[str, float] = {}
+    first: dict[str, Memory] = {}
+    for ranking in rankings:
+        for rank, memory in enumerate(ranking, start=1):
+            scores[memory.id] = scores.get(memory.id, 0.0) + 1.0 / (k + rank)
+            first.setdefault(memory.id, memory)
+    fused = sorted(scores, key=scores.get, reverse=True)
+    if limit is not None:
+        fused = fused[:limit]
+    return [first[memory_id] for memory_id in fused]
+
+
 class MemoryService:
     """
     Unified Memory Service — one API for all memory operations.
@@ -70,7 +229,7 @@ class MemoryService:
             importance=0.7,
         ))
 
-        # Query
+        # Query (all backends, fused)
         result = await service.query(MemoryQuery(
             text="user preferences",
             memory_type=MemoryType.SEMANTIC,
@@ -81,12 +240,39 @@ class MemoryService:
         await service.consolidate()
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        backend_timeout: float = 2.0,
+        retry_queue_path: Optional[str | Path] = None,
+        retry_interval: float = 30.0,
+        rrf_k: int = 60,
+        cache_size: int = 1024,
+        query_cache_size: int = 256,
+        query_cache_ttl: float = 60.0,
+        consolidation_state_path: Optional[str | Path] = None,
+    ):
         self._backends: dict[MemoryBackend, MemoryBackendInterface] = {}
         self._primary: Optional[MemoryBackend] = None
         self._store_count = 0
         self._query_count = 0
 
+        self.backend_timeout = backend_timeout
+        self.retry_interval = retry_interval
+        self.rrf_k = rrf_k
+        self._retry_queue = RetryQueue(retry_queue_path)
+        self._retry_task: Optional[asyncio.Task] = None
+        self._last_retry = 0.0
+        self._backend_failures: dict[str, int] = {}
+
+        # Writes through the service invalidate both; the TTL bounds staleness
+        # from writes made directly against a backend.
+        self._memory_cache = LRUCache(cache_size, ttl_seconds=query_cache_ttl)
+        self._query_cache = LRUCache(query_cache_size, ttl_seconds=query_cache_ttl)
+        self._generation = 0  # bumped on every invalidation
+
+        self.consolidation_state_path = Path(consolidation_state_path) if consolidation_state_path else None
+        self._consolidation = self._load_consolidation_state()
+
     def register_backend(self, backend: MemoryBackendInterface, primary: bool = False) -> None:
         """Register a memory backend."""
         self._backends[backend.backend_type] = backend
@@ -101,13 +287,31 @@ class MemoryService:
             raise RuntimeError("No memory backend registered")
         return self._backends[self._primary]
 
+    def _ordered(self, backend_types: list[MemoryBackend]) -> list[MemoryBackend]:
+        """Registered backends among backend_types, primary first."""
+        ordered = [b for b in backend_types if b in self._backends]
+        if self._primary in ordered:
+            ordered.remove(self._primary)
+            ordered.insert(0, self._primary)
+        return ordered
+
+    def _record_failure(self, backend_type: MemoryBackend, action: str, error: BaseException) -> None:
+        self._backend_failures[backend_type.value] = self._backend_failures.get(backend_type.value, 0) + 1
+        reason = "timed out" if isinstance(error, asyncio.TimeoutError) else str(error)
+        logger.error(f"Memory {action} failed on {backend_type.value}: {reason}")
+
+    async def _call(self, backend_type: MemoryBackend, method: str, *args: Any) -> Any:
+        """Call a backend method under the per-backend timeout."""
+        backend = self._backends[backend_type]
+        return await asyncio.wait_for(getattr(backend, method)(*args), timeout=self.backend_timeout)
+
     async def store(
         self,
         memory: Memory,
         backends: Optional[list[MemoryBackend]] = None,
     ) -> str:
         """
-        Store a memory to one or more backends.
+        Store a memory to one or more backends, concurrently.
 
         Args:
             memory: The memory to store
@@ -115,27 +319,87 @@ class MemoryService:
 
         Returns:
             Memory ID
+
+        A backend that fails or times out gets the write queued for retry.
         """
         if not memory.id:
             memory.id = str(uuid.uuid4())
-
-        target_backends = backends or ([self._primary] if self._primary else [])
-
-        for backend_type in target_backends:
-            if backend_type in self._backends:
-                try:
-                    await self._backends[backend_type].store(memory)
-                    logger.debug(f"Stored memory {memory.id} to {backend_type.value}")
-                except Exception as e:
-                    logger.error(f"Failed to store to {backend_type.value}: {e}")
+        self._invalidate(memory.id)
+
+        targets = self._ordered(backends or ([self._primary] if self._primary else []))
+        results = await asyncio.gather(
+            *(self._call(b, "store", memory) for b in targets),
+            return_exceptions=True,
+        )
+        # A read that ran during the write may have cached the old value
+        self._invalidate(memory.id)
+        for backend_type, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                self._record_failure(backend_type, "store", result)
+                self._retry_queue.push({
+                    "backend": backend_type.value,
+                    "op": "store",
+                    "memory": memory.model_dump(mode="json"),
+                })
+            else:
+                logger.debug(f"Stored memory {memory.id} to {backend_type.value}")
+                if backend_type == self._primary:
+                    self._note_late_episodic([memory])
 
         self._store_count += 1
+        self._maybe_retry()
         return memory.id
 
     async def store_all(self, memory: Memory) -> str:
         """Store a memory to ALL registered backends."""
         return await self.store(memory, backends=list(self._backends.keys()))
 
+    async def store_many(
+        self,
+        memories: list[Memory],
+        backends: Optional[list[MemoryBackend]] = None,
+    ) -> list[str]:
+        """
+        Store a batch of memories: one call per backend, backends concurrently.
+
+        Uses a backend's store_many() when it has one (one journal record),
+        otherwise its store() for each memory.
+        """
+        if not memories:
+            return []
+        for memory in memories:
+            if not memory.id:
+                memory.id = str(uuid.uuid4())
+        self._invalidate_many(memories)
+
+        async def write(backend_type: MemoryBackend) -> None:
+            backend = self._backends[backend_type]
+            if hasattr(backend, "store_many"):
+                await asyncio.wait_for(backend.store_many(memories), timeout=self.backend_timeout)
+            else:
+                await asyncio.wait_for(
+                    asyncio.gather(*(backend.store(m) for m in memories)), timeout=self.backend_timeout,
+                )
+
+        targets = self._ordered(backends or ([self._primary] if self._primary else []))
+        results = await asyncio.gather(*(write(b) for b in targets), return_exceptions=True)
+        self._invalidate_many(memories)
+        for backend_type, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                self._record_failure(backend_type, "store_many", result)
+                for memory in memories:
+                    self._retry_queue.push({
+                        "backend": backend_type.value,
+                        "op": "store",
+                        "memory": memory.model_dump(mode="json"),
+                    })
+            elif backend_type == self._primary:
+                self._note_late_episodic(memories)
+
+        self._store_count += len(memories)
+        self._maybe_retry()
+        return [m.id for m in memories]
+
     async def query(
         self,
         query: MemoryQuery,
@@ -146,70 +410,241 @@ class MemoryService:
 
         Args:
             query: Search query
-            backend: Specific backend to query (None = primary)
+            backend: Specific backend to query (None = all backends, fused;
+                the primary alone when query.cursor is set)
 
         Returns:
             MemoryResult with matching memories
+
+        With several backends, each is queried concurrently under the
+        per-backend timeout and the rankings are merged by reciprocal-rank
+        fusion, so latency tracks the slowest backend (capped by the timeout).
+
+        Only the first page is fused. A fused result carries the primary's
+        next_cursor and total_found; following that cursor pages through the
+        primary backend alone, so primary matches the fused page displaced
+        are not revisited. For a complete walk, page with backend=primary.
         """
         start = time.perf_counter()
-        target = backend or self._primary
-        if target is None:
+        # Cursors belong to one backend: paged queries go to the primary unless named
+        if backend is None and query.cursor:
+            backend = self._primary
+        targets = self._ordered([backend] if backend else list(self._backends))
+        if not targets:
             return MemoryResult(query=query.text, total_found=0, search_time_ms=0)
 
-        try:
-            result = await self._backends[target].query(query)
-            duration = (time.perf_counter() - start) * 1000
-            result.search_time_ms = round(duration, 2)
-            result.backend = target.value
+        cache_key = (backend, query.model_dump_json())
+        generation = self._generation
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
             self._query_count += 1
-            return result
-        except Exception as e:
-            logger.error(f"Memory query failed on {target.value}: {e}")
-            return MemoryResult(
+            return cached.model_copy(update={
+                "memories": list(cached.memories),
+                "search_time_ms": round((time.perf_counter() - start) * 1000, 2),
+            })
+
+        results = await asyncio.gather(
+            *(self._call(b, "query", query) for b in targets),
+            return_exceptions=True,
+        )
+        answered: list[tuple[MemoryBackend, MemoryResult]] = []
+        for backend_type, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                self._record_failure(backend_type, "query", result)
+            else:
+                answered.append((backend_type, result))
+
+        if len(answered) == 1:
+            result = answered[0][1]
+        else:
+            memories = reciprocal_rank_fusion(
+                [r.memories for _, r in answered], k=self.rrf_k, limit=query.limit,
+            )
+            # Paging continues on the primary (cursored queries are routed there)
+            primary = next((r for b, r in answered if b == self._primary), None)
+            result = MemoryResult(
+                memories=memories,
                 query=query.text,
-                total_found=0,
-                search_time_ms=(time.perf_counter() - start) * 1000,
-                backend=target.value,
+                total_found=primary.total_found if primary else max(
+                    (r.total_found for _, r in answered if r.total_found is not None), default=None,
+                ),
+                next_cursor=primary.next_cursor if primary else None,
             )
 
+        result.search_time_ms = round((time.perf_counter() - start) * 1000, 2)
+        result.backend = "+".join(b.value for b, _ in answered) or targets[0].value
+        self._query_count += 1
+        # Only complete answers are cached; a timed-out backend may answer next time
+        # A write that landed while the query ran makes its result stale
+        if len(answered) == len(targets) and generation == self._generation:
+            self._query_cache.put(cache_key, result.model_copy(update={"memories": list(result.memories)}))
+        return result
+
+    async def iter_query(
+        self,
+        query: MemoryQuery,
+        backend: Optional[MemoryBackend] = None,
+    ) -> AsyncIterator[MemoryRecord]:
+        """
+        Stream every match from one backend (primary by default), page by page.
+
+        query.limit is the page size. Records carry index metadata; content is
+        loaded only when a record's .content is accessed. Bypasses the caches.
+        """
+        target = backend or self._primary
+        if target is None:
+            return
+        async for record in self._backends[target].iter_query(query):
+            yield record
+
     async def get(self, memory_id: str) -> Optional[Memory]:
-        """Get a specific memory by ID from the primary backend."""
-        return await self.primary_backend.get(memory_id)
+        """Get a specific memory by ID from the primary backend (read-through cache)."""
+        cached = self._memory_cache.get(memory_id)
+        if cached is not None:
+            return cached.model_copy()
+        generation = self._generation
+        memory = await self.primary_backend.get(memory_id)
+        if memory is not None and generation == self._generation:
+            self._memory_cache.put(memory_id, memory.model_copy())
+        return memory
+
+    def _invalidate(self, memory_id: Optional[str] = None) -> None:
+        """
+        Drop a cached memory (or all) and every cached query result.
+
+        Writers call this before and after the backend write: reads that start
+        during the write see the generation change and don't cache what they got.
+        """
+        if memory_id is None:
+            self._memory_cache.clear()
+        else:
+            self._memory_cache.pop(memory_id)
+        self._query_cache.clear()
+        self._generation += 1
+
+    def _invalidate_many(self, memories: list[Memory]) -> None:
+        """_invalidate() for a batch: one generation bump for all of it."""
+        for memory in memories:
+            self._memory_cache.pop(memory.id)
+        self._query_cache.clear()
+        self._generation += 1
 
     async def delete(self, memory_id: str) -> bool:
-        """Delete a memory from all backends."""
+        """Delete a memory from all backends, concurrently."""
+        self._invalidate(memory_id)
+        targets = self._ordered(list(self._backends))
+        results = await asyncio.gather(
+            *(self._call(b, "delete", memory_id) for b in targets),
+            return_exceptions=True,
+        )
+        self._invalidate(memory_id)
         deleted = False
-        for backend in self._backends.values():
-            try:
-                if await backend.delete(memory_id):
-                    deleted = True
-            except Exception as e:
-                logger.error(f"Failed to delete from {backend.backend_type.value}: {e}")
+        for backend_type, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                self._record_failure(backend_type, "delete", result)
+                self._retry_queue.push({"backend": backend_type.value, "op": "delete", "memory_id": memory_id})
+            elif result:
+                deleted = True
         return deleted
 
-    async def consolidate(self, importance_threshold: float = 0.7) -> int:
+    # --------------------------------------------------------
+    # Retry queue
+    # --------------------------------------------------------
+
+    def _maybe_retry(self) -> None:
+        """Start a background retry pass if writes are queued and one is due."""
+        if not len(self._retry_queue) or time.monotonic() - self._last_retry < self.retry_interval:
+            return
+        if self._retry_task is None or self._retry_task.done():
+            self._retry_task = asyncio.create_task(self.retry_failed())
+
+    async def retry_failed(self) -> int:
+        """Replay queued writes. Returns how many succeeded; the rest stay queued."""
+        self._last_retry = time.monotonic()
+        entries = self._retry_queue.take()
+        remaining = []
+        succeeded = 0
+        for entry in entries:
+            backend_type = MemoryBackend(entry["backend"])
+            if backend_type not in self._backends:
+                remaining.append(entry)
+                continue
+            try:
+                if entry["op"] == "store":
+                    memory = Memory(**entry["memory"])
+                    await self._call(backend_type, "store", memory)
+                    if backend_type == self._primary:
+                        self._note_late_episodic([memory])
+                else:
+                    await self._call(backend_type, "delete", entry["memory_id"])
+                succeeded += 1
+            except Exception as e:
+                self._record_failure(backend_type, f"retry {entry['op']}", e)
+                remaining.append(entry)
+        self._retry_queue.replace(remaining)
+        if succeeded:
+            self._invalidate()
+            logger.info(f"Retried {succeeded} queued memory writes ({len(remaining)} still pending)")
+        return succeeded
+
+    async def close(self) -> None:
+        """Wait for a running retry pass and close every backend."""
+        if self._retry_task is not None and not self._retry_task.done():
+            await self._retry_task
+        await asyncio.gather(*(b.close() for b in self._backends.values()), return_exceptions=True)
+
+    # --------------------------------------------------------
+    # Consolidation
+    # --------------------------------------------------------
+
+    def _load_consolidation_state(self) -> dict[str, Any]:
         """
-        Consolidate episodic memories into semantic knowledge.
-
-        Lineage: v4 consolidation_pipeline.py
-        - Finds episodic memories above importance threshold
-        - Extracts semantic knowledge
-        - Stores as semantic memories
-        - Archives originals
-
-        Returns:
-            Number of memories consolidated
+        High-water mark: created_at of the newest processed episodic memory,
+        plus IDs at it, plus late IDs — episodic memories that reached the
+        primary after the mark had passed their created_at.
         """
-        result = await self.query(MemoryQuery(
-            text="*",
-            memory_type=MemoryType.EPISODIC,
-            min_importance=importance_threshold,
-            limit=100,
-        ))
+        state: dict[str, Any] = {"cursor": None, "boundary_ids": [], "late_ids": [], "consolidated": 0}
+        if self.consolidation_state_path is not None and self.consolidation_state_path.exists():
+            try:
+                state.update(json.loads(self.consolidation_state_path.read_text(encoding="utf-8")))
+            except ValueError as e:
+                logger.warning(f"Consolidation state unreadable, starting from the beginning: {e}")
+        return state
+
+    def _save_consolidation_state(self) -> None:
+        if self.consolidation_state_path is None:
+            return
+        self.consolidation_state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.consolidation_state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._consolidation), encoding="utf-8")
+        os.replace(tmp, self.consolidation_state_path)
+
+    def _note_late_episodic(self, memories: list[Memory]) -> None:
+        """
+        Queue episodic memories the high-water mark has already passed.
 
-        consolidated = 0
-        for memory in result.memories:
-            semantic = Memory(
+        A write replayed from the retry queue, or a backfill, lands on the
+        primary with a created_at behind the mark; paging from the mark alone
+        would never see it.
+        """
+        cursor = self._consolidation["cursor"]
+        if cursor is None:
+            return
+        mark = datetime.fromisoformat(cursor)
+        boundary = set(self._consolidation["boundary_ids"])
+        late = [
+            m.id for m in memories
+            if m.memory_type == MemoryType.EPISODIC
+            and (local_naive(m.created_at) < mark or (local_naive(m.created_at) == mark and m.id in boundary))
+        ]
+        if late:
+            self._consolidation["late_ids"] = list(dict.fromkeys(self._consolidation["late_ids"] + late))
+            self._save_consolidation_state()
+
+    def _consolidate_memories(self, memories: list[Memory]) -> list[Memory]:
+        return [
+            Memory(
+                id=self.consolidated_id(memory.id),
                 content=f"Consolidated from episodic: {memory.content}",
                 memory_type=MemoryType.SEMANTIC,
                 source="consolidation",
@@ -221,10 +656,124 @@ class MemoryService:
                     "consolidated_at": time.time(),
                 },
             )
-            await self.store(semantic)
-            consolidated += 1
+            for memory in memories
+        ]
+
+    async def _iter_late_consolidation(
+        self,
+        importance_threshold: float,
+        batch_size: int,
+    ) -> AsyncIterator[list[Memory]]:
+        """Consolidate queued late arrivals, batch by batch; each batch is dequeued once written."""
+        while self._consolidation["late_ids"]:
+            batch_ids = self._consolidation["late_ids"][:batch_size]
+            fetched = await asyncio.gather(*(self.primary_backend.get(memory_id) for memory_id in batch_ids))
+            eligible = [
+                m for m in fetched
+                if m is not None and m.memory_type == MemoryType.EPISODIC and m.importance >= importance_threshold
+            ]
+            semantic = self._consolidate_memories(eligible)
+            if semantic:
+                await self.store_many(semantic)
+            self._consolidation.update(
+                late_ids=self._consolidation["late_ids"][len(batch_ids):],
+                consolidated=self._consolidation["consolidated"] + len(semantic),
+            )
+            self._save_consolidation_state()
+            if semantic:
+                yield semantic
+
+    @staticmethod
+    def consolidated_id(source_id: str) -> str:
+        """Deterministic ID of the semantic memory consolidated from source_id."""
+        return str(uuid.uuid5(CONSOLIDATION_NAMESPACE, source_id))
+
+    async def iter_consolidation(
+        self,
+        importance_threshold: float = 0.7,
+        batch_size: int = 100,
+    ) -> AsyncIterator[list[Memory]]:
+        """
+        Consolidate episodic memories created since the last run, batch by batch.
+
+        Pages through the primary backend's episodic memories oldest first,
+        starting after the persisted high-water mark. Each batch is written
+        with one store_many() and the mark is persisted before the batch is
+        yielded, so an interrupted run resumes where it stopped. Cost scales
+        with new episodic memories, not the whole history.
+
+        Episodic memories written through the service with a created_at the
+        mark has already passed (retry-queue replays, backfills) are queued
+        as late arrivals and consolidated first.
+
+        Yields the semantic memories written for each batch.
+        """
+        if self._primary is None:
+            return
+        async for semantic in self._iter_late_consolidation(importance_threshold, batch_size):
+            yield semantic
+
+        cursor = self._consolidation["cursor"]
+        boundary = set(self._consolidation["boundary_ids"])
+
+        while True:
+            # Page key is created_at; step back 1µs and skip IDs already seen at
+            # the cursor so ties at the page boundary are neither lost nor redone.
+            created_after = datetime.fromisoformat(cursor) - timedelta(microseconds=1) if cursor else None
+            page = await self.query(MemoryQuery(
+                text="*",
+                memory_type=MemoryType.EPISODIC,
+                min_importance=importance_threshold,
+                created_after=created_after,
+                limit=batch_size,
+            ), backend=self._primary)
+
+            fresh = [m for m in page.memories if m.id not in boundary]
+            if not fresh:
+                if len(page.memories) >= batch_size:
+                    logger.warning(
+                        f"Consolidation stalled: more than {batch_size} episodic memories share "
+                        f"created_at {cursor}; raise batch_size"
+                    )
+                return
+
+            semantic = self._consolidate_memories(fresh)
+            await self.store_many(semantic)
+
+            newest = max(local_naive(m.created_at) for m in fresh).isoformat()
+            if newest != cursor:
+                cursor, boundary = newest, set()
+            boundary |= {m.id for m in fresh if local_naive(m.created_at).isoformat() == cursor}
+            self._consolidation.update(
+                cursor=cursor,
+                boundary_ids=sorted(boundary),
+                consolidated=self._consolidation["consolidated"] + len(semantic),
+            )
+            self._save_consolidation_state()
+            yield semantic
+
+            if len(page.memories) < batch_size:
+                return
+
+    async def consolidate(self, importance_threshold: float = 0.7) -> int:
+        """
+        Consolidate episodic memories into semantic knowledge.
+
+        Lineage: v4 consolidation_pipeline.py
+        - Finds episodic memories above importance threshold, created since the last run
+        - Extracts semantic knowledge
+        - Stores as semantic memories (one per source, deterministic ID)
+        - Archives originals
+
+        Returns:
+            Number of memories consolidated
+        """
+        consolidated = 0
+        async for batch in self.iter_consolidation(importance_threshold):
+            consolidated += len(batch)
 
         if consolidated > 0:
+            self._invalidate()
             logger.info(f"Consolidated {consolidated} episodic memories to semantic")
 
         return consolidated
@@ -236,4 +785,13 @@ class MemoryService:
             "primary": self._primary.value if self._primary else None,
             "total_stores": self._store_count,
             "total_queries": self._query_count,
+            "backend_failures": dict(self._backend_failures),
+            "retry_pending": len(self._retry_queue),
+            "memory_cache": self._memory_cache.get_stats(),
+            "query_cache": self._query_cache.get_stats(),
+            "consolidation": {
+                "cursor": self._consolidation["cursor"],
+                "late_pending": len(self._consolidation["late_ids"]),
+                "total_consolidated": self._consolidation["consolidated"],
+            },
         }
@@ -6,6 +6,7 @@ All operations are accessible through: `cle <command>`
 
 Usage:
     cle boot          # Start the engine server
+    cle boot --workers 4  # Production: one worker per core
     cle status        # Check engine status
     cle agents        # List registered agents
     cle ship "task"   # Submit a task in SHIP mode
@@ -31,7 +32,7 @@ def cmd_boot(args):
     """Boot the Creative Liberation Engine server."""
     from cle.engine.server import run_server
     logger.info("⚡ Starting Creative Liberation Engine v5...")
-    run_server()
+    run_server(workers=args.workers)
 
 
 def cmd_status(args):
@@ -235,6 +236,7 @@ def main():
 
     # boot
     boot_parser = subparsers.add_parser("boot", help="Start the Creative Liberation Engine server")
+    boot_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CLE_WORKERS or 1)")
     boot_parser.set_defaults(func=cmd_boot)
 
     # status
@@ -26,6 +26,10 @@ class EngineConfig:
     anthropic_api_key: str = ""
     openai_api_key: str = ""
     default_model: str = "gemini-2.5-flash"
+    llm_timeout_seconds: float = 60.0
+    llm_max_retries: int = 2
+    llm_max_connections: int = 20
+    llm_offline: bool = False  # Answer model calls with the offline stub (demos, tests)
 
     # Memory
     chroma_host: str = "localhost"
@@ -44,6 +48,10 @@ class EngineConfig:
     host: str = "0.0.0.0"
     port: int = 8080
     debug: bool = True
+    workers: int = 1  # >1 runs N uvicorn worker processes (disables reload)
+    state_path: str = ".cle/state.db"  # SQLite store shared by workers
+    tracing_enabled: bool = False
+    warm_agents: bool = False  # Import manifest agents in the background after boot
 
     # Paths
     root_dir: Path = field(default_factory=lambda: Path.cwd())
@@ -73,6 +81,10 @@ def load_config(env_file: Optional[str] = None) -> EngineConfig:
         anthropic_api_key=os.getenv("ANTHROPIC_API_KEY", ""),
         openai_api_key=os.getenv("OPENAI_API_KEY", ""),
         default_model=os.getenv("CLE_DEFAULT_MODEL", "gemini-2.5-flash"),
+        llm_timeout_seconds=float(os.getenv("CLE_LLM_TIMEOUT", "60")),
+        llm_max_retries=int(os.getenv("CLE_LLM_MAX_RETRIES", "2")),
+        llm_max_connections=int(os.getenv("CLE_LLM_MAX_CONNECTIONS", "20")),
+        llm_offline=os.getenv("CLE_LLM_OFFLINE", "false").lower() == "true",
         chroma_host=os.getenv("CHROMA_HOST", "localhost"),
         chroma_port=int(os.getenv("CHROMA_PORT", "8000")),
         github_token=os.getenv("GITHUB_TOKEN", ""),
@@ -83,6 +95,10 @@ def load_config(env_file: Optional[str] = None) -> EngineConfig:
         host=os.getenv("CLE_HOST", "0.0.0.0"),
         port=int(os.getenv("CLE_PORT", "8080")),
         debug=os.getenv("CLE_DEBUG", "true").lower() == "true",
+        workers=int(os.getenv("CLE_WORKERS", "1")),
+        state_path=os.getenv("CLE_STATE_PATH", ".cle/state.db"),
+        tracing_enabled=os.getenv("CLE_TRACING", "false").lower() == "true",
+        warm_agents=os.getenv("CLE_WARM_AGENTS", "false").lower() == "true",
         root_dir=Path.cwd(),
     )
 
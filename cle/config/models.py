@@ -15,6 +15,7 @@ class ModelProvider(str, Enum):
     ANTHROPIC = "anthropic"
     OPENAI = "openai"
     LOCAL = "local"
+    STUB = "stub"  # Offline, deterministic (no network)
 
 
 @dataclass
@@ -9,10 +9,12 @@ Lineage: v4 constitution_guard.py → v5 (simplified, faster, cleaner)
 
 import logging
 import re
+import time
 from typing import Any
 
 from cle.constitution.articles import ARTICLES
 from cle.constitution.types import ConstitutionResult, Violation, ViolationSeverity
+from cle.telemetry import get_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -54,9 +56,12 @@ class ConstitutionalGuard:
         violations = []
 
         action_lower = action.lower()
+        metrics = get_metrics()
 
         for article in ARTICLES:
+            start = time.perf_counter()
             violation = article.check(action_lower, context)
+            metrics.observe("cle_guard_check_ms", (time.perf_counter() - start) * 1000, article=article.id)
             if violation:
                 violations.append(violation)
                 if violation.severity == ViolationSeverity.CRITICAL:
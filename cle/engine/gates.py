@@ -4,13 +4,23 @@ Creative Liberation Engine v5 — Execution Gates
 Gates control the flow of execution between agents and modes.
 Each gate is a checkpoint that can allow, block, or transform requests.
 
+Gates without a transform run concurrently; transforming gates run in order,
+since later gates must see the context they produce. Verdicts of pure gates
+(require_mode, require_tier) are memoized on the context keys they read, so
+adding policy gates keeps per-task overhead roughly constant.
+
 Lineage: v4 orchestrator/gates.py → v5 (simplified, async-first)
 """
 
+import asyncio
+import inspect
 import logging
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from cle.telemetry import get_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -23,12 +33,18 @@ class GateResult:
     reason: str = ""
     modified_context: Optional[dict[str, Any]] = None
     duration_ms: float = 0.0
+    cached: bool = False
 
     @property
     def blocked(self) -> bool:
         return not self.passed
 
 
+GateCheck = Callable[[dict[str, Any]], Union[tuple[bool, str], Awaitable[tuple[bool, str]]]]
+
+_VERDICT_CACHE_SIZE = 256
+
+
 @dataclass
 class Gate:
     """
@@ -38,48 +54,143 @@ class Gate:
     1. Allow/block execution
     2. Modify context before passing to the next gate
     3. Log/audit the request
+
+    check_fn may be sync or async (for I/O-bound checks). If cache_keys is set
+    — or the check function declares them, as require_mode/require_tier do —
+    the verdict is memoized on the values of those context keys.
     """
     name: str
     description: str
-    check_fn: Callable[[dict[str, Any]], tuple[bool, str]]
+    check_fn: GateCheck
     transform_fn: Optional[Callable[[dict[str, Any]], dict[str, Any]]] = None
     enabled: bool = True
     skip_in_modes: list[str] = field(default_factory=list)
+    cache_keys: Optional[tuple[str, ...]] = None
+    _verdicts: "OrderedDict[tuple, tuple[bool, str]]" = field(
+        default_factory=OrderedDict, init=False, repr=False,
+    )
 
-    def check(self, context: dict[str, Any]) -> GateResult:
-        """Run the gate check."""
-        start = time.perf_counter()
+    def __post_init__(self):
+        if self.cache_keys is None:
+            self.cache_keys = getattr(self.check_fn, "cache_keys", None)
+
+    @property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.check_fn)
 
+    def _precheck(self, context: dict[str, Any]) -> Optional[GateResult]:
+        """Short-circuit results that don't need the check function."""
         if not self.enabled:
             return GateResult(passed=True, gate_name=self.name, reason="Gate disabled")
 
         mode = context.get("mode", "")
         if mode in self.skip_in_modes:
             return GateResult(passed=True, gate_name=self.name, reason=f"Skipped in {mode} mode")
+        return None
+
+    def _cache_key(self, context: dict[str, Any]) -> Optional[tuple]:
+        # Transforming gates aren't memoized: their output may depend on any key
+        if not self.cache_keys or self.transform_fn:
+            return None
+        key = tuple(context.get(k) for k in self.cache_keys)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _remember(self, key: Optional[tuple], passed: bool, reason: str) -> None:
+        if key is None:
+            return
+        self._verdicts[key] = (passed, reason)
+        if len(self._verdicts) > _VERDICT_CACHE_SIZE:
+            self._verdicts.popitem(last=False)
+
+    def _cached(self, key: Optional[tuple], start: float) -> Optional[GateResult]:
+        if key is None or key not in self._verdicts:
+            return None
+        self._verdicts.move_to_end(key)
+        passed, reason = self._verdicts[key]
+        return GateResult(
+            passed=passed,
+            gate_name=self.name,
+            reason=reason,
+            duration_ms=round((time.perf_counter() - start) * 1000, 2),
+            cached=True,
+        )
+
+    def _finish(
+        self, context: dict[str, Any], key: Optional[tuple], passed: bool, reason: str, start: float,
+    ) -> GateResult:
+        modified = None
+        if passed and self.transform_fn:
+            modified = self.transform_fn(context)
+        self._remember(key, passed, reason)
+
+        duration = (time.perf_counter() - start) * 1000
+
+        return GateResult(
+            passed=passed,
+            gate_name=self.name,
+            reason=reason,
+            modified_context=modified,
+            duration_ms=round(duration, 2),
+        )
+
+    def _error(self, e: Exception) -> GateResult:
+        logger.error(f"Gate {self.name} check failed: {e}")
+        return GateResult(
+            passed=False,
+            gate_name=self.name,
+            reason=f"Gate error: {e}",
+        )
+
+    def check(self, context: dict[str, Any]) -> GateResult:
+        """Run the gate check (sync gates only — use acheck for async gates)."""
+        start = time.perf_counter()
+
+        early = self._precheck(context)
+        if early is not None:
+            return early
+
+        key = self._cache_key(context)
+        cached = self._cached(key, start)
+        if cached is not None:
+            return cached
+
+        if self.is_async:
+            return self._error(RuntimeError("async gate must be run with acheck()/arun()"))
 
         try:
             passed, reason = self.check_fn(context)
-            modified = None
+            return self._finish(context, key, passed, reason, start)
+        except Exception as e:
+            return self._error(e)
+
+    async def acheck(self, context: dict[str, Any]) -> GateResult:
+        """Run the gate check, awaiting async check functions."""
+        start = time.perf_counter()
 
-            if passed and self.transform_fn:
-                modified = self.transform_fn(context)
+        early = self._precheck(context)
+        if early is not None:
+            return early
 
-            duration = (time.perf_counter() - start) * 1000
+        key = self._cache_key(context)
+        cached = self._cached(key, start)
+        if cached is not None:
+            return cached
 
-            return GateResult(
-                passed=passed,
-                gate_name=self.name,
-                reason=reason,
-                modified_context=modified,
-                duration_ms=round(duration, 2),
-            )
+        try:
+            verdict = self.check_fn(context)
+            if inspect.isawaitable(verdict):
+                verdict = await verdict
+            passed, reason = verdict
+            return self._finish(context, key, passed, reason, start)
         except Exception as e:
-            logger.error(f"Gate {self.name} check failed: {e}")
-            return GateResult(
-                passed=False,
-                gate_name=self.name,
-                reason=f"Gate error: {e}",
-            )
+            return self._error(e)
+
+    def clear_cache(self) -> None:
+        self._verdicts.clear()
 
 
 class GatePipeline:
@@ -92,9 +203,10 @@ class GatePipeline:
         pipeline.add(tier_gate)
         pipeline.add(mode_gate)
 
-        results = pipeline.run(context)
+        results = await pipeline.arun(context)
         if pipeline.blocked(results):
             raise GateBlockedError(pipeline.block_reason(results))
+        context = pipeline.apply(context, results)
     """
 
     def __init__(self):
@@ -125,10 +237,12 @@ class GatePipeline:
         """
         self._run_count += 1
         results = []
+        metrics = get_metrics()
 
         for gate in self._gates:
             result = gate.check(context)
             results.append(result)
+            metrics.observe("cle_gate_check_ms", result.duration_ms, gate=gate.name)
 
             # Apply any context modifications
             if result.passed and result.modified_context:
@@ -144,6 +258,72 @@ class GatePipeline:
 
         return results
 
+    def _groups(self) -> list[list[Gate]]:
+        """Split gates into runs of non-transforming gates; each transforming gate is its own group."""
+        groups: list[list[Gate]] = []
+        current: list[Gate] = []
+        for gate in self._gates:
+            if gate.transform_fn is None:
+                current.append(gate)
+                continue
+            if current:
+                groups.append(current)
+                current = []
+            groups.append([gate])
+        if current:
+            groups.append(current)
+        return groups
+
+    async def arun(self, context: dict[str, Any]) -> list[GateResult]:
+        """
+        Run all gates, concurrently where possible.
+
+        Consecutive non-transforming gates are checked together with
+        asyncio.gather; a transforming gate waits for everything before it and
+        hands its modified context to the gates after it. Results are reported
+        in pipeline order and short-circuit at the first failure, exactly as
+        run() does.
+
+        Args:
+            context: Execution context to check
+
+        Returns:
+            List of GateResults (may be partial on failure)
+        """
+        self._run_count += 1
+        results: list[GateResult] = []
+        metrics = get_metrics()
+
+        for group in self._groups():
+            if len(group) == 1:
+                group_results = [await group[0].acheck(context)]
+            else:
+                group_results = await asyncio.gather(*(g.acheck(context) for g in group))
+
+            for gate, result in zip(group, group_results):
+                results.append(result)
+                metrics.observe("cle_gate_check_ms", result.duration_ms, gate=gate.name)
+
+                if result.passed and result.modified_context:
+                    context = result.modified_context
+
+                if not result.passed:
+                    self._block_count += 1
+                    logger.info(
+                        f"Pipeline blocked at gate '{gate.name}': {result.reason}"
+                    )
+                    return results
+
+        return results
+
+    @staticmethod
+    def apply(context: dict[str, Any], results: list[GateResult]) -> dict[str, Any]:
+        """The context after every transforming gate in results has been applied."""
+        for result in results:
+            if result.passed and result.modified_context:
+                context = result.modified_context
+        return context
+
     def blocked(self, results: list[GateResult]) -> bool:
         """Check if any gate blocked."""
         return any(not r.passed for r in results)
@@ -159,6 +339,8 @@ class GatePipeline:
         """Get pipeline statistics."""
         return {
             "gates": len(self._gates),
+            "memoized_gates": sum(1 for g in self._gates if g.cache_keys and not g.transform_fn),
+            "async_gates": sum(1 for g in self._gates if g.is_async),
             "total_runs": self._run_count,
             "total_blocks": self._block_count,
             "pass_rate": int(
@@ -176,6 +358,7 @@ def require_mode(allowed_modes: list[str]) -> Callable[[dict], tuple[bool, str]]
         if mode in allowed_modes:
             return True, f"Mode '{mode}' is allowed"
         return False, f"Mode '{mode}' not in allowed modes: {allowed_modes}"
+    check.cache_keys = ("mode",)
     return check
 
 
@@ -186,6 +369,7 @@ def require_tier(allowed_tiers: list[str]) -> Callable[[dict], tuple[bool, str]]
         if tier in allowed_tiers:
             return True, f"Tier '{tier}' is allowed"
         return False, f"Tier '{tier}' not in allowed tiers: {allowed_tiers}"
+    check.cache_keys = ("tier",)
     return check
 
 
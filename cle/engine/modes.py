@@ -14,7 +14,10 @@ import logging
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from cle.engine.state import SharedState
 
 logger = logging.getLogger(__name__)
 
@@ -88,24 +91,44 @@ class ModeSession:
             return 0.0
         return self.completed_count / self.task_count
 
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> "ModeSession":
+        """Build a session from a SharedState mode_sessions row."""
+        return cls(
+            mode=ModeType(row["mode"]),
+            started_at=row["started_at"],
+            task_count=row["task_count"],
+            completed_count=row["completed_count"],
+        )
+
 
 class ModeManager:
     """
     Manages the engine's operational mode.
 
+    With a SharedState store, the current session and history live in the
+    store so every worker process sees the same mode; without one, they are
+    kept in memory.
+
     Usage:
-        manager = ModeManager()
+        manager = ModeManager()            # or ModeManager(store=shared_state)
         manager.enter(ModeType.SHIP)
         # ... execute tasks ...
         manager.exit()
     """
 
-    def __init__(self):
+    def __init__(self, store: Optional["SharedState"] = None):
+        self._store = store
         self._current: Optional[ModeSession] = None
         self._history: list[ModeSession] = []
 
     def enter(self, mode: ModeType) -> ModeSession:
         """Enter a new mode."""
+        if self._store is not None:
+            session = ModeSession.from_row(self._store.open_session(mode.value))
+            logger.info(f"Mode entered: {mode.value}")
+            return session
+
         if self._current:
             self.exit()
 
@@ -116,28 +139,46 @@ class ModeManager:
 
     def exit(self) -> Optional[ModeSession]:
         """Exit the current mode."""
-        if self._current:
+        if self._store is not None:
+            row = self._store.close_session()
+            session = ModeSession.from_row(row) if row else None
+        elif self._current:
             self._history.append(self._current)
             session = self._current
             self._current = None
+        else:
+            session = None
+
+        if session:
             logger.info(
                 f"Mode exited: {session.mode.value} "
                 f"({session.task_count} tasks, {session.duration_seconds:.1f}s)"
             )
-            return session
-        return None
+        return session
+
+    def record_task(self, completed: bool) -> None:
+        """Count a task against the current session."""
+        if self._store is not None:
+            self._store.record_task(completed)
+        elif self._current:
+            self._current.task_count += 1
+            self._current.completed_count += int(completed)
 
     @property
     def current(self) -> Optional[ModeSession]:
+        if self._store is not None:
+            row = self._store.current_session()
+            return ModeSession.from_row(row) if row else None
         return self._current
 
     @property
     def current_mode(self) -> Optional[ModeType]:
-        return self._current.mode if self._current else None
+        current = self.current
+        return current.mode if current else None
 
     def is_in_mode(self, mode: ModeType) -> bool:
         """Check if currently in a specific mode."""
-        return self._current is not None and self._current.mode == mode
+        return self.current_mode == mode
 
     def get_config(self, mode: Optional[ModeType] = None) -> Optional[ModeConfig]:
         """Get configuration for a mode."""
@@ -148,4 +189,6 @@ class ModeManager:
 
     def get_history(self) -> list[ModeSession]:
         """Get completed mode sessions."""
+        if self._store is not None:
+            return [ModeSession.from_row(r) for r in self._store.session_history()]
         return list(self._history)
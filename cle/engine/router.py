@@ -9,10 +9,12 @@ Lineage: v4 orchestrator/router.py → v5 (tier-aware, production-complete)
 
 import logging
 import re
+import time
 from typing import Any, Optional
 
 from cle.agents.base import CLEAgent
 from cle.agents.registry import AgentRegistry
+from cle.telemetry import get_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -130,11 +132,13 @@ class TaskRouter:
         Returns:
             List of (agent_name, score) tuples, sorted by score descending
         """
+        start = time.perf_counter()
         scores: dict[str, float] = {}
 
         # Score each agent based on pattern matches
+        # peek() reads manifest metadata, so routing never imports agent modules
         for agent_name, patterns in _COMPILED_PATTERNS.items():
-            agent = self.registry.get(agent_name)
+            agent = self.registry.peek(agent_name)
             if agent is None:
                 continue
 
@@ -164,10 +168,12 @@ class TaskRouter:
         else:
             logger.warning(f"No agent matched for task: {task[:80]}...")
             # Default to kbuildd for unmatched tasks in SHIP mode
-            if mode == "ship" and self.registry.get("kbuildd"):
+            if mode == "ship" and self.registry.peek("kbuildd"):
                 result = [("kbuildd", 0.1)]
                 logger.info("Defaulting to kbuildd for unmatched SHIP task")
 
+        duration = (time.perf_counter() - start) * 1000
+        get_metrics().observe("cle_route_ms", duration, route=result[0][0] if result else "unmatched")
         return result
 
     def explain_routing(self, task: str) -> dict[str, Any]:
@@ -8,13 +8,16 @@ into a single, clean server.
 Lineage: v4 start_engine.py + legacy main.py → v5 server.py (unified)
 """
 
+import asyncio
 import logging
+import os
 import time
 from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
 from cle.config.env import load_config, get_config
@@ -22,11 +25,14 @@ from cle.config.constants import ENGINE_NAME, ENGINE_VERSION
 from cle.config.tiers import AccessTier, get_tier_config, check_agent_access
 from cle.constitution.guard import ConstitutionalGuard
 from cle.engine.modes import ModeType, ModeManager
-from cle.engine.gates import GateValidator
+from cle.engine.gates import Gate, GatePipeline, GateValidator, require_field, require_mode, require_tier
 from cle.engine.router import TaskRouter
+from cle.engine.state import SharedState
 from cle.engine.types import TaskResult, EngineStatus
 from cle.agents.registry import AgentRegistry
 from cle.agents.base import AgentResult
+from cle.agents.model_client import close_model_client
+from cle.telemetry import Tracer, get_metrics, get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -40,8 +46,14 @@ _registry: AgentRegistry = AgentRegistry()
 _guard: ConstitutionalGuard = ConstitutionalGuard()
 _mode_manager: ModeManager = ModeManager()
 _gate_validator: GateValidator = GateValidator()
+_gate_pipeline: GatePipeline = GatePipeline()
 _router: TaskRouter | None = None
-_task_count: int = 0
+_task_count: int = 0  # Tasks handled by THIS worker; node-wide count lives in _state
+_state: SharedState | None = None
+_warmup_task: "asyncio.Task | None" = None
+_heartbeat_task: "asyncio.Task | None" = None
+
+HEARTBEAT_INTERVAL_SECONDS = 5.0
 
 
 # ============================================================
@@ -67,6 +79,8 @@ class TaskResponse(BaseModel):
     execution_time_ms: float
     constitutional_compliant: bool
     model_used: str
+    tokens_used: int = 0
+    cost_usd: float = 0.0
 
 
 class BootInfo(BaseModel):
@@ -84,123 +98,61 @@ class BootInfo(BaseModel):
 # Boot sequence
 # ============================================================
 
-def _load_agents() -> None:
-    """Load all agents into the registry. Import here to avoid circular deps."""
-    # Agent definitions are imported and registered
-    # This will grow as agents are added in Phase 2
-    try:
-        from cle.agents.hives.aurora.bolt import kbuildd
-        _registry.register(kbuildd)
-    except ImportError:
-        logger.debug("kbuildd agent not yet available")
-
-    try:
-        from cle.agents.hives.aurora.comet import comet
-        _registry.register(comet)
-    except ImportError:
-        logger.debug("COMET agent not yet available")
-
-    try:
-        from cle.agents.hives.aurora.aurora_agent import kuid
-        _registry.register(kuid)
-    except ImportError:
-        logger.debug("kuid agent not yet available")
-
-    try:
-        from cle.agents.hives.keeper.keeper import kstated
-        _registry.register(kstated)
-    except ImportError:
-        logger.debug("kstated agent not yet available")
-
-    try:
-        from cle.agents.hives.keeper.arch import arch
-        _registry.register(arch)
-    except ImportError:
-        logger.debug("ARCH agent not yet available")
-
-    try:
-        from cle.agents.hives.keeper.codex import codex
-        _registry.register(codex)
-    except ImportError:
-        logger.debug("CODEX agent not yet available")
-
-    try:
-        from cle.agents.hives.lex.lex_agent import kdocsd
-        _registry.register(kdocsd)
-    except ImportError:
-        logger.debug("kdocsd agent not yet available")
-
-    try:
-        from cle.agents.hives.lex.compass import compass
-        _registry.register(compass)
-    except ImportError:
-        logger.debug("COMPASS agent not yet available")
-
-    try:
-        from cle.agents.hives.switchboard.relay import relay
-        _registry.register(relay)
-    except ImportError:
-        logger.debug("RELAY agent not yet available")
-
-    try:
-        from cle.agents.hives.broadcast.signal_agent import signal
-        _registry.register(signal)
-    except ImportError:
-        logger.debug("SIGNAL agent not yet available")
-
-    try:
-        from cle.agents.hives.vt100.tty_trinity import tty_trinity
-        _registry.register(tty_trinity)
-    except ImportError:
-        logger.debug("TTY Trinity agent not yet available")
-
-    try:
-        from cle.agents.hives.vt100.oracle_council import oracle_council
-        _registry.register(oracle_council)
-    except ImportError:
-        logger.debug("Oracle Council agent not yet available")
-
-    try:
-        from cle.agents.hives.broadcast.broadcast_crew import broadcast_crew
-        _registry.register(broadcast_crew)
-    except ImportError:
-        logger.debug("Broadcast Crew agent not yet available")
-
-    try:
-        from cle.agents.hives.broadcast.echo import echo
-        _registry.register(echo)
-    except ImportError:
-        logger.debug("ECHO agent not yet available")
+def _worker_stats() -> dict[str, Any]:
+    """This worker's contribution to the node-wide /status."""
+    return {
+        "boot_time_ms": _boot_time,
+        "agents_indexed": _registry.count(),
+        "agents_loaded": _registry.loaded_count(),
+        "tasks": _task_count,
+        "constitutional_scans": _guard.total_scans,
+    }
 
-    try:
-        from cle.agents.hives.broadcast.atlas import atlas
-        _registry.register(atlas)
-    except ImportError:
-        logger.debug("ATLAS agent not yet available")
 
-    try:
-        from cle.agents.hives.broadcast.ram_crew import krecd
-        _registry.register(krecd)
-    except ImportError:
-        logger.debug("krecd agent not yet available")
+def _build_gate_pipeline() -> GatePipeline:
+    """Policy gates every task passes before routing. Order matters only for transforming gates."""
+    pipeline = GatePipeline()
+    pipeline.add(Gate(
+        name="task_present",
+        description="Task text must be non-empty",
+        check_fn=require_field("task"),
+    ))
+    pipeline.add(Gate(
+        name="known_mode",
+        description="Mode must be one of ideate/plan/ship/validate",
+        check_fn=require_mode([m.value for m in ModeType]),
+    ))
+    pipeline.add(Gate(
+        name="known_tier",
+        description="Access tier must be a configured tier",
+        check_fn=require_tier([t.value for t in AccessTier]),
+    ))
+    return pipeline
+
+
+async def _heartbeat_loop() -> None:
+    """Keep this worker's row in the shared store fresh."""
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(_state.heartbeat, os.getpid(), **_worker_stats())
+        except Exception as e:
+            logger.warning(f"Worker heartbeat failed: {e}")
 
-    try:
-        from cle.agents.hives.keeper.scribe import klogd
-        _registry.register(klogd)
-    except ImportError:
-        logger.debug("klogd agent not yet available")
 
-    try:
-        from cle.agents.hives.keeper.cosmos import cosmos
-        _registry.register(cosmos)
-    except ImportError:
-        logger.debug("COSMOS agent not yet available")
+def _load_agents() -> None:
+    """
+    Index all agents from the manifest. No agent module is imported here —
+    each one is materialized the first time the registry hands it out.
+    """
+    from cle.agents.manifest import AGENT_MANIFEST
+    _registry.register_manifest(AGENT_MANIFEST)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Boot and shutdown sequence."""
-    global _boot_time, _start_time, _router
+    global _boot_time, _start_time, _router, _warmup_task, _heartbeat_task, _state, _mode_manager, _gate_pipeline
 
     boot_start = time.perf_counter()
     _start_time = time.time()
@@ -211,21 +163,43 @@ async def lifespan(app: FastAPI):
     logger.info(f"   Tier: {config.access_tier}")
     logger.info(f"   Model: {config.default_model}")
     logger.info(f"   Offline: {config.is_offline}")
+    if config.is_offline and not config.llm_offline:
+        logger.warning("   No LLM API key configured — agent model calls will fail (CLE_LLM_OFFLINE=true for stub replies)")
+    get_tracer().enabled = config.tracing_enabled
+
+    # Counters and mode sessions are shared by every worker on this node
+    _state = SharedState(config.root_dir / config.state_path)
+    _mode_manager = ModeManager(store=_state)
 
     # 2. Load agents
     _load_agents()
-    logger.info(f"   Agents: {_registry.count()} loaded")
+    logger.info(f"   Agents: {_registry.count()} indexed")
 
-    # 3. Initialize router
+    # 3. Initialize router and execution gates
     _router = TaskRouter(_registry)
+    _gate_pipeline = _build_gate_pipeline()
 
     # 4. Boot complete
     _boot_time = (time.perf_counter() - boot_start) * 1000
     logger.info(f"✅ {ENGINE_NAME} v{ENGINE_VERSION} — Boot complete in {_boot_time:.0f}ms")
 
+    # 5. Announce this worker to the shared store
+    _state.register_worker(os.getpid(), **_worker_stats())
+    _heartbeat_task = asyncio.create_task(_heartbeat_loop())
+
+    # 6. Optionally import the remaining agents in the background
+    if config.warm_agents:
+        _warmup_task = asyncio.create_task(_registry.warm_up())
+
     yield
 
     # Shutdown
+    for task in (_warmup_task, _heartbeat_task):
+        if task is not None and not task.done():
+            task.cancel()
+    _state.remove_worker(os.getpid())
+    _state.close()
+    await close_model_client()
     logger.info(f"🛑 {ENGINE_NAME} — Shutting down (processed {_task_count} tasks)")
 
 
@@ -260,45 +234,57 @@ app.include_router(vfx_router, prefix="/api/v1/vfx", tags=["vfx"])
 async def root():
     """Engine info endpoint."""
     config = get_config()
+    current_mode = await asyncio.to_thread(lambda: _mode_manager.current_mode)
     return BootInfo(
         engine=ENGINE_NAME,
         version=ENGINE_VERSION,
         boot_time_ms=round(_boot_time, 2),
         agents_loaded=_registry.count(),
         tier=config.access_tier,
-        mode=_mode_manager.current_mode.value if _mode_manager.current_mode else "idle",
+        mode=current_mode.value if current_mode else "idle",
         offline=config.is_offline,
     )
 
 
 @app.get("/status", response_model=EngineStatus)
 async def status():
-    """Detailed engine status."""
+    """Detailed engine status, aggregated across all workers on this node."""
     config = get_config()
-    uptime = time.time() - _start_time if _start_time else 0
+    await asyncio.to_thread(_state.heartbeat, os.getpid(), **_worker_stats())
+    node = await asyncio.to_thread(_state.aggregate)
+    started_at = node["started_at"] or _start_time
+    uptime = time.time() - started_at if started_at else 0
+    current_mode = await asyncio.to_thread(lambda: _mode_manager.current_mode)
     return EngineStatus(
         version=ENGINE_VERSION,
         running=True,
-        mode=_mode_manager.current_mode.value if _mode_manager.current_mode else "idle",
+        mode=current_mode.value if current_mode else "idle",
         agents_loaded=_registry.count(),
         agents_available=_registry.list_all(),
         tier=config.access_tier,
         memory_connected=False,  # Updated when memory package is integrated
         model=config.default_model,
         uptime_seconds=round(uptime, 1),
-        boot_time_ms=round(_boot_time, 2),
-        total_tasks=_task_count,
-        constitutional_scans=_guard.total_scans,
+        boot_time_ms=round(node["boot_time_ms"], 2),
+        total_tasks=node["total_tasks"],
+        constitutional_scans=node["constitutional_scans"],
     )
 
 
+@app.get("/status/workers")
+async def worker_status():
+    """Per-worker heartbeat and stats for every live worker on this node."""
+    await asyncio.to_thread(_state.heartbeat, os.getpid(), **_worker_stats())
+    return {"pid": os.getpid(), "workers": await asyncio.to_thread(_state.live_workers)}
+
+
 @app.post("/task", response_model=TaskResponse)
 async def submit_task(request: TaskRequest):
     """
     Submit a task for agent execution.
 
     This is the main entry point for all work. The pipeline:
-    1. Tier check
+    1. Execution gates (tier, mode, policy)
     2. Route to agent(s)
     3. Constitutional pre-flight
     4. Agent execution
@@ -307,38 +293,41 @@ async def submit_task(request: TaskRequest):
     """
     global _task_count
     _task_count += 1
-    task_id = _task_count
+    # SQLite writes wait on other workers' locks (up to the 10s busy timeout); keep them off the loop
+    task_id = await asyncio.to_thread(_state.incr, "tasks")
 
-    config = get_config()
-    tier = AccessTier(config.access_tier)
+    tracer = get_tracer()
+    with tracer.trace("task", task_id=task_id, mode=request.mode):
+        response = await _run_task(request, task_id, tracer)
+    await asyncio.to_thread(_mode_manager.record_task, response.success)
+    return response
 
-    # 1. Route to agent
-    if request.agent:
-        # Forced agent
-        agent = _registry.get(request.agent)
-        if agent is None:
-            raise HTTPException(404, f"Agent '{request.agent}' not found")
-        if not check_agent_access(tier, agent.hive):
-            raise HTTPException(403, f"Tier '{tier.value}' cannot access agent '{request.agent}'")
-    else:
-        # Auto-route
-        if _router is None:
-            raise HTTPException(500, "Router not initialized")
-        matches = _router.route(request.task, mode=request.mode, tier=config.access_tier)
-        if not matches:
-            raise HTTPException(422, "No agent could be matched for this task")
-        agent = _registry.get(matches[0][0])
-        if agent is None:
-            raise HTTPException(500, f"Routed agent '{matches[0][0]}' not in registry")
 
-    # 2. Constitutional pre-flight
+async def _run_task(request: TaskRequest, task_id: int, tracer: Tracer) -> TaskResponse:
+    """The traced task pipeline behind POST /task."""
+    config = get_config()
+    tier = AccessTier(config.access_tier)
     context = {
         "task": request.task,
         "mode": request.mode,
         "tier": config.access_tier,
         **request.context,
     }
-    pre_check = _guard.pre_flight_check(context, agent_name=agent.name, mode=request.mode)
+
+    # 1. Execution gates
+    with tracer.span("gates"):
+        gate_results = await _gate_pipeline.arun(context)
+    if _gate_pipeline.blocked(gate_results):
+        raise HTTPException(403, f"Blocked by gate {_gate_pipeline.block_reason(gate_results)}")
+    context = _gate_pipeline.apply(context, gate_results)
+
+    # 2. Route to agent
+    with tracer.span("route"):
+        agent = _resolve_agent(request, tier, config.access_tier)
+
+    # 3. Constitutional pre-flight
+    with tracer.span("pre_flight", agent=agent.name):
+        pre_check = _guard.pre_flight_check(context, agent_name=agent.name, mode=request.mode)
     if pre_check.has_blockers:
         violations = [
             f"Article {v.article} ({v.article_name}): {v.description}"
@@ -349,11 +338,13 @@ async def submit_task(request: TaskRequest):
             f"Constitutional violation(s): {'; '.join(violations)}"
         )
 
-    # 3. Execute agent
-    result: AgentResult = await agent.execute(context)
+    # 4. Execute agent
+    with tracer.span("execute", agent=agent.name):
+        result: AgentResult = await agent.execute(context)
 
-    # 4. Constitutional post-flight
-    post_check = _guard.post_flight_check(result.output, agent_name=agent.name)
+    # 5. Constitutional post-flight
+    with tracer.span("post_flight", agent=agent.name):
+        post_check = _guard.post_flight_check(result.output, agent_name=agent.name)
 
     return TaskResponse(
         success=result.success,
@@ -365,9 +356,50 @@ async def submit_task(request: TaskRequest):
         execution_time_ms=result.execution_time_ms,
         constitutional_compliant=pre_check.compliant and post_check.compliant,
         model_used=result.model_used,
+        tokens_used=result.tokens_used,
+        cost_usd=result.cost_usd,
+    )
+
+
+def _resolve_agent(request: TaskRequest, tier: AccessTier, access_tier: str):
+    """Pick the agent for a task: forced by name, or auto-routed."""
+    if request.agent:
+        # Forced agent
+        agent = _registry.get(request.agent)
+        if agent is None:
+            raise HTTPException(404, f"Agent '{request.agent}' not found")
+        if not check_agent_access(tier, agent.hive):
+            raise HTTPException(403, f"Tier '{tier.value}' cannot access agent '{request.agent}'")
+    else:
+        # Auto-route
+        if _router is None:
+            raise HTTPException(500, "Router not initialized")
+        matches = _router.route(request.task, mode=request.mode, tier=access_tier)
+        if not matches:
+            raise HTTPException(422, "No agent could be matched for this task")
+        agent = _registry.get(matches[0][0])
+        if agent is None:
+            raise HTTPException(500, f"Routed agent '{matches[0][0]}' not in registry")
+
+    return agent
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Latency histograms in Prometheus text format."""
+    return PlainTextResponse(
+        get_metrics().render_prometheus(),
+        media_type="text/plain; version=0.0.4",
     )
 
 
+@app.get("/traces")
+async def recent_traces(limit: int = 50):
+    """Recent task traces (gates → route → pre_flight → execute → post_flight). Requires CLE_TRACING=true."""
+    tracer = get_tracer()
+    return {"enabled": tracer.enabled, "traces": tracer.recent(limit)}
+
+
 @app.get("/agents")
 async def list_agents():
     """List all registered agents with capabilities."""
@@ -405,7 +437,7 @@ async def list_modes():
 @app.get("/modes/history")
 async def mode_history():
     """Get mode transition history."""
-    return {"history": _mode_manager.get_history()}
+    return {"history": await asyncio.to_thread(_mode_manager.get_history)}
 
 
 @app.get("/constitution")
@@ -449,7 +481,7 @@ async def websocket_endpoint(ws: WebSocket):
                 "engine": ENGINE_NAME,
                 "version": ENGINE_VERSION,
                 "agents": _registry.count(),
-                "tasks": _task_count,
+                "tasks": await asyncio.to_thread(_state.get_counter, "tasks"),
                 "received": data,
             })
     except WebSocketDisconnect:
@@ -460,16 +492,32 @@ async def websocket_endpoint(ws: WebSocket):
 # Entry point
 # ============================================================
 
-def run_server():
-    """Run the engine server. For CLI: `cle boot`"""
+def run_server(workers: int | None = None):
+    """
+    Run the engine server. For CLI: `cle boot [--workers N]`
+
+    With one worker and CLE_DEBUG=true this is the dev server (auto-reload).
+    With N > 1 workers, uvicorn forks N processes; each builds its own agent
+    registry from the manifest and shares counters and mode sessions through
+    the SQLite store at CLE_STATE_PATH. Reload is disabled in that mode.
+    """
     import uvicorn
 
     config = load_config()
+    workers = max(1, workers or config.workers)
+    reload = config.debug and workers == 1
+    if workers > 1 and config.debug:
+        logger.info(f"Running {workers} workers — auto-reload disabled")
+
+    # Start from a clean node-wide state; workers register themselves at boot
+    SharedState(config.root_dir / config.state_path).reset()
+
     uvicorn.run(
         "cle.engine.server:app",
         host=config.host,
         port=config.port,
-        reload=config.debug,
+        reload=reload,
+        workers=workers if workers > 1 else None,
         log_level="info",
     )
 
@@ -0,0 +1,230 @@
+"""
+Creative Liberation Engine v5 — Shared Engine State
+
+State that must be consistent across every worker process on a node:
+  - Global counters (task IDs)
+  - Worker heartbeats (boot time, agents loaded, tasks, constitutional scans)
+  - Mode sessions (current mode + history)
+
+Backed by a single SQLite database in WAL mode, so N uvicorn workers can read
+concurrently while writes are serialized by SQLite's own locking. Each process
+opens its own connection (connections are never shared across fork()).
+Per-process state — agent registry, guard, router — stays in the worker.
+
+Lineage: v5 server.py module globals → v5 state.py (multi-worker)
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS counters (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS workers (
+    pid                  INTEGER PRIMARY KEY,
+    started_at           REAL NOT NULL,
+    heartbeat            REAL NOT NULL,
+    boot_time_ms         REAL NOT NULL DEFAULT 0,
+    agents_indexed       INTEGER NOT NULL DEFAULT 0,
+    agents_loaded        INTEGER NOT NULL DEFAULT 0,
+    tasks                INTEGER NOT NULL DEFAULT 0,
+    constitutional_scans INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS mode_sessions (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    mode            TEXT NOT NULL,
+    started_at      REAL NOT NULL,
+    ended_at        REAL,
+    task_count      INTEGER NOT NULL DEFAULT 0,
+    completed_count INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+_WORKER_STATS = ("boot_time_ms", "agents_indexed", "agents_loaded", "tasks", "constitutional_scans")
+
+
+class SharedState:
+    """
+    SQLite-backed store shared by all engine workers on one node.
+
+    Usage:
+        state = SharedState(".cle/state.db")
+        task_id = state.incr("tasks")
+        state.heartbeat(os.getpid(), tasks=12, agents_loaded=3)
+        state.aggregate()  # → {"workers": 4, "total_tasks": 180, ...}
+    """
+
+    def __init__(self, path: str | Path, stale_after_seconds: float = 30.0):
+        self.path = Path(path)
+        self.stale_after_seconds = stale_after_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    # --------------------------------------------------------
+    # Connection
+    # --------------------------------------------------------
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-process connection, reopened after fork."""
+        pid = os.getpid()
+        if self._conn is None or self._conn_pid != pid:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path, timeout=10.0, isolation_level=None, check_same_thread=False,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn, self._conn_pid = conn, pid
+        return self._conn
+
+    def _write(self, statements: list[tuple[str, tuple]]) -> list[sqlite3.Row]:
+        """Run statements in one IMMEDIATE transaction; return rows of the last one."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows: list[sqlite3.Row] = []
+                for sql, params in statements:
+                    rows = conn.execute(sql, params).fetchall()
+                conn.execute("COMMIT")
+                return rows
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _read(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    def reset(self) -> None:
+        """Clear all state. Called once by the parent process before workers start."""
+        self._write([
+            ("DELETE FROM counters", ()),
+            ("DELETE FROM workers", ()),
+            ("UPDATE mode_sessions SET ended_at = ? WHERE ended_at IS NULL", (time.time(),)),
+        ])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    # --------------------------------------------------------
+    # Counters
+    # --------------------------------------------------------
+
+    def incr(self, name: str, by: int = 1) -> int:
+        """Atomically increment a counter and return the new value."""
+        rows = self._write([
+            (
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                (name, by),
+            ),
+            ("SELECT value FROM counters WHERE name = ?", (name,)),
+        ])
+        return rows[0]["value"]
+
+    def get_counter(self, name: str) -> int:
+        rows = self._read("SELECT value FROM counters WHERE name = ?", (name,))
+        return rows[0]["value"] if rows else 0
+
+    # --------------------------------------------------------
+    # Workers
+    # --------------------------------------------------------
+
+    def register_worker(self, pid: int, **stats: Any) -> None:
+        """Record a worker as live. Stats are any of the workers table columns."""
+        now = time.time()
+        self._write([(
+            "INSERT OR REPLACE INTO workers (pid, started_at, heartbeat) VALUES (?, ?, ?)",
+            (pid, now, now),
+        )])
+        self.heartbeat(pid, **stats)
+
+    def heartbeat(self, pid: int, **stats: Any) -> None:
+        """Refresh a worker's heartbeat and stats."""
+        columns = [k for k in stats if k in _WORKER_STATS]
+        assignments = "".join(f", {k} = ?" for k in columns)
+        self._write([(
+            f"UPDATE workers SET heartbeat = ?{assignments} WHERE pid = ?",
+            (time.time(), *(stats[k] for k in columns), pid),
+        )])
+
+    def remove_worker(self, pid: int) -> None:
+        self._write([("DELETE FROM workers WHERE pid = ?", (pid,))])
+
+    def live_workers(self) -> list[dict[str, Any]]:
+        """Workers whose heartbeat is newer than stale_after_seconds."""
+        cutoff = time.time() - self.stale_after_seconds
+        rows = self._read("SELECT * FROM workers WHERE heartbeat >= ? ORDER BY pid", (cutoff,))
+        return [dict(r) for r in rows]
+
+    def aggregate(self) -> dict[str, Any]:
+        """Node-wide totals across live workers."""
+        workers = self.live_workers()
+        return {
+            "workers": len(workers),
+            "total_tasks": self.get_counter("tasks"),
+            "constitutional_scans": sum(w["constitutional_scans"] for w in workers),
+            "agents_loaded": max((w["agents_loaded"] for w in workers), default=0),
+            "boot_time_ms": max((w["boot_time_ms"] for w in workers), default=0.0),
+            "started_at": min((w["started_at"] for w in workers), default=0.0),
+        }
+
+    # --------------------------------------------------------
+    # Mode sessions
+    # --------------------------------------------------------
+
+    def open_session(self, mode: str) -> dict[str, Any]:
+        """End the current session (if any) and start a new one."""
+        now = time.time()
+        rows = self._write([
+            ("UPDATE mode_sessions SET ended_at = ? WHERE ended_at IS NULL", (now,)),
+            ("INSERT INTO mode_sessions (mode, started_at) VALUES (?, ?)", (mode, now)),
+            ("SELECT * FROM mode_sessions WHERE id = last_insert_rowid()", ()),
+        ])
+        return dict(rows[0])
+
+    def close_session(self) -> Optional[dict[str, Any]]:
+        """End the current session and return it."""
+        rows = self._write([
+            ("UPDATE mode_sessions SET ended_at = ? WHERE ended_at IS NULL", (time.time(),)),
+            ("SELECT * FROM mode_sessions WHERE id = (SELECT MAX(id) FROM mode_sessions) "
+             "AND changes() > 0", ()),
+        ])
+        return dict(rows[0]) if rows else None
+
+    def current_session(self) -> Optional[dict[str, Any]]:
+        rows = self._read("SELECT * FROM mode_sessions WHERE ended_at IS NULL ORDER BY id DESC LIMIT 1")
+        return dict(rows[0]) if rows else None
+
+    def record_task(self, completed: bool) -> None:
+        """Count a task against the current session."""
+        self._write([(
+            "UPDATE mode_sessions SET task_count = task_count + 1, "
+            "completed_count = completed_count + ? WHERE ended_at IS NULL",
+            (1 if completed else 0,),
+        )])
+
+    def session_history(self, limit: int = 100) -> list[dict[str, Any]]:
+        """Completed sessions, oldest first."""
+        rows = self._read(
+            "SELECT * FROM (SELECT * FROM mode_sessions WHERE ended_at IS NOT NULL "
+            "ORDER BY id DESC LIMIT ?) ORDER BY id",
+            (limit,),
+        )
+        return [dict(r) for r in rows]
@@ -3,19 +3,37 @@ Creative Liberation Engine v5 — Git Memory Backend
 
 Archival memory backend using GitHub repository for persistent, versioned storage.
 Memories are stored as markdown files in a structured directory layout.
+Queries run against a persistent BM25 inverted index (search_index.json) and
+the metadata in index.json; only the matching files are read.
+
+Index mutations are appended to a write-ahead journal (index.journal) and
+folded into the index.json snapshot by periodic compaction, so a write costs
+one appended line rather than a full index rewrite.
+
+With a GitCommitScheduler attached, changed files are committed in batches
+in the background (and pushed), never on the write path.
 
 Lineage: v4 memory/github_mcp.py → v5 git backend
 """
 
+import asyncio
+import bisect
 import logging
 import json
+import os
+import time
 import uuid
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Iterator, Optional
 from datetime import datetime
 
-from cle.memory.types import Memory, MemoryQuery, MemoryResult, MemoryType, MemoryBackend
+from cle.memory.types import (
+    Memory, MemoryQuery, MemoryRecord, MemoryResult, MemoryType, MemoryBackend,
+    decode_cursor, encode_cursor, local_naive,
+)
 from cle.memory.service import MemoryBackendInterface
+from cle.memory.backends.search_index import InvertedIndex
+from cle.memory.backends.git_sync import GitCommitScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -37,13 +55,48 @@ class GitBackend(MemoryBackendInterface):
         │   └── chose-pnpm-over-npm.md
         ├── patterns/
         │   └── agent-coordination-pattern.md
-        └── index.json
+        ├── index.json          # snapshot
+        ├── index.journal       # mutations since the snapshot (JSON lines)
+        └── search_index.json
+
+    Durability: journal lines are flushed on every write and fsynced at most
+    once per fsync_interval seconds (0 = every write). After compact_every
+    journal records the index is compacted: snapshot written to a temp file,
+    fsynced, atomically renamed over index.json, then the journal truncated.
+    Replay is idempotent, so a crash at any point loses at most the writes
+    of the last fsync interval.
+
+    Git sync: pass a GitCommitScheduler to commit memory files and the
+    index.json snapshot once per window and push asynchronously. The journal
+    and search index are local derived state and are git-ignored.
+
+        backend = GitBackend(repo, commit_scheduler=GitCommitScheduler(repo, pathspec="memories"))
     """
 
-    def __init__(self, repo_path: str, memories_dir: str = "memories"):
+    def __init__(
+        self,
+        repo_path: str,
+        memories_dir: str = "memories",
+        compact_every: int = 1000,
+        fsync_interval: float = 1.0,
+        commit_scheduler: Optional[GitCommitScheduler] = None,
+    ):
         self.repo_path = Path(repo_path)
         self.memories_dir = self.repo_path / memories_dir
+        self.index_path = self.memories_dir / "index.json"
+        self.journal_path = self.memories_dir / "index.journal"
+        self.compact_every = compact_every
+        self.fsync_interval = fsync_interval
         self._index: dict[str, dict] = {}
+        self._by_created: list[tuple[datetime, str]] = []  # (created, id), ascending
+        self._search = InvertedIndex(self.memories_dir / "search_index.json")
+        self._journal = None
+        self._journal_records = 0
+        self._last_fsync = 0.0
+        self._scheduler = commit_scheduler
+        if commit_scheduler is not None and commit_scheduler.before_commit is None:
+            # Commit an index.json that includes everything journaled so far
+            commit_scheduler.before_commit = self.compact
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -52,13 +105,34 @@ class GitBackend(MemoryBackendInterface):
         for mem_type in MemoryType:
             (self.memories_dir / mem_type.value).mkdir(parents=True, exist_ok=True)
 
-        # Load or create index
-        index_path = self.memories_dir / "index.json"
-        if index_path.exists():
-            self._index = json.loads(index_path.read_text(encoding="utf-8"))
+        # Load snapshot, then replay mutations journaled since it was taken
+        if self.index_path.exists():
+            self._index = json.loads(self.index_path.read_text(encoding="utf-8"))
         else:
             self._index = {}
-            self._save_index()
+        self._by_created = sorted(self._created_key(memory_id, info) for memory_id, info in self._index.items())
+        replayed = self._replay_journal()
+        self._journal = open(self.journal_path, "a", encoding="utf-8")
+        self._journal_records = replayed
+        if replayed or not self.index_path.exists():
+            self.compact()
+
+        # Only memories added, moved, or removed since the last save are re-read
+        self._search.load()
+        added, removed = self._search.reconcile(
+            {memory_id: info["file"] for memory_id, info in self._index.items()},
+            self._read_file,
+        )
+        if added or removed:
+            logger.info(f"Search index reconciled: +{added} -{removed}")
+            self._search.save()
+
+        if self._scheduler is not None:
+            ignore = self.memories_dir / ".gitignore"
+            if not ignore.exists():
+                ignore.write_text("index.journal\nsearch_index.json\n*.tmp\n", encoding="utf-8")
+                self._scheduler.mark(self._relative(ignore))
+            await self._scheduler.start()
 
         self._initialized = True
         logger.info(f"Git backend initialized: {self.repo_path} ({len(self._index)} memories)")
@@ -71,13 +145,158 @@ class GitBackend(MemoryBackendInterface):
         if not self._initialized:
             raise RuntimeError("Git backend not initialized. Call initialize() first.")
 
-    def _save_index(self) -> None:
-        """Save the memory index."""
-        index_path = self.memories_dir / "index.json"
-        index_path.write_text(
-            json.dumps(self._index, indent=2, default=str),
-            encoding="utf-8",
-        )
+    # --------------------------------------------------------
+    # Journal
+    # --------------------------------------------------------
+
+    def _apply(self, record: dict) -> None:
+        op = record["op"]
+        if op == "put":
+            for memory_id, entry in record["entries"].items():
+                self._unorder(memory_id)
+                self._index[memory_id] = entry
+                bisect.insort(self._by_created, self._created_key(memory_id, entry))
+        elif op == "del":
+            for memory_id in record["ids"]:
+                self._unorder(memory_id)
+                self._index.pop(memory_id, None)
+
+    @staticmethod
+    def _created_key(memory_id: str, info: dict) -> tuple[datetime, str]:
+        return local_naive(datetime.fromisoformat(info["created"])), memory_id
+
+    def _unorder(self, memory_id: str) -> None:
+        """Drop a memory from the creation-ordered list (before it is replaced or deleted)."""
+        info = self._index.get(memory_id)
+        if info is None:
+            return
+        key = self._created_key(memory_id, info)
+        i = bisect.bisect_left(self._by_created, key)
+        if i < len(self._by_created) and self._by_created[i] == key:
+            del self._by_created[i]
+
+    def _replay_journal(self) -> int:
+        """Apply journaled mutations; drop a torn tail from an interrupted write."""
+        if not self.journal_path.exists():
+            return 0
+        applied = 0
+        valid_bytes = 0
+        with open(self.journal_path, "rb") as f:
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(raw)
+                except ValueError:
+                    break
+                self._apply(record)
+                applied += 1
+                valid_bytes += len(raw)
+        size = self.journal_path.stat().st_size
+        if valid_bytes < size:
+            logger.warning(f"Dropping {size - valid_bytes} torn bytes from {self.journal_path}")
+            with open(self.journal_path, "rb+") as f:
+                f.truncate(valid_bytes)
+        return applied
+
+    def _log(self, record: dict) -> None:
+        """Apply a mutation and append it to the journal."""
+        self._apply(record)
+        self._journal.write(json.dumps(record, default=str, separators=(",", ":")) + "\n")
+        self._journal.flush()
+        self._journal_records += 1
+
+        now = time.monotonic()
+        if now - self._last_fsync >= self.fsync_interval:
+            os.fsync(self._journal.fileno())
+            self._last_fsync = now
+        if self._journal_records >= self.compact_every:
+            self.compact()
+
+    def sync(self) -> None:
+        """Force journaled writes to disk."""
+        if self._journal is not None:
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._last_fsync = time.monotonic()
+
+    def compact(self) -> None:
+        """Fold the journal into a new index.json snapshot (atomic rename) and truncate it."""
+        tmp = self.index_path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, indent=2, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.index_path)
+        if self._scheduler is not None:
+            self._scheduler.mark(self._relative(self.index_path))
+        if self._journal is not None:
+            self._journal.truncate(0)
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+        self._journal_records = 0
+        self._search.save()
+
+    async def close(self) -> None:
+        """Compact, release the journal, and flush pending git commits and pushes."""
+        if self._journal is None:
+            return
+        self.compact()
+        self._journal.close()
+        self._journal = None
+        self._initialized = False
+        if self._scheduler is not None:
+            await self._scheduler.close()
+
+    def _relative(self, path: Path) -> str:
+        return str(path.relative_to(self.repo_path))
+
+    def _read_file(self, memory_id: str) -> Optional[str]:
+        info = self._index.get(memory_id)
+        if not info:
+            return None
+        file_path = self.repo_path / info["file"]
+        if not file_path.exists():
+            return None
+        return file_path.read_text(encoding="utf-8")
+
+    def _index_fields(self, memory_id: str) -> dict[str, Any]:
+        """Memory fields held in the index (everything but the file body)."""
+        info = self._index[memory_id]
+        return {
+            "id": memory_id,
+            "memory_type": MemoryType(info["type"]),
+            "source": info.get("source", ""),
+            "project": info.get("project", ""),
+            "tags": info.get("tags", []),
+            "importance": info.get("importance", 0.5),
+            "created_at": info["created"],
+        }
+
+    def _load_memory(self, memory_id: str, with_content: bool = True) -> Optional[Memory]:
+        if not with_content:
+            return Memory(content="", **self._index_fields(memory_id)) if memory_id in self._index else None
+        content = self._read_file(memory_id)
+        if content is None:
+            return None
+        return Memory(content=content, **self._index_fields(memory_id))
+
+    @staticmethod
+    def _matches_filters(info: dict, query: MemoryQuery) -> bool:
+        """Type/project/importance/tag filters, answered from the index alone."""
+        if query.memory_type and info["type"] != query.memory_type.value:
+            return False
+        if query.project and info.get("project") != query.project:
+            return False
+        if info.get("importance", 0) < query.min_importance:
+            return False
+        if query.tags and not set(query.tags) & set(info.get("tags", [])):
+            return False
+        if query.created_after and (
+            local_naive(datetime.fromisoformat(info["created"])) <= local_naive(query.created_after)
+        ):
+            return False
+        return True
 
     def _memory_to_markdown(self, memory: Memory) -> str:
         """Convert a memory to a markdown file."""
@@ -115,21 +334,24 @@ class GitBackend(MemoryBackendInterface):
         slug = re.sub(r'[-\s]+', '-', slug)
         return slug[:60]
 
-    async def store(self, memory: Memory) -> str:
-        """Store a memory as a markdown file."""
-        self._ensure_initialized()
-
+    def _write_memory(self, memory: Memory) -> tuple[str, dict]:
+        """Write a memory's markdown file and index it for search. Returns (id, index entry)."""
         memory_id = memory.id or str(uuid.uuid4())
         slug = self._slug(memory.content[:60])
         filename = f"{datetime.now().strftime('%Y-%m-%d')}_{slug}.md"
 
         # Write file
         file_path = self.memories_dir / memory.memory_type.value / filename
-        file_path.write_text(self._memory_to_markdown(memory), encoding="utf-8")
+        markdown = self._memory_to_markdown(memory)
+        file_path.write_text(markdown, encoding="utf-8")
+
+        # Re-storing an ID under a new slug/date/type supersedes its old file
+        previous = self._index.get(memory_id)
+        if previous and previous["file"] != self._relative(file_path):
+            self._remove_file(previous["file"])
 
-        # Update index
-        self._index[memory_id] = {
-            "file": str(file_path.relative_to(self.repo_path)),
+        entry = {
+            "file": self._relative(file_path),
             "type": memory.memory_type.value,
             "source": memory.source,
             "project": memory.project,
@@ -137,76 +359,183 @@ class GitBackend(MemoryBackendInterface):
             "tags": memory.tags,
             "created": memory.created_at.isoformat(),
         }
-        self._save_index()
+        self._search.add(memory_id, markdown, source=entry["file"])
+        if self._scheduler is not None:
+            self._scheduler.mark(entry["file"])
+        return memory_id, entry
+
+    async def store(self, memory: Memory) -> str:
+        """Store a memory as a markdown file."""
+        self._ensure_initialized()
+
+        memory_id, entry = self._write_memory(memory)
+        self._log({"op": "put", "entries": {memory_id: entry}})
 
         return memory_id
 
-    async def query(self, query: MemoryQuery) -> MemoryResult:
-        """Query memories by searching the index and file contents."""
-        self._ensure_initialized()
+    async def store_many(self, memories: list[Memory]) -> list[str]:
+        """
+        Store a batch of memories with a single journal record.
 
-        matches = []
-        query_lower = query.text.lower()
+        Returns one ID per input, in order. When the batch repeats an ID the
+        last memory wins and the files of earlier ones are removed.
+        """
+        self._ensure_initialized()
 
-        for memory_id, info in self._index.items():
-            # Type filter
-            if query.memory_type and info["type"] != query.memory_type.value:
+        ids: list[str] = []
+        entries: dict[str, dict] = {}
+        for memory in memories:
+            memory_id, entry = self._write_memory(memory)
+            superseded = entries.get(memory_id)
+            if superseded is not None and superseded["file"] != entry["file"]:
+                self._remove_file(superseded["file"])
+            entries[memory_id] = entry
+            ids.append(memory_id)
+        if entries:
+            self._log({"op": "put", "entries": entries})
+        return ids
+
+    def _remove_file(self, relative_path: str) -> None:
+        file_path = self.repo_path / relative_path
+        if file_path.exists():
+            file_path.unlink()
+        if self._scheduler is not None:
+            self._scheduler.mark(relative_path)
+
+    def _ranked(self, query: MemoryQuery) -> list[str]:
+        """Every match for a text query, best first."""
+        hits = self._search.search(
+            query.text,
+            limit=None,
+            allow=lambda memory_id: (
+                memory_id in self._index and self._matches_filters(self._index[memory_id], query)
+            ),
+        )
+        return [memory_id for memory_id, _ in hits]
+
+    def _wildcard_page(self, query: MemoryQuery) -> tuple[list[str], Optional[str]]:
+        """
+        One page of "*" matches, oldest first: (ids, next cursor).
+
+        Keyset-paged on (created, id) over the creation-ordered list, so a page
+        costs a bisect plus the entries it scans, and memories added while
+        paging don't shift later pages.
+        """
+        position = decode_cursor(query.cursor)
+        start = 0
+        if "after" in position:
+            created, memory_id = position["after"]
+            start = bisect.bisect_right(self._by_created, (datetime.fromisoformat(created), memory_id))
+        if query.created_after is not None:
+            after = local_naive(query.created_after)
+            start = max(start, bisect.bisect_right(self._by_created, after, key=lambda k: k[0]))
+        page: list[str] = []
+        more = False
+        for i in range(start, len(self._by_created)):
+            memory_id = self._by_created[i][1]
+            if not self._matches_filters(self._index[memory_id], query):
                 continue
+            if len(page) == query.limit:
+                more = True
+                break
+            page.append(memory_id)
+        next_cursor = None
+        if more:
+            created, memory_id = self._created_key(page[-1], self._index[page[-1]])
+            next_cursor = encode_cursor({"after": [created.isoformat(), memory_id]})
+        return page, next_cursor
+
+    def _wildcard_total(self, query: MemoryQuery) -> Optional[int]:
+        """Matches for a "*" query when a bisect can tell; None if it would take a scan."""
+        if query.memory_type or query.project or query.tags or query.min_importance > 0:
+            return None
+        if query.created_after is None:
+            return len(self._by_created)
+        after = local_naive(query.created_after)
+        return len(self._by_created) - bisect.bisect_right(self._by_created, after, key=lambda k: k[0])
+
+    def _page(self, query: MemoryQuery) -> tuple[list[str], Optional[str], Optional[int]]:
+        """
+        One page of matching IDs from the indexes: (ids, next cursor, total).
+
+        Ranked pages use offsets and total counts every match. Wildcard pages
+        stop scanning once the page is full, so their total is only known
+        when no index filter applies (see MemoryResult.total_found).
+        """
+        if query.text == "*":
+            page, next_cursor = self._wildcard_page(query)
+            return page, next_cursor, self._wildcard_total(query)
+        ranked = self._ranked(query)
+        start = decode_cursor(query.cursor).get("offset", 0)
+        end = start + query.limit
+        page = ranked[start:end]
+        next_cursor = encode_cursor({"offset": end}) if end < len(ranked) and page else None
+        return page, next_cursor, len(ranked)
 
-            # Project filter
-            if query.project and info.get("project") != query.project:
-                continue
+    async def query(self, query: MemoryQuery) -> MemoryResult:
+        """
+        Query memories via the search index; only the returned files are read.
 
-            # Importance filter
-            if info.get("importance", 0) < query.min_importance:
-                continue
+        With query.fields set and "content" not among them, no file is read.
+        """
+        self._ensure_initialized()
+        start = time.perf_counter()
 
-            # Text search in file
-            file_path = self.repo_path / info["file"]
-            if file_path.exists():
-                content = file_path.read_text(encoding="utf-8")
-                if query_lower in content.lower() or query.text == "*":
-                    matches.append(Memory(
-                        id=memory_id,
-                        content=content,
-                        memory_type=MemoryType(info["type"]),
-                        source=info.get("source", ""),
-                        project=info.get("project", ""),
-                        tags=info.get("tags", []),
-                        importance=info.get("importance", 0.5),
-                    ))
-
-            if len(matches) >= query.limit:
-                break
+        page, next_cursor, total = self._page(query)
+        with_content = query.fields is None or "content" in query.fields
+        matches = []
+        for memory_id in page:
+            memory = self._load_memory(memory_id, with_content)
+            if memory is not None:
+                matches.append(memory)
 
         return MemoryResult(
             memories=matches,
             query=query.text,
-            total_found=len(matches),
+            total_found=total,
+            search_time_ms=round((time.perf_counter() - start) * 1000, 2),
+            backend=self.backend_type.value,
+            next_cursor=next_cursor,
         )
 
+    async def iter_query(self, query: MemoryQuery) -> AsyncIterator[MemoryRecord]:
+        """
+        Stream all matches as index-only records; a file is read only when .content is used.
+
+        Wildcard queries walk the creation-ordered list a page at a time; text
+        queries are ranked once and the ranking is sliced. Each page yields
+        control to the event loop.
+        """
+        self._ensure_initialized()
+        if query.text == "*":
+            pages = self._wildcard_pages(query)
+        else:
+            ranked = self._ranked(query)
+            start = decode_cursor(query.cursor).get("offset", 0)
+            pages = (ranked[i:i + query.limit] for i in range(start, len(ranked), query.limit))
+        for page in pages:
+            for memory_id in page:
+                if memory_id not in self._index:
+                    continue  # deleted while iterating
+                yield MemoryRecord.lazy(
+                    lambda memory_id=memory_id: self._read_file(memory_id),
+                    query.fields,
+                    **self._index_fields(memory_id),
+                )
+            await asyncio.sleep(0)
+
+    def _wildcard_pages(self, query: MemoryQuery) -> Iterator[list[str]]:
+        while True:
+            page, next_cursor = self._wildcard_page(query)
+            yield page
+            if next_cursor is None:
+                return
+            query = query.model_copy(update={"cursor": next_cursor})
+
     async def get(self, memory_id: str) -> Optional[Memory]:
         """Get a specific memory by ID."""
         self._ensure_initialized()
-
-        info = self._index.get(memory_id)
-        if not info:
-            return None
-
-        file_path = self.repo_path / info["file"]
-        if not file_path.exists():
-            return None
-
-        content = file_path.read_text(encoding="utf-8")
-        return Memory(
-            id=memory_id,
-            content=content,
-            memory_type=MemoryType(info["type"]),
-            source=info.get("source", ""),
-            project=info.get("project", ""),
-            tags=info.get("tags", []),
-            importance=info.get("importance", 0.5),
-        )
+        return self._load_memory(memory_id)
 
     async def delete(self, memory_id: str) -> bool:
         """Delete a memory file and index entry."""
@@ -216,12 +545,9 @@ class GitBackend(MemoryBackendInterface):
         if not info:
             return False
 
-        file_path = self.repo_path / info["file"]
-        if file_path.exists():
-            file_path.unlink()
-
-        del self._index[memory_id]
-        self._save_index()
+        self._remove_file(info["file"])
+        self._search.remove(memory_id)
+        self._log({"op": "del", "ids": [memory_id]})
         return True
 
     async def count(self) -> int:
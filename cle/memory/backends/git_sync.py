@@ -0,0 +1,220 @@
+"""
+Creative Liberation Engine v5 — Git Commit Scheduler
+
+Background batching of memory writes into git commits:
+1. Writers mark changed paths — no git process on the ingest path
+2. One commit per time window, or sooner once max_pending paths accumulate
+3. Pushes run asynchronously; pushes requested while one is in flight coalesce
+4. close() flushes what's pending and waits for the last push
+
+Lineage: v4 memory/github_mcp.py (sync via GitHub) → v5 git_sync
+"""
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class GitCommitScheduler:
+    """
+    Batches pending file changes into periodic commits and async pushes.
+
+    Usage:
+        scheduler = GitCommitScheduler("/data/memory-repo", pathspec="memories")
+        await scheduler.start()
+        scheduler.mark("memories/semantic/2026-03-02_dark-mode.md")  # cheap, sync
+        ...
+        await scheduler.close()  # final commit + push
+    """
+
+    def __init__(
+        self,
+        repo_path: str | Path,
+        pathspec: str = ".",
+        window_seconds: float = 30.0,
+        max_pending: int = 200,
+        remote: Optional[str] = "origin",
+        branch: Optional[str] = None,
+        author: Optional[tuple[str, str]] = None,
+        before_commit: Optional[Callable[[], None]] = None,
+    ):
+        self.repo_path = Path(repo_path)
+        self.pathspec = pathspec
+        self.window_seconds = window_seconds
+        self.max_pending = max_pending
+        self.remote = remote
+        self.branch = branch
+        self.author = author
+        self.before_commit = before_commit
+
+        self._pending: set[str] = set()
+        self._wake = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._loop_task: Optional[asyncio.Task] = None
+        self._push_task: Optional[asyncio.Task] = None
+        self._push_again = False
+        self._running = False
+
+        self._commits = 0
+        self._pushes = 0
+        self._push_failures = 0
+        self._last_commit_at: Optional[float] = None
+        self._last_error: Optional[str] = None
+
+    # --------------------------------------------------------
+    # Lifecycle
+    # --------------------------------------------------------
+
+    async def start(self) -> None:
+        """Initialize the repository if needed and start the commit loop."""
+        if self._running:
+            return
+        if not (self.repo_path / ".git").exists():
+            result = await self._git(["init"])
+            if not result.get("ok"):
+                raise RuntimeError(f"git init failed in {self.repo_path}: {result}")
+        self._running = True
+        self._loop_task = asyncio.create_task(self._commit_loop())
+        logger.info(f"Git commit scheduler started: {self.repo_path} (window {self.window_seconds}s)")
+
+    async def close(self) -> None:
+        """Stop the loop, commit anything pending, and wait for the final push."""
+        self._running = False
+        if self._loop_task is not None:
+            self._wake.set()
+            await self._loop_task
+            self._loop_task = None
+        await self.flush()
+        if self._push_task is not None:
+            await self._push_task
+
+    # --------------------------------------------------------
+    # Scheduling
+    # --------------------------------------------------------
+
+    def mark(self, *paths: str | Path) -> None:
+        """Record changed paths (relative to the repo). Never blocks on git."""
+        for path in paths:
+            self._pending.add(str(path))
+        if len(self._pending) >= self.max_pending:
+            self._wake.set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def _commit_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.window_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if not self._running:
+                break
+            try:
+                await self.flush()
+            except Exception as e:
+                self._last_error = str(e)
+                logger.error(f"Memory commit failed: {e}")
+
+    async def flush(self) -> bool:
+        """Commit pending changes now (one commit) and schedule a push. Returns True if committed."""
+        async with self._lock:
+            if not self._pending:
+                return False
+            if self.before_commit is not None:
+                self.before_commit()
+            batch, self._pending = self._pending, set()
+
+            add = await self._git(["add", "-A", "--", self.pathspec])
+            commit = await self._git(
+                [*self._identity(), "commit", "-q", "-m", f"memory: {len(batch)} change(s)", "--", self.pathspec]
+            ) if add.get("ok") else add
+
+            if not commit.get("ok"):
+                output = commit.get("stdout", "") + commit.get("stderr", "")
+                if "nothing to commit" in output or "no changes added" in output:
+                    return False
+                # Keep the batch for the next window
+                self._pending |= batch
+                self._last_error = commit.get("error") or commit.get("stderr", "").strip()
+                logger.warning(f"Memory commit failed, retrying next window: {self._last_error}")
+                return False
+
+            self._commits += 1
+            self._last_commit_at = time.time()
+            logger.debug(f"Committed {len(batch)} memory change(s)")
+
+        self._schedule_push()
+        return True
+
+    def _identity(self) -> list[str]:
+        if self.author is None:
+            return []
+        name, email = self.author
+        return ["-c", f"user.name={name}", "-c", f"user.email={email}"]
+
+    # --------------------------------------------------------
+    # Push
+    # --------------------------------------------------------
+
+    def _schedule_push(self) -> None:
+        if self.remote is None:
+            return
+        if self._push_task is not None and not self._push_task.done():
+            self._push_again = True
+            return
+        self._push_task = asyncio.create_task(self._push())
+
+    async def _push(self) -> None:
+        while True:
+            self._push_again = False
+            result = await self._git(["push", "-q", self.remote, self.branch or "HEAD"], timeout=120.0)
+            if result.get("ok"):
+                self._pushes += 1
+            else:
+                self._push_failures += 1
+                self._last_error = result.get("error") or result.get("stderr", "").strip()
+                logger.warning(f"Memory push failed: {self._last_error}")
+            if not self._push_again:
+                return
+
+    async def _git(self, args: list[str], timeout: float = 60.0) -> dict[str, Any]:
+        """Run git in the repo: {"ok", "returncode", "stdout", "stderr"} or {"ok": False, "error"}."""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "git", *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(self.repo_path),
+            )
+        except FileNotFoundError:
+            return {"ok": False, "error": "git not found. Is git installed?"}
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return {"ok": False, "error": f"git {args[0]} timed out after {timeout}s"}
+        return {
+            "ok": process.returncode == 0,
+            "returncode": process.returncode,
+            "stdout": stdout.decode("utf-8", errors="replace"),
+            "stderr": stderr.decode("utf-8", errors="replace"),
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "commits": self._commits,
+            "pushes": self._pushes,
+            "push_failures": self._push_failures,
+            "push_in_flight": self._push_task is not None and not self._push_task.done(),
+            "last_commit_at": self._last_commit_at,
+            "last_error": self._last_error,
+        }
@@ -0,0 +1,456 @@
+"""
+Creative Liberation Engine v5 — Local Vector Memory Backend
+
+In-process semantic memory — no ChromaDB server, no network round trips:
+  embeddings.f32    float32 unit vectors, memory-mapped, one row per memory
+  metadata.jsonl    journal of memory records (content + filter fields)
+
+Search:
+1. Metadata prefilters (type, project, importance, created) are numpy masks over rows
+2. Exact brute-force cosine search when the filtered set is small
+3. IVF index (cle.agents.neural.ann) above ann_threshold memories, with
+   post-filtering and an exact fallback if the filters starve it
+
+Embeddings come from Memory.embedding when present, otherwise from a
+pluggable embedder. Text queries are embedded with the same embedder;
+callers that store their own model vectors must query with
+MemoryQuery.embedding from that model, or the two live in different spaces.
+
+The default embedder is lexical only: a deterministic blake2b feature
+hash of words and word bigrams. It matches shared words, not meaning —
+plug in a real model for semantic recall.
+
+Lineage: v4 memory/hippocampus.py → v5 vector backend (ChromaDB) → v5 local vector
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from cle.agents.neural.ann import IVFIndex
+from cle.memory.types import Memory, MemoryQuery, MemoryResult, MemoryType, MemoryBackend, decode_cursor, encode_cursor
+from cle.memory.service import MemoryBackendInterface
+
+logger = logging.getLogger(__name__)
+
+EMBEDDINGS_FILE = "embeddings.f32"
+METADATA_FILE = "metadata.jsonl"
+
+_TOKEN_RE = re.compile(r"\w+")
+_TYPE_CODES = {t: i for i, t in enumerate(MemoryType)}
+
+
+class HashingEmbedder:
+    """
+    Deterministic feature-hashing text embedder (lexical, not semantic).
+
+    Words and word bigrams are each hashed (blake2b) to `probes` signed
+    buckets; the result is L2-normalized. Spreading a feature over several
+    buckets keeps a single bucket collision from outranking a real word
+    match. No model download, stable across processes.
+    """
+
+    def __init__(self, dim: int = 768, probes: int = 16):
+        self.dim = dim
+        self.probes = probes
+
+    def _features(self, text: str) -> list[str]:
+        words = _TOKEN_RE.findall(text.lower())
+        return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    def __call__(self, texts: list[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            features = self._features(text)
+            if not features:
+                continue
+            digests = np.frombuffer(
+                b"".join(hashlib.blake2b(f.encode(), digest_size=4 * self.probes).digest() for f in features),
+                dtype="<u4",
+            )
+            np.add.at(vectors[row], digests % self.dim, np.where(digests >> 31, 1.0, -1.0))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+class LocalVectorBackend(MemoryBackendInterface):
+    """
+    Memory-mapped vector backend with metadata prefilters.
+
+    Usage:
+        backend = LocalVectorBackend("data/memory/vectors")
+        await backend.initialize()
+        service.register_backend(backend, primary=True)
+
+        await backend.store_many(memories)      # one embed batch, one journal record
+        result = await backend.query(MemoryQuery(text="dark mode", memory_type=MemoryType.SEMANTIC))
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        dim: int = 768,
+        embedder: Optional[Callable[[list[str]], np.ndarray]] = None,
+        ann_threshold: int = 20000,
+        initial_capacity: int = 1024,
+    ):
+        self.root = Path(root)
+        self.dim = dim
+        self.embedder = embedder or HashingEmbedder(dim)
+        self.ann_threshold = ann_threshold
+        self.embeddings_path = self.root / EMBEDDINGS_FILE
+        self.metadata_path = self.root / METADATA_FILE
+
+        self._capacity = 0
+        self._initial_capacity = initial_capacity
+        self._matrix: Optional[np.memmap] = None
+        self._live = np.zeros(0, dtype=bool)
+        self._type = np.zeros(0, dtype=np.int8)
+        self._project = np.zeros(0, dtype=np.int32)
+        self._importance = np.zeros(0, dtype=np.float32)
+        self._created = np.zeros(0, dtype=np.float64)
+
+        self._rows: dict[str, int] = {}
+        self._ids: dict[int, str] = {}
+        self._records: dict[str, dict[str, Any]] = {}
+        self._free: list[int] = []
+        self._next_row = 0
+        self._project_codes: dict[str, int] = {"": 0}
+
+        self._ann: Optional[IVFIndex] = None
+        self._journal = None
+        self._journal_records = 0
+        self._initialized = False
+
+    @property
+    def backend_type(self) -> MemoryBackend:
+        return MemoryBackend.LOCAL_VECTOR
+
+    def _ensure_initialized(self) -> None:
+        if not self._initialized:
+            raise RuntimeError("Local vector backend not initialized. Call initialize() first.")
+
+    # --------------------------------------------------------
+    # Storage
+    # --------------------------------------------------------
+
+    async def initialize(self) -> None:
+        """Map the embeddings file and replay the metadata journal."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        rows = 0
+        if self.embeddings_path.exists():
+            rows = self.embeddings_path.stat().st_size // (self.dim * 4)
+        self._grow(max(rows, self._initial_capacity))
+
+        if self.metadata_path.exists():
+            with open(self.metadata_path, "rb") as f:
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break
+                    try:
+                        record = json.loads(raw)
+                    except ValueError:
+                        break
+                    self._apply(record)
+                    self._journal_records += 1
+        self._free = [r for r in range(self._next_row) if r not in self._ids]
+        self._compact()  # also drops any torn tail
+
+        if len(self._rows) >= self.ann_threshold:
+            self._build_ann()
+
+        self._initialized = True
+        logger.info(f"Local vector backend initialized: {self.root} ({len(self._rows)} memories)")
+
+    def _grow(self, needed: int) -> None:
+        """Ensure capacity for `needed` rows (file grows by doubling)."""
+        if needed <= self._capacity:
+            return
+        capacity = max(self._capacity, 1)
+        while capacity < needed:
+            capacity *= 2
+        if self._matrix is not None:
+            self._matrix.flush()
+            del self._matrix
+        with open(self.embeddings_path, "ab") as f:
+            f.truncate(capacity * self.dim * 4)
+        self._matrix = np.memmap(self.embeddings_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+        filters = (("_live", False), ("_type", 0), ("_project", 0), ("_importance", 0.0), ("_created", 0.0))
+        for name, fill in filters:
+            old = getattr(self, name)
+            new = np.full(capacity, fill, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+        self._capacity = capacity
+
+    def _project_code(self, project: str) -> int:
+        code = self._project_codes.get(project)
+        if code is None:
+            code = self._project_codes[project] = len(self._project_codes)
+        return code
+
+    def _apply(self, record: dict) -> None:
+        """Apply a journal record to the in-memory state (rows/filters/records)."""
+        if record["op"] == "put":
+            for memory_id, entry in record["entries"].items():
+                row = entry["row"]
+                self._grow(row + 1)
+                previous = self._rows.get(memory_id)
+                if previous is not None and previous != row:
+                    self._release(previous)
+                self._rows[memory_id] = row
+                self._ids[row] = memory_id
+                self._records[memory_id] = entry["memory"]
+                self._next_row = max(self._next_row, row + 1)
+                self._live[row] = True
+                self._type[row] = _TYPE_CODES[MemoryType(entry["memory"]["memory_type"])]
+                self._project[row] = self._project_code(entry["memory"].get("project", ""))
+                self._importance[row] = entry["memory"].get("importance", 0.5)
+                self._created[row] = datetime.fromisoformat(entry["memory"]["created_at"]).timestamp()
+        elif record["op"] == "del":
+            for memory_id in record["ids"]:
+                row = self._rows.pop(memory_id, None)
+                self._records.pop(memory_id, None)
+                if row is not None:
+                    self._release(row)
+
+    def _release(self, row: int) -> None:
+        self._ids.pop(row, None)
+        self._live[row] = False
+        self._free.append(row)
+
+    def _log(self, record: dict) -> None:
+        """Journal a record after its embedding rows are flushed to disk."""
+        self._matrix.flush()
+        self._journal.write(json.dumps(record, default=str, separators=(",", ":")) + "\n")
+        self._journal.flush()
+        self._journal_records += 1
+        if self._journal_records > 2 * len(self._rows) + 1000:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the journal as one put per live memory (atomic rename)."""
+        if self._journal is not None:
+            self._journal.close()
+        tmp = self.metadata_path.with_suffix(".jsonl.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for memory_id, row in self._rows.items():
+                record = {"op": "put", "entries": {memory_id: {"row": row, "memory": self._records[memory_id]}}}
+                f.write(json.dumps(record, default=str, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.metadata_path)
+        self._journal = open(self.metadata_path, "a", encoding="utf-8")
+        self._journal_records = len(self._rows)
+
+    async def close(self) -> None:
+        """Flush embeddings, compact the journal, and release files."""
+        if not self._initialized:
+            return
+        self._matrix.flush()
+        self._compact()
+        self._journal.close()
+        self._journal = None
+        self._initialized = False
+
+    # --------------------------------------------------------
+    # Writes
+    # --------------------------------------------------------
+
+    def _embed(self, memories: list[Memory]) -> np.ndarray:
+        vectors = np.zeros((len(memories), self.dim), dtype=np.float32)
+        missing = []
+        for i, memory in enumerate(memories):
+            if memory.embedding is not None and len(memory.embedding) == self.dim:
+                vectors[i] = memory.embedding
+            else:
+                missing.append(i)
+        if missing:
+            vectors[missing] = self.embedder([memories[i].content for i in missing])
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    async def store(self, memory: Memory) -> str:
+        """Store (upsert) a memory."""
+        return (await self.store_many([memory]))[0]
+
+    async def store_many(self, memories: list[Memory]) -> list[str]:
+        """Upsert a batch: one embedding call, one matrix write, one journal record."""
+        self._ensure_initialized()
+        if not memories:
+            return []
+
+        vectors = self._embed(memories)
+        entries: dict[str, dict[str, Any]] = {}
+        latest: dict[int, int] = {}  # row → index of its last input; a repeated ID keeps its last version
+        ids: list[str] = []
+        for i, memory in enumerate(memories):
+            memory_id = memory.id or str(uuid.uuid4())
+            row = self._rows.get(memory_id)
+            if row is None:
+                row = entries[memory_id]["row"] if memory_id in entries else (
+                    self._free.pop() if self._free else self._next_row
+                )
+                if row == self._next_row:
+                    self._next_row += 1
+            self._grow(row + 1)
+            record = memory.model_dump(mode="json", exclude={"embedding"})
+            record["id"] = memory_id
+            entries[memory_id] = {"row": row, "memory": record}
+            latest[row] = i
+            ids.append(memory_id)
+
+        rows = list(latest)
+        vectors = vectors[list(latest.values())]
+        self._matrix[rows] = vectors
+        record = {"op": "put", "entries": entries}
+        self._apply(record)
+        self._log(record)
+
+        if self._ann is not None:
+            self._ann.add_many(rows, vectors)
+        elif len(self._rows) >= self.ann_threshold:
+            self._build_ann()
+        return ids
+
+    async def delete(self, memory_id: str) -> bool:
+        self._ensure_initialized()
+        row = self._rows.get(memory_id)
+        if row is None:
+            return False
+        record = {"op": "del", "ids": [memory_id]}
+        self._apply(record)
+        self._log(record)
+        if self._ann is not None:
+            self._ann.remove(row)
+        return True
+
+    # --------------------------------------------------------
+    # Reads
+    # --------------------------------------------------------
+
+    def _build_ann(self) -> None:
+        self._ann = IVFIndex(self.dim, train_threshold=self.ann_threshold)
+        rows = sorted(self._ids)
+        self._ann.add_many(rows, np.asarray(self._matrix[rows]))
+        self._ann.train()
+        logger.info(f"Local vector ANN index built over {len(rows)} memories")
+
+    def _filter_mask(self, query: MemoryQuery) -> np.ndarray:
+        n = self._next_row
+        mask = self._live[:n].copy()
+        if query.memory_type is not None:
+            mask &= self._type[:n] == _TYPE_CODES[query.memory_type]
+        if query.project:
+            code = self._project_codes.get(query.project)
+            if code is None:
+                return np.zeros(n, dtype=bool)
+            mask &= self._project[:n] == code
+        if query.min_importance > 0:
+            mask &= self._importance[:n] >= query.min_importance
+        if query.created_after is not None:
+            mask &= self._created[:n] > query.created_after.timestamp()
+        return mask
+
+    def _matches_tags(self, memory_id: str, tags: Optional[list[str]]) -> bool:
+        return not tags or bool(set(tags) & set(self._records[memory_id].get("tags", [])))
+
+    def _to_memory(self, memory_id: str, include_embedding: bool = False) -> Memory:
+        memory = Memory(**self._records[memory_id])
+        if include_embedding:
+            memory.embedding = self._matrix[self._rows[memory_id]].tolist()
+        return memory
+
+    def _search_rows(self, vector: np.ndarray, mask: np.ndarray, k: int) -> list[int]:
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
+            return []
+
+        # Selective filters: exact search over the filtered rows is cheaper than the ANN
+        if self._ann is not None and candidates.size >= self.ann_threshold:
+            hits = self._ann.search(vector, k=4 * k)
+            rows = [row for row, _ in hits if row < mask.size and mask[row]]
+            if len(rows) >= k:
+                return rows[:k]
+
+        if candidates.size * 4 >= mask.size:
+            # Mostly unfiltered: one contiguous matvec beats gathering rows
+            scores = (self._matrix[: mask.size] @ vector)[candidates]
+        else:
+            scores = self._matrix[candidates] @ vector
+        k = min(k, candidates.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [int(candidates[i]) for i in top]
+
+    async def query(self, query: MemoryQuery) -> MemoryResult:
+        """Semantic search with metadata prefilters."""
+        self._ensure_initialized()
+        start = time.perf_counter()
+        mask = self._filter_mask(query)
+        offset = decode_cursor(query.cursor).get("offset", 0)
+        wanted = offset + query.limit + 1  # one extra tells whether another page exists
+
+        if query.text == "*":
+            # Wildcard results are oldest first, so created_after can page through them
+            rows = np.flatnonzero(mask)
+            rows = rows[np.argsort(self._created[rows], kind="stable")].tolist()
+        else:
+            if query.embedding is not None:
+                if len(query.embedding) != self.dim:
+                    raise ValueError(f"Query embedding has {len(query.embedding)} dims, backend expects {self.dim}")
+                vector = np.asarray(query.embedding, dtype=np.float32)
+                vector /= max(float(np.linalg.norm(vector)), 1e-12)
+            else:
+                vector = self._embed([Memory(content=query.text)])[0]
+            # Tag filters are checked per hit; over-fetch when they apply
+            rows = self._search_rows(vector, mask, wanted * (4 if query.tags else 1))
+
+        matched = []
+        for row in rows:
+            memory_id = self._ids[row]
+            if self._matches_tags(memory_id, query.tags):
+                matched.append(memory_id)
+            if len(matched) >= wanted:
+                break
+        end = offset + query.limit
+        memories = [self._to_memory(memory_id, query.include_embeddings) for memory_id in matched[offset:end]]
+
+        return MemoryResult(
+            memories=memories,
+            query=query.text,
+            # Every filtered row is a (ranked) match; tag filters are only checked per hit
+            total_found=None if query.tags else int(mask.sum()),
+            search_time_ms=round((time.perf_counter() - start) * 1000, 3),
+            backend=self.backend_type.value,
+            next_cursor=encode_cursor({"offset": end}) if len(matched) > end else None,
+        )
+
+    async def get(self, memory_id: str) -> Optional[Memory]:
+        self._ensure_initialized()
+        if memory_id not in self._records:
+            return None
+        return self._to_memory(memory_id)
+
+    async def count(self) -> int:
+        self._ensure_initialized()
+        return len(self._rows)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "memories": len(self._rows),
+            "capacity": self._capacity,
+            "dim": self.dim,
+            "ann": self._ann.get_stats() if self._ann is not None else None,
+            "journal_records": self._journal_records,
+        }
@@ -0,0 +1,234 @@
+"""
+Creative Liberation Engine v5 — Memory Search Index
+
+Persistent inverted index for the git memory backend:
+1. Postings: term → {memory ID → token positions}
+2. BM25 ranking over the matching memories
+3. Phrase detection from positions (exact phrases rank first)
+4. Incremental maintenance — add/remove one memory touches only its terms
+
+Persisted as search_index.json beside index.json. On load, the index is
+reconciled against the memory index: only memories that are new, moved,
+or deleted since the last save are re-read or dropped.
+"""
+
+import json
+import logging
+import math
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word tokens, in order."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class InvertedIndex:
+    """
+    Positional inverted index with BM25 scoring.
+
+    Usage:
+        index = InvertedIndex(path / "search_index.json")
+        index.add("mem-1", "User prefers dark mode", source="memories/semantic/x.md")
+        index.search("dark mode", limit=5)  # → [("mem-1", 1.42)]
+        index.remove("mem-1")
+        index.save()
+    """
+
+    def __init__(self, path: Optional[str | Path] = None, k1: float = 1.5, b: float = 0.75):
+        self.path = Path(path) if path else None
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[str, list[int]]] = {}
+        self._doc_len: dict[str, int] = {}
+        self._doc_source: dict[str, str] = {}
+        self._doc_terms: dict[str, list[str]] = {}
+        self._total_len = 0
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._doc_len)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_len
+
+    # --------------------------------------------------------
+    # Maintenance
+    # --------------------------------------------------------
+
+    def add(self, doc_id: str, text: str, source: str = "") -> None:
+        """Index (or re-index) one document. source identifies where its text came from."""
+        if doc_id in self._doc_len:
+            self.remove(doc_id)
+        tokens = tokenize(text)
+        positions: dict[str, list[int]] = {}
+        for position, term in enumerate(tokens):
+            positions.setdefault(term, []).append(position)
+        for term, term_positions in positions.items():
+            self._postings.setdefault(term, {})[doc_id] = term_positions
+        self._doc_len[doc_id] = len(tokens)
+        self._doc_source[doc_id] = source
+        self._doc_terms[doc_id] = list(positions)
+        self._total_len += len(tokens)
+        self._dirty = True
+
+    def remove(self, doc_id: str) -> bool:
+        """Drop a document from the index."""
+        length = self._doc_len.pop(doc_id, None)
+        if length is None:
+            return False
+        self._doc_source.pop(doc_id, None)
+        self._total_len -= length
+        for term in self._doc_terms.pop(doc_id, ()):
+            docs = self._postings.get(term)
+            if docs is not None:
+                docs.pop(doc_id, None)
+                if not docs:
+                    del self._postings[term]
+        self._dirty = True
+        return True
+
+    def source_of(self, doc_id: str) -> Optional[str]:
+        return self._doc_source.get(doc_id)
+
+    def reconcile(self, sources: dict[str, str], read: Callable[[str], Optional[str]]) -> tuple[int, int]:
+        """
+        Bring the index in line with the memory index.
+
+        sources maps each live memory ID to its source (file path); read(doc_id)
+        returns its text. Only new or moved memories are read; memories no longer
+        present are dropped. Returns (added, removed).
+        """
+        stale = [doc_id for doc_id in self._doc_len if doc_id not in sources]
+        for doc_id in stale:
+            self.remove(doc_id)
+
+        added = 0
+        for doc_id, source in sources.items():
+            if self._doc_source.get(doc_id) == source:
+                continue
+            text = read(doc_id)
+            if text is not None:
+                self.add(doc_id, text, source=source)
+                added += 1
+        return added, len(stale)
+
+    # --------------------------------------------------------
+    # Search
+    # --------------------------------------------------------
+
+    def _idf(self, term: str) -> float:
+        df = len(self._postings.get(term, ()))
+        n = len(self._doc_len)
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def _is_phrase(self, doc_id: str, terms: list[str]) -> bool:
+        starts = set(self._postings[terms[0]][doc_id])
+        for offset, term in enumerate(terms[1:], start=1):
+            starts &= {p - offset for p in self._postings[term][doc_id]}
+            if not starts:
+                return False
+        return True
+
+    def search(
+        self,
+        text: str,
+        limit: Optional[int] = 10,
+        allow: Optional[Callable[[str], bool]] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Memories containing every query term, best first.
+
+        Exact phrase matches rank ahead of scattered matches; within each group
+        results are ordered by BM25. allow(doc_id) filters candidates before
+        scoring. limit=None returns every match.
+        """
+        terms = list(dict.fromkeys(tokenize(text)))
+        if not terms or any(term not in self._postings for term in terms):
+            return []
+
+        # Intersect starting from the rarest term
+        by_rarity = sorted(terms, key=lambda t: len(self._postings[t]))
+        candidates: Iterable[str] = self._postings[by_rarity[0]]
+        for term in by_rarity[1:]:
+            docs = self._postings[term]
+            candidates = [d for d in candidates if d in docs]
+        if allow is not None:
+            candidates = [d for d in candidates if allow(d)]
+
+        avg_len = self._total_len / max(len(self._doc_len), 1)
+        idf = {term: self._idf(term) for term in terms}
+        scored = []
+        for doc_id in candidates:
+            norm = self.k1 * (1 - self.b + self.b * self._doc_len[doc_id] / max(avg_len, 1e-9))
+            score = 0.0
+            for term in terms:
+                tf = len(self._postings[term][doc_id])
+                score += idf[term] * tf * (self.k1 + 1) / (tf + norm)
+            phrase = len(terms) == 1 or self._is_phrase(doc_id, terms)
+            scored.append((phrase, score, doc_id))
+
+        scored.sort(key=lambda x: (x[0], x[1]), reverse=True)
+        if limit is not None:
+            scored = scored[:limit]
+        return [(doc_id, score) for _, score, doc_id in scored]
+
+    # --------------------------------------------------------
+    # Persistence
+    # --------------------------------------------------------
+
+    def load(self) -> bool:
+        """Load the persisted index. Returns False if absent or unreadable."""
+        if self.path is None or not self.path.exists():
+            return False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Search index at {self.path} unreadable, rebuilding: {e}")
+            return False
+        if data.get("version") != INDEX_FORMAT_VERSION:
+            return False
+        self._postings = data["postings"]
+        self._doc_len = {doc_id: doc["len"] for doc_id, doc in data["docs"].items()}
+        self._doc_source = {doc_id: doc["source"] for doc_id, doc in data["docs"].items()}
+        self._total_len = sum(self._doc_len.values())
+        self._doc_terms = {doc_id: [] for doc_id in self._doc_len}
+        for term, docs in self._postings.items():
+            for doc_id in docs:
+                self._doc_terms.setdefault(doc_id, []).append(term)
+        self._dirty = False
+        return True
+
+    def save(self, force: bool = False) -> None:
+        """Atomically persist the index if it changed since the last save."""
+        if self.path is None or not (self._dirty or force):
+            return
+        data = {
+            "version": INDEX_FORMAT_VERSION,
+            "docs": {
+                doc_id: {"len": length, "source": self._doc_source.get(doc_id, "")}
+                for doc_id, length in self._doc_len.items()
+            },
+            "postings": self._postings,
+        }
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+    def get_stats(self) -> dict:
+        return {
+            "documents": len(self._doc_len),
+            "terms": len(self._postings),
+            "avg_doc_len": round(self._total_len / max(len(self._doc_len), 1), 2),
+            "top_terms": Counter({t: len(d) for t, d in self._postings.items()}).most_common(5),
+        }
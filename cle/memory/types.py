@@ -4,9 +4,11 @@ Creative Liberation Engine v5 — Memory Types
 Pydantic models for the unified memory system.
 """
 
+import base64
+import json
 from enum import Enum
-from pydantic import BaseModel, Field
-from typing import Any, Optional
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Any, Callable, Optional
 from datetime import datetime
 
 
@@ -22,6 +24,7 @@ class MemoryType(str, Enum):
 class MemoryBackend(str, Enum):
     """Available memory storage backends."""
     VECTOR = "vector"       # ChromaDB
+    LOCAL_VECTOR = "local_vector"  # In-process, memory-mapped
     GIT = "git"             # GitHub repository
     FIRESTORE = "firestore" # Cloud Firestore
 
@@ -52,14 +55,113 @@ class MemoryQuery(BaseModel):
     project: Optional[str] = None
     tags: Optional[list[str]] = None
     min_importance: float = 0.0
+    created_after: Optional[datetime] = None  # strictly after
     limit: int = 10
     include_embeddings: bool = False
+    embedding: Optional[list[float]] = None  # query vector; same model as stored Memory.embedding
+    cursor: Optional[str] = None  # next_cursor of the previous page
+    fields: Optional[list[str]] = None  # projection; content is only read if listed
 
 
 class MemoryResult(BaseModel):
     """Result from a memory query."""
     memories: list[Memory] = Field(default_factory=list)
     query: str = ""
-    total_found: int = 0
+    total_found: Optional[int] = 0  # matches across all pages; None when the backend can't count them cheaply
     search_time_ms: float = 0.0
     backend: str = ""
+    next_cursor: Optional[str] = None  # None when there are no more pages
+
+
+RECORD_FIELDS = ("memory_type", "source", "project", "tags", "importance", "created_at")
+
+
+class MemoryRecord(BaseModel):
+    """
+    Metadata projection of a memory, with content loaded on first access.
+
+    Returned by iter_query: paging through large histories reads only the
+    index; a file body is read only if .content is touched. Fields left out
+    of the projection are None — never a default that could pass for data.
+    """
+    id: str
+    memory_type: Optional[MemoryType] = None
+    source: Optional[str] = None
+    project: Optional[str] = None
+    tags: Optional[list[str]] = None
+    importance: Optional[float] = None
+    created_at: Optional[datetime] = None
+
+    _content: Optional[str] = PrivateAttr(default=None)
+    _loader: Optional[Callable[[], Optional[str]]] = PrivateAttr(default=None)
+    _omitted: frozenset[str] = PrivateAttr(default=frozenset())
+
+    @classmethod
+    def lazy(
+        cls,
+        loader: Callable[[], Optional[str]],
+        fields: Optional[list[str]] = None,
+        **values: Any,
+    ) -> "MemoryRecord":
+        """Record whose content comes from loader(); values outside fields are left unset (None)."""
+        omitted: frozenset[str] = frozenset()
+        if fields is not None:
+            omitted = frozenset(RECORD_FIELDS) - set(fields)
+            values = {k: v for k, v in values.items() if k not in omitted}
+        record = cls(**values)
+        record._loader = loader
+        record._omitted = omitted
+        return record
+
+    @classmethod
+    def from_memory(cls, memory: Memory, fields: Optional[list[str]] = None) -> "MemoryRecord":
+        return cls.lazy(lambda: memory.content, fields, **memory.model_dump(include={"id", *RECORD_FIELDS}))
+
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            self._content = (self._loader() if self._loader else None) or ""
+            self._loader = None
+        return self._content
+
+    @property
+    def content_loaded(self) -> bool:
+        return self._content is not None
+
+    @property
+    def omitted_fields(self) -> frozenset[str]:
+        """Fields the projection left out."""
+        return self._omitted
+
+    def to_memory(self) -> Memory:
+        """Full Memory for this record. Raises ValueError for a projected record."""
+        if self._omitted:
+            raise ValueError(
+                f"Memory {self.id} was projected without {sorted(self._omitted)}; query those fields to build a Memory"
+            )
+        values = self.model_dump(exclude_none=True)
+        return Memory(content=self.content, **values)
+
+
+def local_naive(value: datetime) -> datetime:
+    """
+    Naive local time for comparisons. Stored timestamps are naive local
+    (datetime.now()); an aware value is converted to local time first.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+def encode_cursor(position: dict[str, Any]) -> str:
+    """Opaque page cursor for a backend-specific position."""
+    return base64.urlsafe_b64encode(json.dumps(position, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> dict[str, Any]:
+    if not cursor:
+        return {}
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError as e:
+        raise ValueError(f"Invalid memory cursor: {cursor!r}") from e
@@ -0,0 +1,273 @@
+"""
+Creative Liberation Engine v5 — Telemetry
+
+Lightweight, dependency-free instrumentation:
+  - Latency histograms per agent, gate, route, and guard check (p50/p95/p99)
+  - Prometheus text exposition for the /metrics endpoint
+  - Optional span tracing of a task: route → pre_flight → execute → post_flight
+
+Histograms use fixed buckets, so recording is O(log buckets) and memory is
+constant no matter how many observations are made.
+"""
+
+import bisect
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+# Bucket upper bounds in milliseconds (+Inf is implicit)
+DEFAULT_BUCKETS_MS: tuple[float, ...] = (
+    0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100,
+    250, 500, 1000, 2500, 5000, 10000, 30000, 60000,
+)
+
+QUANTILES: tuple[float, ...] = (0.5, 0.95, 0.99)
+
+METRIC_HELP: dict[str, str] = {
+    "cle_agent_execution_ms": "Agent execution latency in milliseconds",
+    "cle_gate_check_ms": "Execution gate check latency in milliseconds",
+    "cle_route_ms": "Task routing latency in milliseconds",
+    "cle_guard_check_ms": "Constitutional article check latency in milliseconds",
+    "cle_task_stage_ms": "Task pipeline stage latency in milliseconds",
+}
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with interpolated quantiles."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value_ms)] += 1
+        self.count += 1
+        self.sum += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside its bucket."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                fraction = (rank - seen) / bucket_count
+                return min(lower + (upper - lower) * fraction, self.max)
+            seen += bucket_count
+        return self.max
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum, 3),
+            "max_ms": round(self.max, 3),
+            **{f"p{int(q * 100)}": round(self.quantile(q), 3) for q in QUANTILES},
+        }
+
+
+LabelSet = tuple[tuple[str, str], ...]
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """
+    Process-wide store of labelled latency histograms.
+
+    Usage:
+        metrics = get_metrics()
+        metrics.observe("cle_agent_execution_ms", 12.5, agent="kbuildd")
+        text = metrics.render_prometheus()
+    """
+
+    def __init__(self):
+        self._histograms: dict[str, dict[LabelSet, LatencyHistogram]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value_ms: float, **labels: str) -> None:
+        """Record one latency observation."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = LatencyHistogram()
+            histogram.observe(value_ms)
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        """All series with count, sum, max and p50/p95/p99."""
+        with self._lock:
+            return {
+                name: [{"labels": dict(key), **h.snapshot()} for key, h in series.items()]
+                for name, series in self._histograms.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    @staticmethod
+    def _labels(key: LabelSet, extra: Optional[tuple[str, str]] = None) -> str:
+        pairs = list(key) + ([extra] if extra else [])
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs) + "}"
+
+    def render_prometheus(self) -> str:
+        """Render every histogram in Prometheus text exposition format (0.0.4)."""
+        lines: list[str] = []
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# HELP {name} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, h in series.items():
+                    cumulative = 0
+                    for bound, bucket_count in zip(h.buckets, h.counts):
+                        cumulative += bucket_count
+                        lines.append(f"{name}_bucket{self._labels(key, ('le', f'{bound:g}'))} {cumulative}")
+                    lines.append(f"{name}_bucket{self._labels(key, ('le', '+Inf'))} {h.count}")
+                    lines.append(f"{name}_sum{self._labels(key)} {h.sum:.3f}")
+                    lines.append(f"{name}_count{self._labels(key)} {h.count}")
+
+                quantile_name = f"{name}_quantile"
+                lines.append(f"# HELP {quantile_name} Estimated p50/p95/p99 of {name}")
+                lines.append(f"# TYPE {quantile_name} gauge")
+                for key, h in series.items():
+                    for q in QUANTILES:
+                        lines.append(
+                            f"{quantile_name}{self._labels(key, ('quantile', f'{q:g}'))} {h.quantile(q):.3f}"
+                        )
+        return "\n".join(lines) + "\n"
+
+
+_metrics = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _metrics
+
+
+# ============================================================
+# Span tracing
+# ============================================================
+
+@dataclass
+class Span:
+    """One timed stage of a trace."""
+    name: str
+    start_offset_ms: float
+    duration_ms: float = 0.0
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Trace:
+    """A task's path through the engine."""
+    trace_id: str
+    name: str
+    started_at: float
+    duration_ms: float = 0.0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    spans: list[Span] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "spans": [
+                {
+                    "name": s.name,
+                    "start_offset_ms": round(s.start_offset_ms, 3),
+                    "duration_ms": round(s.duration_ms, 3),
+                    "attributes": s.attributes,
+                }
+                for s in self.spans
+            ],
+        }
+
+
+class Tracer:
+    """
+    Optional span tracing. Stage latencies always feed the
+    `cle_task_stage_ms` histogram; full traces are only kept when enabled.
+
+    Usage:
+        tracer = get_tracer()
+        with tracer.trace("task", task_id=7):
+            with tracer.span("route"):
+                ...
+            with tracer.span("execute", agent="kbuildd"):
+                ...
+        tracer.recent()  # → [{"trace_id": ..., "spans": [...]}]
+    """
+
+    def __init__(self, enabled: bool = False, capacity: int = 200):
+        self.enabled = enabled
+        self._finished: deque[Trace] = deque(maxlen=capacity)
+        self._current: ContextVar[Optional[tuple[Trace, float]]] = ContextVar("cle_trace", default=None)
+
+    @contextmanager
+    def trace(self, name: str, **attributes: Any) -> Iterator[Optional[Trace]]:
+        """Open a trace for the duration of the block (no-op when disabled)."""
+        if not self.enabled:
+            yield None
+            return
+        trace = Trace(trace_id=uuid.uuid4().hex[:16], name=name, started_at=time.time(), attributes=attributes)
+        start = time.perf_counter()
+        token = self._current.set((trace, start))
+        try:
+            yield trace
+        finally:
+            self._current.reset(token)
+            trace.duration_ms = (time.perf_counter() - start) * 1000
+            self._finished.append(trace)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[None]:
+        """Time a stage; record it on the active trace if there is one."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = (time.perf_counter() - start) * 1000
+            _metrics.observe("cle_task_stage_ms", duration, stage=name)
+            current = self._current.get()
+            if current is not None:
+                trace, trace_start = current
+                trace.spans.append(Span(
+                    name=name,
+                    start_offset_ms=(start - trace_start) * 1000,
+                    duration_ms=duration,
+                    attributes=attributes,
+                ))
+
+    def recent(self, limit: int = 50) -> list[dict[str, Any]]:
+        """Most recent finished traces, newest first."""
+        return [t.to_dict() for t in list(self._finished)[::-1][:limit]]
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer."""
+    return _tracer
@@ -0,0 +1,43 @@
+"""
+Unit tests for the capacity-bounded attractor store.
+"""
+
+import numpy as np
+
+from cle.agents.neural.attractors import AttractorMemory, AttractorRecord
+
+
+def _record(memory: AttractorMemory, uses: int = 0, energy: float = -1.0) -> AttractorRecord:
+    vector = np.random.default_rng(memory._next_id).standard_normal(8).astype(np.float32)
+    return AttractorRecord(
+        attractor_id=memory.next_id(),
+        team_names=["kbuildd"],
+        solution_vector=vector,
+        activation_pattern=vector,
+        energy=energy,
+        team_weights=np.zeros(8, dtype=np.float32),
+        hebbian_weight=0.1,
+        uses=uses,
+    )
+
+
+class TestEviction:
+    def test_new_record_is_never_the_victim(self):
+        memory = AttractorMemory(dim=8, capacity=2)
+        used = _record(memory, uses=3)
+        stale = _record(memory, uses=1)
+        memory.add(used)
+        memory.add(stale)
+
+        incoming = _record(memory)
+        victim = memory.add(incoming)
+
+        assert victim is stale
+        assert {r.attractor_id for r in memory} == {used.attractor_id, incoming.attractor_id}
+        assert memory.evictions == 1
+
+    def test_no_eviction_below_capacity(self):
+        memory = AttractorMemory(dim=8, capacity=2)
+        assert memory.add(_record(memory, uses=5)) is None
+        assert memory.add(_record(memory)) is None
+        assert len(memory) == 2
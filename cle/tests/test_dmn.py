@@ -0,0 +1,77 @@
+"""
+Unit tests for the Default Mode Network's resource sampler and
+cross-session pattern consolidation.
+"""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from cle.agents.neural.dmn import DefaultModeNetwork, ResourceSampler
+from cle.memory.types import Memory, MemoryType
+
+
+def _sampler_threads() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == "dmn-resource-sampler"]
+
+
+class TestResourceSampler:
+    def test_restart_leaves_one_thread(self):
+        sampler = ResourceSampler(interval=30.0, cpu_window=0.0)
+        sampler.start()
+        first = sampler._thread
+        sampler.stop()
+        sampler.start()
+
+        first.join(timeout=2.0)
+        try:
+            assert not first.is_alive()
+            assert sampler.running
+            assert _sampler_threads() == [sampler._thread]
+        finally:
+            sampler.stop()
+
+
+class FlakyMemory:
+    """In-memory stand-in for MemoryService whose pattern stores can be made to fail."""
+
+    def __init__(self, episodes: list[Memory]):
+        self.episodes = episodes
+        self.patterns: list[Memory] = []
+        self.failing = False
+
+    async def iter_query(self, query):
+        for memory in sorted(self.episodes, key=lambda m: m.created_at):
+            if query.created_after is None or memory.created_at > query.created_after:
+                yield memory
+
+    async def store(self, memory: Memory) -> str:
+        if self.failing:
+            raise asyncio.CancelledError()  # preempted mid-store
+        self.patterns.append(memory)
+        return memory.id
+
+
+class TestPatternConsolidation:
+    def test_preempted_store_is_retried_next_cycle(self):
+        start = datetime(2026, 1, 1)
+        memory = FlakyMemory([
+            Memory(id=f"e{i}", content="", memory_type=MemoryType.EPISODIC, source="kbuildd",
+                   tags=["deploy"], created_at=start + timedelta(seconds=i))
+            for i in range(3)
+        ])
+        dmn = DefaultModeNetwork(memory)
+
+        memory.failing = True
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(dmn._consolidation_phase())
+        assert dmn.get_status()["patterns_pending"] == 1
+
+        memory.failing = False
+        asyncio.run(dmn._consolidation_phase())
+
+        assert [p.metadata["problem_categories"] for p in memory.patterns] == [["deploy"]]
+        assert "freq=3" in memory.patterns[0].content
+        assert dmn.get_status()["patterns_pending"] == 0
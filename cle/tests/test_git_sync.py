@@ -0,0 +1,102 @@
+"""
+Unit tests for GitCommitScheduler against a local bare repository.
+
+The bare repo stands in for the GitHub remote: commits and pushes are real
+git operations, only the network is missing.
+"""
+
+import asyncio
+import shutil
+import subprocess
+
+import pytest
+
+from cle.memory.backends.git_sync import GitCommitScheduler
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+AUTHOR = ("CLE Test", "cle-test@example.com")
+
+
+def _git(cwd, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def repos(tmp_path):
+    """(working repo, bare remote) with the remote registered as origin."""
+    remote = tmp_path / "remote.git"
+    work = tmp_path / "work"
+    work.mkdir()
+    _git(tmp_path, "init", "-q", "--bare", str(remote))
+    _git(work, "init", "-q", "-b", "main")
+    _git(work, "remote", "add", "origin", str(remote))
+    (work / "memories").mkdir()
+    return work, remote
+
+
+def _write(work, name: str, text: str = "memory") -> str:
+    (work / "memories" / name).write_text(text, encoding="utf-8")
+    return f"memories/{name}"
+
+
+class TestGitCommitScheduler:
+    def test_batches_pending_changes_into_one_pushed_commit(self, repos):
+        work, remote = repos
+        scheduler = GitCommitScheduler(work, pathspec="memories", window_seconds=3600, author=AUTHOR)
+
+        async def run():
+            await scheduler.start()
+            scheduler.mark(*(_write(work, f"m{i}.md") for i in range(5)))
+            committed = await scheduler.flush()
+            await scheduler.close()
+            return committed
+
+        assert asyncio.run(run()) is True
+        assert _git(work, "rev-list", "--count", "HEAD") == "1"
+        assert _git(work, "show", "--name-only", "--format=", "HEAD").splitlines() == [
+            f"memories/m{i}.md" for i in range(5)
+        ]
+        assert _git(remote, "rev-parse", "main") == _git(work, "rev-parse", "HEAD")
+        assert scheduler.get_stats()["commits"] == 1
+        assert scheduler.get_stats()["pushes"] >= 1
+
+    def test_close_flushes_pending_changes(self, repos):
+        work, remote = repos
+        scheduler = GitCommitScheduler(work, pathspec="memories", window_seconds=3600, author=AUTHOR)
+
+        async def run():
+            await scheduler.start()
+            scheduler.mark(_write(work, "first.md"))
+            await scheduler.flush()
+            scheduler.mark(_write(work, "second.md"), _write(work, "third.md"))
+            assert scheduler.pending == 2
+            await scheduler.close()
+
+        asyncio.run(run())
+        assert scheduler.pending == 0
+        assert _git(work, "rev-list", "--count", "HEAD") == "2"
+        assert _git(remote, "rev-parse", "main") == _git(work, "rev-parse", "HEAD")
+        assert _git(remote, "ls-tree", "--name-only", "main", "memories/").splitlines() == [
+            "memories/first.md", "memories/second.md", "memories/third.md",
+        ]
+
+    def test_max_pending_commits_before_the_window(self, repos):
+        work, _ = repos
+        scheduler = GitCommitScheduler(
+            work, pathspec="memories", window_seconds=3600, max_pending=3, remote=None, author=AUTHOR,
+        )
+
+        async def run():
+            await scheduler.start()
+            scheduler.mark(*(_write(work, f"m{i}.md") for i in range(3)))
+            for _ in range(100):
+                if scheduler.get_stats()["commits"]:
+                    break
+                await asyncio.sleep(0.05)
+            commits = scheduler.get_stats()["commits"]
+            await scheduler.close()
+            return commits
+
+        assert asyncio.run(run()) == 1
+        assert _git(work, "rev-list", "--count", "HEAD") == "1"
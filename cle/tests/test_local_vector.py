@@ -0,0 +1,87 @@
+"""
+Unit tests for the local vector backend's embedding paths.
+
+Text queries go through the configured embedder; callers that store their
+own model vectors query with MemoryQuery.embedding from the same model.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from cle.memory.backends.local_vector import LocalVectorBackend
+from cle.memory.types import Memory, MemoryQuery
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestHashingRecall:
+    def test_word_match_outranks_bucket_collisions(self, tmp_path):
+        rng = random.Random(1)
+        words = [f"w{i}" for i in range(20000)]
+        notes = [" ".join(rng.sample(words, rng.randint(2, 8))) for _ in range(1000)]
+        real = "the zoo keeps two giraffes near the north gate and feeds them acacia leaves every morning"
+
+        async def scenario():
+            backend = LocalVectorBackend(tmp_path)
+            await backend.initialize()
+            await backend.store_many(
+                [Memory(id="real", content=real)]
+                + [Memory(id=f"n{i}", content=note) for i, note in enumerate(notes)]
+            )
+            result = await backend.query(MemoryQuery(text="giraffes", limit=1))
+            await backend.close()
+            return [m.id for m in result.memories]
+
+        assert run(scenario()) == ["real"]
+
+
+class TestStoreMany:
+    def test_one_id_per_input_and_last_version_wins(self, tmp_path):
+        async def scenario():
+            backend = LocalVectorBackend(tmp_path, dim=4)
+            await backend.initialize()
+            ids = await backend.store_many([
+                Memory(id="x", content="first", embedding=[1.0, 0.0, 0.0, 0.0]),
+                Memory(id="y", content="other", embedding=[0.0, 0.0, 1.0, 0.0]),
+                Memory(id="x", content="second", embedding=[0.0, 1.0, 0.0, 0.0]),
+                Memory(id="z", content="third", embedding=[0.0, 0.0, 0.0, 1.0]),
+            ])
+            stored = await backend.get("x")
+            hit = await backend.query(MemoryQuery(text="", embedding=[0.0, 1.0, 0.0, 0.0], limit=1))
+            count = await backend.count()
+            await backend.close()
+            return ids, stored.content, [m.id for m in hit.memories], count
+
+        assert run(scenario()) == (["x", "y", "x", "z"], "second", ["x"], 3)
+
+
+class TestSuppliedEmbeddings:
+    def test_query_embedding_searches_supplied_vectors(self, tmp_path):
+        async def scenario():
+            backend = LocalVectorBackend(tmp_path, dim=4)
+            await backend.initialize()
+            await backend.store_many([
+                Memory(id="x", content="alpha", embedding=[1.0, 0.0, 0.0, 0.0]),
+                Memory(id="y", content="beta", embedding=[0.0, 1.0, 0.0, 0.0]),
+            ])
+            result = await backend.query(MemoryQuery(text="alpha", embedding=[0.0, 0.9, 0.1, 0.0], limit=1))
+            await backend.close()
+            return [m.id for m in result.memories]
+
+        assert run(scenario()) == ["y"]
+
+    def test_query_embedding_dim_mismatch_raises(self, tmp_path):
+        async def scenario():
+            backend = LocalVectorBackend(tmp_path, dim=4)
+            await backend.initialize()
+            try:
+                await backend.query(MemoryQuery(text="alpha", embedding=[1.0, 0.0]))
+            finally:
+                await backend.close()
+
+        with pytest.raises(ValueError):
+            run(scenario())
@@ -0,0 +1,59 @@
+"""
+Unit tests for behaviour both memory backends must agree on.
+
+MemoryService passes the primary backend's total_found through as the fused
+total, so the number has to mean the same thing whichever backend is primary.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from cle.memory.backends.git_backend import GitBackend
+from cle.memory.backends.local_vector import LocalVectorBackend
+from cle.memory.types import Memory, MemoryQuery, MemoryType
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture(params=[GitBackend, LocalVectorBackend], ids=["git", "local_vector"])
+def backend(request, tmp_path):
+    backend = request.param(str(tmp_path))
+    start = datetime(2026, 1, 1)
+    memories = [
+        Memory(
+            id=f"m{i}",
+            content=f"deploy note {i}" if i % 2 else f"design note {i}",
+            memory_type=MemoryType.EPISODIC if i < 6 else MemoryType.SEMANTIC,
+            tags=["deploy"] if i % 2 else ["design"],
+            created_at=start + timedelta(seconds=i),
+        )
+        for i in range(10)
+    ]
+
+    async def setup():
+        await backend.initialize()
+        await backend.store_many(memories)
+
+    run(setup())
+    yield backend
+    run(backend.close())
+
+
+class TestTotalFound:
+    def test_wildcard_total_counts_every_page(self, backend):
+        result = run(backend.query(MemoryQuery(text="*", limit=3)))
+        assert len(result.memories) == 3
+        assert result.total_found == 10
+
+    def test_wildcard_total_honours_created_after(self, backend):
+        query = MemoryQuery(text="*", created_after=datetime(2026, 1, 1, 0, 0, 6), limit=2)
+        assert run(backend.query(query)).total_found == 3
+
+    def test_type_filtered_total_is_exact_or_unknown(self, backend):
+        result = run(backend.query(MemoryQuery(text="*", memory_type=MemoryType.EPISODIC, limit=2)))
+        assert len(result.memories) == 2
+        assert result.total_found in (6, None)
@@ -0,0 +1,123 @@
+"""
+Unit tests for MemoryService caching and consolidation.
+
+A backend with slow writes lets reads run while a write is in flight; what
+those reads cache must not outlive the write. Consolidation runs against the
+same dict-backed backend, which can be told to reject writes.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+
+from cle.memory.service import MemoryBackendInterface, MemoryService
+from cle.memory.types import Memory, MemoryBackend, MemoryQuery, MemoryResult, MemoryType
+
+
+class SlowWriteBackend(MemoryBackendInterface):
+    """Dict-backed backend whose writes take write_delay seconds to land."""
+
+    def __init__(self, write_delay: float = 0.05):
+        self.write_delay = write_delay
+        self.memories: dict[str, Memory] = {}
+        self.failing: set[str] = set()  # IDs whose writes are rejected
+
+    async def store(self, memory: Memory) -> str:
+        await asyncio.sleep(self.write_delay)
+        if memory.id in self.failing:
+            raise ConnectionError("backend unavailable")
+        self.memories[memory.id] = memory.model_copy()
+        return memory.id
+
+    async def query(self, query: MemoryQuery) -> MemoryResult:
+        memories = sorted(self.memories.values(), key=lambda m: (m.created_at, m.id))
+        memories = [
+            m.model_copy() for m in memories
+            if (query.memory_type is None or m.memory_type == query.memory_type)
+            and m.importance >= query.min_importance
+            and (query.created_after is None or m.created_at > query.created_after)
+        ][:query.limit]
+        return MemoryResult(memories=memories, query=query.text, total_found=len(memories))
+
+    async def get(self, memory_id: str) -> Optional[Memory]:
+        memory = self.memories.get(memory_id)
+        return memory.model_copy() if memory else None
+
+    async def delete(self, memory_id: str) -> bool:
+        await asyncio.sleep(self.write_delay)
+        return self.memories.pop(memory_id, None) is not None
+
+    async def count(self) -> int:
+        return len(self.memories)
+
+    @property
+    def backend_type(self) -> MemoryBackend:
+        return MemoryBackend.VECTOR
+
+
+def _service() -> tuple[MemoryService, SlowWriteBackend]:
+    backend = SlowWriteBackend()
+    service = MemoryService()
+    service.register_backend(backend, primary=True)
+    return service, backend
+
+
+class TestCacheInvalidation:
+    def test_get_during_store_does_not_cache_old_value(self):
+        service, _ = _service()
+
+        async def run():
+            await service.store(Memory(id="m1", content="v1"))
+            write = asyncio.create_task(service.store(Memory(id="m1", content="v2")))
+            await asyncio.sleep(0.01)
+            assert (await service.get("m1")).content == "v1"  # write still in flight
+            await write
+            return await service.get("m1")
+
+        assert asyncio.run(run()).content == "v2"
+
+    def test_query_during_delete_does_not_cache_deleted_memory(self):
+        service, _ = _service()
+        query = MemoryQuery(text="*")
+
+        async def run():
+            await service.store(Memory(id="m1", content="v1"))
+            delete = asyncio.create_task(service.delete("m1"))
+            await asyncio.sleep(0.01)
+            await service.get("m1")
+            await service.query(query)
+            await delete
+            return await service.get("m1"), await service.query(query)
+
+        memory, result = asyncio.run(run())
+        assert memory is None
+        assert result.memories == []
+
+
+class TestConsolidation:
+    def test_late_arrival_from_retry_queue_is_consolidated(self):
+        service, backend = _service()
+        backend.write_delay = 0
+        start = datetime(2026, 1, 1)
+
+        def episode(memory_id: str, minutes: int) -> Memory:
+            return Memory(
+                id=memory_id, content=memory_id, memory_type=MemoryType.EPISODIC,
+                importance=0.9, created_at=start + timedelta(minutes=minutes),
+            )
+
+        async def run():
+            backend.failing = {"late"}
+            await service.store(episode("early", 0))
+            await service.store(episode("late", 1))  # rejected, queued for retry
+            await service.store(episode("newer", 2))
+            first = await service.consolidate()  # the mark passes "late"
+            backend.failing = set()
+            await service.retry_failed()
+            second = await service.consolidate()
+            third = await service.consolidate()
+            return first, second, third
+
+        assert asyncio.run(run()) == (2, 1, 0)
+        assert service.consolidated_id("late") in backend.memories
+        assert service.get_status()["consolidation"]["late_pending"] == 0
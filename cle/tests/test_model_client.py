@@ -0,0 +1,77 @@
+"""
+Unit tests for the model client's offline stub.
+
+The stub is opt-in: without it a missing provider is an error, and an agent
+reports failure instead of a canned reply.
+"""
+
+import asyncio
+
+import pytest
+
+from cle.agents.base import CLEAgent
+from cle.agents.model_client import ModelClient, ModelClientError, set_model_client
+
+MODEL = "gemini-2.5-flash"
+
+
+@pytest.fixture
+def client_slot():
+    """Install a client for the test; restore the default afterwards."""
+    def install(client: ModelClient) -> ModelClient:
+        set_model_client(client)
+        return client
+    yield install
+    set_model_client(None)
+
+
+def _agent() -> CLEAgent:
+    agent = CLEAgent(name="kbuildd", model=MODEL, instruction="You are kbuildd.")
+    agent.activate()
+    return agent
+
+
+class TestOfflineStub:
+    def test_complete_is_deterministic_and_free(self):
+        client = ModelClient(offline_fallback=True)
+
+        async def run():
+            return await client.complete(MODEL, "Summarize the repo"), await client.complete(MODEL, "Summarize the repo")
+
+        first, second = asyncio.run(run())
+        assert first.text == second.text == f"[{MODEL} offline] Summarize the repo"
+        assert first.provider == "stub"
+        assert first.usage.total_tokens > 0
+        assert first.usage.cost_usd == 0.0
+        assert client.get_stats()["calls"] == 2
+
+    def test_stream_yields_the_same_reply(self):
+        client = ModelClient(offline_fallback=True)
+
+        async def run():
+            return "".join([delta async for delta in client.stream(MODEL, "Write a haiku")])
+
+        assert asyncio.run(run()) == f"[{MODEL} offline] Write a haiku"
+
+    def test_agent_runs_on_the_stub_when_opted_in(self, client_slot):
+        client_slot(ModelClient(offline_fallback=True))
+
+        result = asyncio.run(_agent().execute({"task": "Build a button", "mode": "ship"}))
+
+        assert result.success
+        assert result.output["response"] == f"[{MODEL} offline] Build a button"
+        assert result.tokens_used > 0
+
+
+class TestNoProvider:
+    def test_complete_raises_without_opt_in(self):
+        with pytest.raises(ModelClientError, match="No provider configured"):
+            asyncio.run(ModelClient().complete(MODEL, "hello"))
+
+    def test_agent_reports_failure_without_opt_in(self, client_slot):
+        client_slot(ModelClient())
+
+        result = asyncio.run(_agent().execute({"task": "Build a button", "mode": "ship"}))
+
+        assert not result.success
+        assert "No provider configured" in result.errors[0]
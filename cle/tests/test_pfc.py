@@ -0,0 +1,158 @@
+"""
+Unit tests for the Prefrontal CORE planner.
+
+Plans run against registry agents declared with the same modes as the
+engine manifest, so a step scheduled in a mode its agent rejects fails here
+the way it would in production.
+"""
+
+import asyncio
+
+from cle.agents.base import CLEAgent
+from cle.agents.manifest import AGENT_MANIFEST
+from cle.agents.neural.pfc import PlanningContext, PrefrontalCortex, goal_signature
+from cle.agents.registry import AgentRegistry
+
+
+class RecordingAgent(CLEAgent):
+    """Manifest-shaped agent that records the mode of every call instead of calling a model."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.modes: list[str] = []
+
+    async def _execute_impl(self, context):
+        self.modes.append(context["mode"])
+        return {"task": context["task"]}
+
+
+def _registry() -> AgentRegistry:
+    registry = AgentRegistry()
+    for entry in AGENT_MANIFEST:
+        registry.register(RecordingAgent(
+            name=entry.name, hive=entry.hive, role=entry.role, active_modes=list(entry.active_modes),
+        ))
+    return registry
+
+
+class TestPlanExecution:
+    def test_default_build_plan_completes(self):
+        registry = _registry()
+        pfc = PrefrontalCortex(agent_registry=registry)
+
+        async def run():
+            plan = await pfc.create_plan("Build a React dashboard")
+            return await pfc.execute_plan(plan)
+
+        plan = asyncio.run(run())
+
+        assert plan.status == "completed", [(s.step_type, s.agent_name, s.error) for s in plan.steps]
+        assert {s.step_type for s in plan.steps} >= {"analyze", "implement", "review", "compliance"}
+        for step in plan.steps:
+            agent = registry.get(step.agent_name)
+            assert all(agent.can_execute_in_mode(mode) for mode in agent.modes)
+
+    def test_analysis_and_review_run_outside_ship_mode(self):
+        registry = _registry()
+        pfc = PrefrontalCortex(agent_registry=registry)
+
+        async def run():
+            return await pfc.execute_plan(await pfc.create_plan("Build a React dashboard"))
+
+        asyncio.run(run())
+
+        assert "ship" not in registry.get("ARCH").modes
+        assert registry.get("COMPASS").modes == ["validate"]
+        assert registry.get("kbuildd").modes and set(registry.get("kbuildd").modes) == {"ship"}
+
+    def test_step_fails_when_agent_rejects_its_mode(self):
+        registry = _registry()
+        pfc = PrefrontalCortex(agent_registry=registry)
+
+        async def run():
+            plan = await pfc.create_plan("Build a React dashboard")
+            for step in plan.steps:
+                if step.step_type == "implement":
+                    step.agent_name = "COMPASS"  # no ship mode
+            return await pfc.execute_plan(plan)
+
+        plan = asyncio.run(run())
+
+        implement = next(s for s in plan.steps if s.step_type == "implement")
+        assert implement.status == "failed"
+        assert "cannot run implement step in ship mode" in implement.error
+        assert "ship" not in registry.get("COMPASS").modes
+
+
+class ActivityCounter:
+    """Stands in for the DMN; counts foreground activity notifications."""
+
+    def __init__(self):
+        self.marks = 0
+
+    def mark_activity(self):
+        self.marks += 1
+
+    def get_insights(self, min_relevance=0.0, top_k=5):
+        return []
+
+
+class TestForegroundActivity:
+    def test_planning_and_steps_mark_dmn_activity(self):
+        dmn = ActivityCounter()
+        pfc = PrefrontalCortex(dmn=dmn, agent_registry=_registry())
+
+        async def run():
+            plan = await pfc.create_plan("Build a React dashboard")
+            planned = dmn.marks
+            await pfc.execute_plan(plan)
+            return plan, planned
+
+        plan, planned = asyncio.run(run())
+
+        assert planned == 1
+        assert dmn.marks == planned + 1 + len(plan.steps)
+
+
+class TestPlanCache:
+    def test_signature_keeps_word_order_and_mode(self):
+        assert goal_signature("Migrate Postgres to MySQL", "ship") != goal_signature("Migrate MySQL to Postgres", "ship")
+        assert goal_signature("deploy the app", "ship") != goal_signature("don't deploy the app", "ship")
+        assert goal_signature("Build a dashboard", "ship") != goal_signature("Build a dashboard", "plan")
+        assert goal_signature("Build a  dashboard!", "ship") == goal_signature("build a dashboard", "ship")
+
+    def test_reuse_is_per_mode(self):
+        pfc = PrefrontalCortex(agent_registry=_registry())
+
+        def context(mode: str) -> PlanningContext:
+            return PlanningContext(task_description="", available_agents=[], current_mode=mode, active_tier="studio")
+
+        async def run():
+            first = await pfc.create_plan("Build a React dashboard", context("ship"))
+            other_mode = await pfc.create_plan("Build a React dashboard", context("plan"))
+            repeat = await pfc.create_plan("build a react dashboard", context("ship"))
+            return first, other_mode, repeat
+
+        first, other_mode, repeat = asyncio.run(run())
+
+        assert not first.from_cache
+        assert not other_mode.from_cache
+        assert repeat.from_cache and repeat.signature == first.signature
+
+    def test_cached_wording_survives_goal_inside_it(self):
+        pfc = PrefrontalCortex(agent_registry=_registry())
+
+        async def run():
+            first = await pfc.create_plan("a")
+            repeat = await pfc.create_plan("A!")
+            return first, repeat
+
+        first, repeat = asyncio.run(run())
+
+        assert repeat.from_cache
+        assert [s.description for s in first.steps] == [
+            "Review and validate: a", "Constitutional compliance check for: a",
+        ]
+        assert [s.description for s in repeat.steps] == [
+            "Review and validate: A!", "Constitutional compliance check for: A!",
+        ]